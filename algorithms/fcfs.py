@@ -1,36 +1,29 @@
-from typing import List, Dict
+from typing import Iterator, List, Dict
 from utils.docker_executor import run_tasks_parallel
-
-VM_MIPS = {
-    "vm1": 5000,
-    "vm2": 6000,
-    "vm3": 7000,
-    "vm4": 8000,
-    "vm5": 10000,
-}
-
-def run_fcfs(tasks: List[Dict], vm_names: List[str], logger=None) -> List[Dict]:
-    tasks_sorted = tasks  # FCFS doesn't require sorting, so just use the tasks as is
-    
-    vm_load = {vm: 0.0 for vm in vm_names}  # estimated time per VM
-
-    assignments = []
-
-    # Iterate over the tasks with the index and the task
-    for i, task in enumerate(tasks_sorted):
-        task_mi = task["mi"]
+from utils.logger import DEBUG
+from utils.task_source import iter_task_tuples
+from utils.vm_capacity import get_vm_mips
+from algorithms.vm_selector import LeastLoadedSelector
+
+def schedule_fcfs(tasks, vm_names: List[str], logger=None, vm_mips: Dict[str, float] = None) -> Iterator[tuple]:
+    """Yield (task_id, vm, mi) assignments one task at a time (tasks: list, TaskSource or any iterable)."""
+    vm_mips = get_vm_mips(vm_names, vm_mips)
+    selector = LeastLoadedSelector(vm_names, vm_mips)  # estimated time per VM, kept in a heap
+
+    # FCFS doesn't require sorting, so just use the tasks as they come
+    for i, task_mi, _ in iter_task_tuples(tasks):
         # Find the VM with the least load
-        best_vm = min(vm_names, key=lambda vm: vm_load[vm])
-        exec_time = task_mi / VM_MIPS[best_vm]
-        vm_load[best_vm] += exec_time
+        best_vm, load = selector.assign(task_mi)
 
-        msg = f"[FCFS] Task {i} ({task_mi} MI) → {best_vm} | load: {vm_load[best_vm]:.3f}s"
+        msg = f"[FCFS] Task {i} ({task_mi} MI) → {best_vm} | load: {load:.3f}s"
         if logger:
-            logger.log(msg)
+            logger.log(msg, level=DEBUG)
         else:
             print(msg)
 
-        assignments.append((i, best_vm, task_mi))
+        yield (i, best_vm, task_mi)
 
-    return run_tasks_parallel(assignments, logger)
+def run_fcfs(tasks: List[Dict], vm_names: List[str], logger=None, vm_mips: Dict[str, float] = None) -> List[Dict]:
+    # Execution starts while later tasks are still being scheduled
+    return run_tasks_parallel(schedule_fcfs(tasks, vm_names, logger, vm_mips), logger)
 
@@ -0,0 +1,209 @@
+# algorithms/g_pso.py
+from typing import List, Dict
+
+import numpy as np
+
+from utils.docker_executor import run_tasks_parallel
+from utils.logger import DEBUG
+from utils.vm_capacity import get_vm_mips
+
+# ----------------------------
+# Vectorized G&PSO (Zhong et al., 2016)
+# Same update rules as algorithms/old/g_pso.py, but the swarm lives in
+# (particles, tasks) arrays and every particle is scored in one batched pass.
+#
+# gbest updates: the old loop refreshed gbest after EACH particle, so later
+# particles of an iteration already chase an earlier one's find
+# (asynchronous PSO). The default update="async" keeps that per-particle
+# rule (rows are still vectorized over tasks), so a seed gives the same
+# search as before. update="sync" moves the whole swarm towards the gbest
+# of the previous iteration and refreshes it once per iteration: a
+# different search trajectory for the same seed, in exchange for one
+# batched pass.
+# ----------------------------
+
+PSO_UPDATES = ("async", "sync")
+
+def compute_makespans(positions: np.ndarray, tasks_mi: np.ndarray, vm_mips: np.ndarray) -> np.ndarray:
+    """
+    Makespan of every particle at once.
+    positions: (particles, tasks) VM indices → returns (particles,) makespans.
+    Per-VM loads come from one bincount over the flattened (particle, vm) index.
+    """
+    num_particles = positions.shape[0]
+    num_vms = vm_mips.shape[0]
+    exec_times = tasks_mi[None, :] / vm_mips[positions]
+    flat_idx = positions + (np.arange(num_particles) * num_vms)[:, None]
+    loads = np.bincount(flat_idx.ravel(), weights=exec_times.ravel(), minlength=num_particles * num_vms)
+    return loads.reshape(num_particles, num_vms).max(axis=1)
+
+def greedy_initialization(tasks_mi: np.ndarray, vm_mips: np.ndarray) -> np.ndarray:
+    """
+    Greedy procedure (from paper Section 3.6):
+    - For each task, assign to VM that gives minimal current makespan.
+    - Tie-break: assign to VM with fewer tasks.
+    """
+    num_vms = vm_mips.shape[0]
+    schedule = np.empty(tasks_mi.shape[0], dtype=np.int64)
+    vm_load = np.zeros(num_vms)
+    vm_task_count = np.zeros(num_vms, dtype=np.int64)
+    current_makespan = 0.0
+
+    for task_id, mi in enumerate(tasks_mi):
+        new_load = vm_load + mi / vm_mips
+        # Raising one VM's load: makespan = max(current makespan, that VM's new load)
+        temp_makespan = np.maximum(current_makespan, new_load)
+        ties = np.isclose(temp_makespan, temp_makespan.min())
+        best_vm = int(np.argmin(np.where(ties, vm_task_count, np.iinfo(np.int64).max)))
+
+        schedule[task_id] = best_vm
+        vm_load[best_vm] = new_load[best_vm]
+        vm_task_count[best_vm] += 1
+        current_makespan = max(current_makespan, vm_load[best_vm])
+    return schedule
+
+class Swarm:
+    """Positions, velocities and personal bests of one particle swarm."""
+
+    def __init__(self, num_particles: int, tasks_mi: np.ndarray, vm_mips: np.ndarray, rng: np.random.Generator):
+        num_vms = vm_mips.shape[0]
+        num_tasks = tasks_mi.shape[0]
+        self.tasks_mi = tasks_mi
+        self.vm_mips = vm_mips
+        self.vmax = num_vms - 1
+        # Random initial schedule: each task assigned to random VM (0 to num_vms-1)
+        self.positions = rng.integers(0, num_vms, size=(num_particles, num_tasks))
+        self.velocities = rng.uniform(-self.vmax, self.vmax, size=(num_particles, num_tasks))
+        self.pbest = self.positions.copy()
+        self.pbest_makespan = compute_makespans(self.positions, tasks_mi, vm_mips)
+
+    def _move(self, rows: slice, gbest: np.ndarray, rng: np.random.Generator,
+              inertia_weight: float, c1: float, c2: float) -> np.ndarray:
+        """Move the particles in `rows` towards their pbest and `gbest`; returns their new makespans."""
+        positions = self.positions[rows]
+        velocities = self.velocities[rows]  # views: updated in place
+        r1 = rng.random(positions.shape)
+        r2 = rng.random(positions.shape)
+        velocities *= inertia_weight
+        velocities += c1 * r1 * (self.pbest[rows] - positions)
+        velocities += c2 * r2 * (gbest[None, :] - positions)
+        np.clip(velocities, -self.vmax, self.vmax, out=velocities)
+
+        # Round and clamp to valid VM index
+        new_pos = np.rint(positions + velocities)
+        np.clip(new_pos, 0, self.vmax, out=new_pos)
+        positions[:] = new_pos
+
+        makespans = compute_makespans(positions, self.tasks_mi, self.vm_mips)
+        improved = makespans < self.pbest_makespan[rows]
+        self.pbest[rows][improved] = positions[improved]
+        self.pbest_makespan[rows][improved] = makespans[improved]
+        return makespans
+
+    def step(self, gbest: np.ndarray, rng: np.random.Generator,
+             inertia_weight: float = 0.9, c1: float = 2.0, c2: float = 2.0) -> np.ndarray:
+        """
+        One synchronous PSO iteration: every particle moves towards the same
+        `gbest`. Returns the new makespan of every particle.
+        """
+        return self._move(slice(None), gbest, rng, inertia_weight, c1, c2)
+
+    def step_async(self, gbest: np.ndarray, gbest_makespan: float, rng: np.random.Generator,
+                   inertia_weight: float = 0.9, c1: float = 2.0, c2: float = 2.0):
+        """
+        One asynchronous PSO iteration, as in algorithms/old/g_pso.py: particles
+        move one after another and gbest is refreshed after each of them.
+        Returns (makespan of every particle, gbest, gbest makespan).
+        """
+        makespans = np.empty(self.positions.shape[0])
+        for i in range(self.positions.shape[0]):
+            makespans[i] = self._move(slice(i, i + 1), gbest, rng, inertia_weight, c1, c2)[0]
+            if makespans[i] < gbest_makespan:
+                gbest = self.positions[i].copy()
+                gbest_makespan = float(makespans[i])
+        return makespans, gbest, gbest_makespan
+
+    def best(self):
+        """(position, makespan) of the best personal best in the swarm."""
+        idx = int(np.argmin(self.pbest_makespan))
+        return self.pbest[idx], float(self.pbest_makespan[idx])
+
+def optimize_g_pso(tasks_mi: List[float], vm_mips: List[float], num_particles: int = 100, max_iter: int = 200,
+                   inertia_weight: float = 0.9, c1: float = 2.0, c2: float = 2.0,
+                   seed: int = None, logger=None, update: str = "async"):
+    """
+    Search a schedule with G&PSO (PSO parameters from paper Table 1).
+    update: "async" (gbest refreshed after every particle, like algorithms/old/g_pso.py)
+    or "sync" (refreshed once per iteration, one batched pass; faster).
+    Returns (schedule as VM indices, predicted makespan).
+    """
+    if update not in PSO_UPDATES:
+        raise ValueError(f"Unknown update '{update}' (expected one of {PSO_UPDATES})")
+    rng = np.random.default_rng(seed)
+    tasks_mi = np.asarray(tasks_mi, dtype=np.float64)
+    vm_mips = np.asarray(vm_mips, dtype=np.float64)
+
+    swarm = Swarm(num_particles, tasks_mi, vm_mips, rng)
+
+    # === Greedy Initialization for gbest ===
+    gbest = greedy_initialization(tasks_mi, vm_mips)
+    gbest_makespan = float(compute_makespans(gbest[None, :], tasks_mi, vm_mips)[0])
+
+    for it in range(max_iter):
+        if update == "async":
+            _, gbest, gbest_makespan = swarm.step_async(gbest, gbest_makespan, rng, inertia_weight, c1, c2)
+        else:
+            makespans = swarm.step(gbest, rng, inertia_weight, c1, c2)
+            best_idx = int(np.argmin(makespans))
+            # Update gbest (only if better than greedy initial / previous best)
+            if makespans[best_idx] < gbest_makespan:
+                gbest = swarm.positions[best_idx].copy()
+                gbest_makespan = float(makespans[best_idx])
+
+        if logger and it % 50 == 0:
+            logger.log(f"G&PSO Iter {it}: best makespan = {gbest_makespan:.2f}s")
+
+    return gbest, gbest_makespan
+
+# ----------------------------
+# Main G&PSO Scheduler
+# ----------------------------
+
+def run_g_pso(tasks: List[Dict], vm_names: List[str], logger=None, vm_mips: Dict[str, float] = None,
+              num_particles: int = 100, max_iter: int = 200, seed: int = None, update: str = "async") -> List[Dict]:
+    """
+    G&PSO Algorithm (based on Zhong et al., 2016), NumPy engine.
+    - update: "async" or "sync" gbest refresh (see optimize_g_pso)
+    - tasks: task dicts with "mi" (plain MI numbers are accepted too)
+    - vm_mips: {vm: MIPS}; defaults to the cached .env capacity (utils/vm_capacity.py)
+    """
+    if logger:
+        logger.log("[G&PSO Scheduler (Greedy + PSO)]")
+    else:
+        print("[G&PSO Scheduler (Greedy + PSO)]")
+
+    vm_mips = get_vm_mips(vm_names, vm_mips)
+    tasks_mi = [task["mi"] if isinstance(task, dict) else task for task in tasks]
+
+    schedule, makespan = optimize_g_pso(
+        tasks_mi, [vm_mips[vm] for vm in vm_names],
+        num_particles=num_particles, max_iter=max_iter, seed=seed, logger=logger, update=update
+    )
+
+    assignments = []
+    for i, vm_idx in enumerate(schedule):
+        vm = vm_names[vm_idx]
+        msg = f"[G&PSO] Task {i} ({tasks_mi[i]} MI) → {vm}"
+        if logger:
+            logger.log(msg, level=DEBUG)
+        else:
+            print(msg)
+        assignments.append((i, vm, tasks_mi[i]))
+
+    msg = f"[G&PSO] Predicted makespan: {makespan:.3f}s"
+    if logger:
+        logger.log(msg)
+    else:
+        print(msg)
+
+    return run_tasks_parallel(assignments, logger)
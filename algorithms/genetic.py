@@ -0,0 +1,136 @@
+# algorithms/genetic.py
+import random
+import time
+from typing import List, Dict
+
+import numpy as np
+
+from utils.vm_capacity import get_vm_mips
+from algorithms.g_pso import compute_makespans
+from algorithms.schedule_cost import (IncrementalSchedule, descend, dispatch_schedule, initial_assignment,
+                                      task_mi_list)
+
+# ----------------------------
+# Memetic genetic algorithm over task → VM assignments.
+# The population is a (population, tasks) array with a (population, VMs) array
+# of per-VM loads; tournament selection, uniform crossover and random-reset
+# mutation make the children. Children that skip crossover are their mother
+# plus a few mutated genes, so they are scored incrementally: each mutation
+# moves one task's load between two VMs (IncrementalSchedule's move, applied to
+# all of them in one batched pass), O(mutations) instead of O(tasks).
+# Crossover rewrites about half the genes, so those children are re-scored in
+# one batched pass. Each generation the best child is then improved by
+# bottleneck local search on IncrementalSchedule, where a candidate move costs
+# O(log VMs).
+# ----------------------------
+
+def population_loads(pop: np.ndarray, tasks: np.ndarray, mips: np.ndarray) -> np.ndarray:
+    """(individuals, VMs) per-VM loads in seconds (row maxima are compute_makespans)."""
+    rows = np.arange(pop.shape[0])[:, None] * mips.shape[0]
+    return np.bincount((rows + pop).ravel(), weights=(tasks / mips[pop]).ravel(),
+                       minlength=pop.shape[0] * mips.shape[0]).reshape(pop.shape[0], mips.shape[0])
+
+def apply_gene_moves(loads: np.ndarray, rows: np.ndarray, genes: np.ndarray, old_vm: np.ndarray,
+                     new_vm: np.ndarray, tasks: np.ndarray, mips: np.ndarray):
+    """Move task genes[k] of individual rows[k] from old_vm[k] to new_vm[k] in `loads` (in place)."""
+    num_vms = mips.shape[0]
+    delta = np.bincount(rows * num_vms + new_vm, weights=tasks[genes] / mips[new_vm], minlength=loads.size)
+    delta -= np.bincount(rows * num_vms + old_vm, weights=tasks[genes] / mips[old_vm], minlength=loads.size)
+    loads += delta.reshape(loads.shape)
+
+def optimize_ga(tasks_mi: List[float], vm_mips: List[float], population: int = 60, generations: int = 200,
+                crossover_rate: float = 0.9, mutation_rate: float = None, tournament: int = 3, elite: int = 2,
+                local_search_evals: int = 2000, seed: int = None, logger=None):
+    """
+    Returns (schedule as VM indices, predicted makespan, evaluations).
+    mutation_rate defaults to 1 / tasks (one gene per child on average).
+    """
+    rng = np.random.default_rng(seed)
+    py_rng = random.Random(seed)
+    tasks = np.asarray(tasks_mi, dtype=np.float64)
+    mips = np.asarray(vm_mips, dtype=np.float64)
+    num_tasks, num_vms = tasks.shape[0], mips.shape[0]
+    seed_schedule = np.asarray(initial_assignment(tasks_mi, vm_mips), dtype=np.int64)
+    if num_tasks < 2 or num_vms < 2:
+        makespan = float(compute_makespans(seed_schedule[None, :], tasks, mips)[0]) if num_tasks else 0.0
+        return seed_schedule.tolist(), makespan, 1
+
+    mutation_rate = mutation_rate if mutation_rate is not None else 1.0 / num_tasks
+    elite = min(elite, population - 1)
+
+    # LPT schedule plus random individuals
+    pop = rng.integers(0, num_vms, size=(population, num_tasks))
+    pop[0] = seed_schedule
+    loads = population_loads(pop, tasks, mips)
+    fitness = loads.max(axis=1)
+    evaluations = population
+    log_every = max(1, generations // 4)
+
+    for gen in range(generations):
+        order = np.argsort(fitness)
+        num_children = population - elite
+
+        # Tournament selection: the fittest of `tournament` random individuals, twice per child
+        entrants = rng.integers(0, population, size=(num_children, 2, tournament))
+        winners = np.take_along_axis(entrants, np.argmin(fitness[entrants], axis=2)[..., None], axis=2)[..., 0]
+        mothers, fathers = pop[winners[:, 0]], pop[winners[:, 1]]
+
+        # Uniform crossover (rows without crossover copy the mother)
+        half = rng.random((num_children, num_tasks)) < 0.5
+        crossed = rng.random(num_children) < crossover_rate
+        children = np.where(half & crossed[:, None], fathers, mothers)
+
+        # Random-reset mutation
+        mutate = rng.random(children.shape) < mutation_rate
+        children[mutate] = rng.integers(0, num_vms, size=int(mutate.sum()))
+
+        # Copies: mother's loads plus the mutation moves; crossover children: batched re-score
+        child_loads = loads[winners[:, 0]]
+        copies = np.flatnonzero(~crossed)
+        rows, genes = np.nonzero(mutate[copies])
+        rows = copies[rows]
+        apply_gene_moves(child_loads, rows, genes, mothers[rows, genes], children[rows, genes], tasks, mips)
+        child_loads[crossed] = population_loads(children[crossed], tasks, mips)
+        child_fitness = child_loads.max(axis=1)
+        evaluations += num_children
+
+        # Memetic step: local search on the best child with incremental evaluation
+        best_child = int(np.argmin(child_fitness))
+        schedule = IncrementalSchedule(tasks_mi, vm_mips, children[best_child].tolist())
+        improved = descend(schedule, local_search_evals, py_rng)
+        evaluations += schedule.evaluations
+        if improved < child_fitness[best_child]:
+            children[best_child] = schedule.assignment
+            child_loads[best_child] = schedule.loads
+            child_fitness[best_child] = improved
+
+        pop = np.concatenate([pop[order[:elite]], children])
+        loads = np.concatenate([loads[order[:elite]], child_loads])
+        fitness = np.concatenate([fitness[order[:elite]], child_fitness])
+
+        if logger and gen % log_every == 0:
+            logger.log(f"GA Gen {gen}: best makespan = {fitness.min():.3f}s")
+
+    best = int(np.argmin(fitness))
+    # Exact makespan of the winner (the incremental loads carry a little floating-point drift)
+    return pop[best].tolist(), float(compute_makespans(pop[best][None, :], tasks, mips)[0]), evaluations
+
+def run_ga(tasks: List[Dict], vm_names: List[str], logger=None, vm_mips: Dict[str, float] = None,
+           population: int = 60, generations: int = 200, seed: int = None) -> List[Dict]:
+    """
+    Memetic GA scheduler.
+    - tasks: task dicts with "mi" (plain MI numbers are accepted too)
+    - vm_mips: {vm: MIPS}; defaults to the cached .env capacity (utils/vm_capacity.py)
+    """
+    if logger:
+        logger.log("[GA Scheduler (genetic algorithm + local search)]")
+    else:
+        print("[GA Scheduler (genetic algorithm + local search)]")
+
+    vm_mips = get_vm_mips(vm_names, vm_mips)
+    tasks_mi = task_mi_list(tasks)
+
+    t0 = time.time()
+    schedule, makespan, evaluations = optimize_ga(tasks_mi, [vm_mips[vm] for vm in vm_names], population=population,
+                                                  generations=generations, seed=seed, logger=logger)
+    return dispatch_schedule("GA", schedule, tasks_mi, vm_names, makespan, evaluations, time.time() - t0, logger)
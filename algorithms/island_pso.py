@@ -0,0 +1,210 @@
+# algorithms/island_pso.py
+import multiprocessing as mp
+import os
+from multiprocessing import shared_memory
+from typing import List, Dict
+
+import numpy as np
+
+from algorithms.g_pso import PSO_UPDATES, Swarm, compute_makespans, greedy_initialization
+from utils.docker_executor import run_tasks_parallel
+from utils.logger import DEBUG
+from utils.vm_capacity import get_vm_mips
+
+# ----------------------------
+# Island-model G&PSO
+# Several independent swarms run in their own processes and periodically
+# exchange their best particles through shared-memory arrays.
+# ----------------------------
+
+TOPOLOGIES = ("ring", "full")
+
+def migration_sources(island: int, num_islands: int, topology: str) -> List[int]:
+    """Islands whose migrants `island` receives at each migration."""
+    if num_islands < 2:
+        return []
+    if topology == "ring":
+        return [(island - 1) % num_islands]
+    if topology == "full":
+        return [j for j in range(num_islands) if j != island]
+    raise ValueError(f"Unknown topology '{topology}' (expected one of {TOPOLOGIES})")
+
+def _attach(name: str, shape, dtype):
+    # Children share the parent's resource tracker, which unlinks the block once the parent does
+    shm = shared_memory.SharedMemory(name=name)
+    return shm, np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+
+def _accept_migrants(swarm: Swarm, migrants: np.ndarray, makespans: np.ndarray):
+    """Replace the swarm's worst personal bests with better incoming particles."""
+    worst = np.argsort(swarm.pbest_makespan)[::-1][:len(makespans)]
+    for slot, pos, ms in zip(worst, migrants, makespans):
+        if ms < swarm.pbest_makespan[slot]:
+            swarm.pbest[slot] = pos
+            swarm.positions[slot] = pos
+            swarm.pbest_makespan[slot] = ms
+
+def _island_main(island: int, num_islands: int, shm_names: tuple, tasks_mi: np.ndarray, vm_mips: np.ndarray,
+                 gbest: np.ndarray, settings: Dict, seed_seq: np.random.SeedSequence, barrier):
+    num_tasks = tasks_mi.shape[0]
+    k = settings["num_migrants"]
+    shm_pos, migrants = _attach(shm_names[0], (num_islands, k, num_tasks), np.int64)
+    shm_fit, migrant_makespans = _attach(shm_names[1], (num_islands, k), np.float64)
+    try:
+        rng = np.random.default_rng(seed_seq)
+        swarm = Swarm(settings["num_particles"], tasks_mi, vm_mips, rng)
+        gbest_makespan = float(compute_makespans(gbest[None, :], tasks_mi, vm_mips)[0])
+        sources = migration_sources(island, num_islands, settings["topology"])
+
+        for it in range(settings["max_iter"]):
+            if settings["update"] == "async":
+                _, gbest, gbest_makespan = swarm.step_async(gbest, gbest_makespan, rng, settings["inertia_weight"],
+                                                            settings["c1"], settings["c2"])
+            else:
+                makespans = swarm.step(gbest, rng, settings["inertia_weight"], settings["c1"], settings["c2"])
+                best_idx = int(np.argmin(makespans))
+                if makespans[best_idx] < gbest_makespan:
+                    gbest = swarm.positions[best_idx].copy()
+                    gbest_makespan = float(makespans[best_idx])
+
+            if sources and (it + 1) % settings["migration_interval"] == 0:
+                # Publish: island gbest plus the next best personal bests
+                order = np.argsort(swarm.pbest_makespan)[:k - 1]
+                migrants[island, 0] = gbest
+                migrant_makespans[island, 0] = gbest_makespan
+                migrants[island, 1:1 + len(order)] = swarm.pbest[order]
+                migrant_makespans[island, 1:1 + len(order)] = swarm.pbest_makespan[order]
+                barrier.wait()
+                for src in sources:
+                    _accept_migrants(swarm, migrants[src].copy(), migrant_makespans[src].copy())
+                    if migrant_makespans[src, 0] < gbest_makespan:
+                        gbest = migrants[src, 0].copy()
+                        gbest_makespan = float(migrant_makespans[src, 0])
+                # Nobody overwrites its slot until every island has read its sources
+                barrier.wait()
+
+        migrants[island, 0] = gbest
+        migrant_makespans[island, 0] = gbest_makespan
+    except BaseException:
+        barrier.abort()
+        raise
+    finally:
+        del migrants, migrant_makespans
+        shm_pos.close()
+        shm_fit.close()
+
+def optimize_island_pso(tasks_mi: List[float], vm_mips: List[float], num_islands: int = None,
+                        migration_interval: int = 20, num_migrants: int = 2, topology: str = "ring",
+                        num_particles: int = 100, max_iter: int = 200,
+                        inertia_weight: float = 0.9, c1: float = 2.0, c2: float = 2.0, seed: int = None,
+                        update: str = "async"):
+    """
+    Run `num_islands` G&PSO swarms in separate processes (default: one per core).
+    Every `migration_interval` iterations each island sends its `num_migrants`
+    best particles to its neighbours (`topology`: "ring" or "full").
+    `update` is the gbest refresh of each swarm (g_pso.optimize_g_pso).
+    Returns (schedule as VM indices, predicted makespan, per-island makespans).
+    """
+    if topology not in TOPOLOGIES:
+        raise ValueError(f"Unknown topology '{topology}' (expected one of {TOPOLOGIES})")
+    if update not in PSO_UPDATES:
+        raise ValueError(f"Unknown update '{update}' (expected one of {PSO_UPDATES})")
+    num_islands = num_islands or os.cpu_count() or 1
+    num_migrants = max(1, min(num_migrants, num_particles))
+    migration_interval = max(1, migration_interval)
+
+    tasks_mi = np.asarray(tasks_mi, dtype=np.float64)
+    vm_mips = np.asarray(vm_mips, dtype=np.float64)
+    num_tasks = tasks_mi.shape[0]
+
+    # Greedy seed is computed once and shared by every island
+    gbest = greedy_initialization(tasks_mi, vm_mips)
+    settings = {
+        "num_particles": num_particles, "max_iter": max_iter, "num_migrants": num_migrants,
+        "migration_interval": migration_interval, "topology": topology,
+        "inertia_weight": inertia_weight, "c1": c1, "c2": c2, "update": update,
+    }
+
+    shm_pos = shared_memory.SharedMemory(create=True, size=max(1, num_islands * num_migrants * num_tasks * 8))
+    shm_fit = shared_memory.SharedMemory(create=True, size=num_islands * num_migrants * 8)
+    try:
+        migrants = np.ndarray((num_islands, num_migrants, num_tasks), dtype=np.int64, buffer=shm_pos.buf)
+        migrant_makespans = np.ndarray((num_islands, num_migrants), dtype=np.float64, buffer=shm_fit.buf)
+        migrant_makespans[:] = np.inf
+
+        # spawn: the experiment process has logger/stats/report threads that fork would copy mid-state
+        ctx = mp.get_context("spawn")
+        barrier = ctx.Barrier(num_islands)
+        seeds = np.random.SeedSequence(seed).spawn(num_islands)
+        islands = [
+            ctx.Process(
+                target=_island_main,
+                args=(i, num_islands, (shm_pos.name, shm_fit.name), tasks_mi, vm_mips,
+                      gbest, settings, seeds[i], barrier),
+                daemon=True,
+            )
+            for i in range(num_islands)
+        ]
+        for p in islands:
+            p.start()
+        for p in islands:
+            p.join()
+        failed = [i for i, p in enumerate(islands) if p.exitcode != 0]
+        if failed:
+            raise RuntimeError(f"Island(s) {failed} failed")
+
+        island_makespans = migrant_makespans[:, 0].copy()
+        best_island = int(np.argmin(island_makespans))
+        schedule = migrants[best_island, 0].copy()
+        del migrants, migrant_makespans
+    finally:
+        shm_pos.close()
+        shm_pos.unlink()
+        shm_fit.close()
+        shm_fit.unlink()
+
+    return schedule, float(island_makespans[best_island]), island_makespans.tolist()
+
+def run_island_pso(tasks: List[Dict], vm_names: List[str], logger=None, vm_mips: Dict[str, float] = None,
+                   num_islands: int = None, migration_interval: int = 20, num_migrants: int = 2,
+                   topology: str = "ring", num_particles: int = 100, max_iter: int = 200,
+                   seed: int = None, update: str = "async") -> List[Dict]:
+    """
+    Island-model G&PSO scheduler: one swarm per process, periodic migration.
+    - tasks: task dicts with "mi" (plain MI numbers are accepted too)
+    - vm_mips: {vm: MIPS}; defaults to the cached .env capacity (utils/vm_capacity.py)
+    """
+    num_islands = num_islands or os.cpu_count() or 1
+    msg = (f"[Island G&PSO Scheduler ({num_islands} islands, {topology} topology, "
+           f"migrate {num_migrants} every {migration_interval} iters)]")
+    if logger:
+        logger.log(msg)
+    else:
+        print(msg)
+
+    vm_mips = get_vm_mips(vm_names, vm_mips)
+    tasks_mi = [task["mi"] if isinstance(task, dict) else task for task in tasks]
+
+    schedule, makespan, island_makespans = optimize_island_pso(
+        tasks_mi, [vm_mips[vm] for vm in vm_names], num_islands=num_islands,
+        migration_interval=migration_interval, num_migrants=num_migrants, topology=topology,
+        num_particles=num_particles, max_iter=max_iter, seed=seed, update=update
+    )
+
+    assignments = []
+    for i, vm_idx in enumerate(schedule):
+        vm = vm_names[vm_idx]
+        msg = f"[ISLAND-PSO] Task {i} ({tasks_mi[i]} MI) → {vm}"
+        if logger:
+            logger.log(msg, level=DEBUG)
+        else:
+            print(msg)
+        assignments.append((i, vm, tasks_mi[i]))
+
+    msg = (f"[ISLAND-PSO] Predicted makespan: {makespan:.3f}s | per island: "
+           + ", ".join(f"{ms:.3f}" for ms in island_makespans))
+    if logger:
+        logger.log(msg)
+    else:
+        print(msg)
+
+    return run_tasks_parallel(assignments, logger)
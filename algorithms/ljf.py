@@ -1,37 +1,29 @@
-from typing import List, Dict
+from typing import Iterator, List, Dict
 from utils.docker_executor import run_tasks_parallel
+from utils.logger import DEBUG
+from utils.task_source import sorted_task_tuples
+from utils.vm_capacity import get_vm_mips
+from algorithms.vm_selector import LeastLoadedSelector
 
-VM_MIPS = {
-    "vm1": 5000,
-    "vm2": 6000,
-    "vm3": 7000,
-    "vm4": 8000,
-    "vm5": 10000,
-}
+def schedule_ljf(tasks, vm_names: List[str], logger=None, vm_mips: Dict[str, float] = None) -> Iterator[tuple]:
+    """Yield (task_id, vm, mi) assignments in descending MI order (external sort for huge sources)."""
+    vm_mips = get_vm_mips(vm_names, vm_mips)
+    selector = LeastLoadedSelector(vm_names, vm_mips)  # estimated time per VM, kept in a heap
 
-def run_ljf(tasks: List[Dict], vm_names: List[str], logger=None) -> List[Dict]:
     # Sort tasks by descending MI
-    tasks_sorted = sorted(enumerate(tasks), key=lambda x: x[1]["mi"], reverse=True)
-    
-    vm_load = {vm: 0.0 for vm in vm_names}  # estimated time per VM
-
-    assignments = []
-
-    for i, task in tasks_sorted:
-        task_mi = task["mi"]
+    for i, task_mi, _ in sorted_task_tuples(tasks, key="mi", reverse=True):
         # Find the VM with the least load
-        best_vm = min(vm_names, key=lambda vm: vm_load[vm])
-        exec_time = task_mi / VM_MIPS[best_vm]
-        vm_load[best_vm] += exec_time
+        best_vm, load = selector.assign(task_mi)
 
-        msg = f"[LJF] Task {i} ({task_mi} MI) → {best_vm} | load: {vm_load[best_vm]:.3f}s"
+        msg = f"[LJF] Task {i} ({task_mi} MI) → {best_vm} | load: {load:.3f}s"
         if logger:
-            logger.log(msg)
+            logger.log(msg, level=DEBUG)
         else:
             print(msg)
 
-        assignments.append((i, best_vm, task_mi))
+        yield (i, best_vm, task_mi)
 
-    return run_tasks_parallel(assignments, logger)
+def run_ljf(tasks: List[Dict], vm_names: List[str], logger=None, vm_mips: Dict[str, float] = None) -> List[Dict]:
+    return run_tasks_parallel(schedule_ljf(tasks, vm_names, logger, vm_mips), logger)
 
 run_ljf = run_ljf
@@ -0,0 +1,24 @@
+# algorithms/online.py
+from typing import List, Dict
+from utils.online_dispatcher import run_online_policy
+from utils.vm_capacity import get_vm_mips
+
+# Online counterparts of fcfs/sjf/priority/greedy: placement happens when a
+# task arrives or a VM frees up (utils/online_dispatcher.py), not up front.
+# arrival_rate: Poisson tasks/s; None → "arrival" field of each task (or all at 0)
+
+def run_online_fcfs(tasks: List[Dict], vm_names: List[str], logger=None, vm_mips: Dict[str, float] = None,
+                    arrival_rate: float = None, seed: int = None) -> List[Dict]:
+    return run_online_policy("fcfs", tasks, vm_names, get_vm_mips(vm_names, vm_mips), logger, arrival_rate, seed)
+
+def run_online_sjf(tasks: List[Dict], vm_names: List[str], logger=None, vm_mips: Dict[str, float] = None,
+                   arrival_rate: float = None, seed: int = None) -> List[Dict]:
+    return run_online_policy("sjf", tasks, vm_names, get_vm_mips(vm_names, vm_mips), logger, arrival_rate, seed)
+
+def run_online_priority(tasks: List[Dict], vm_names: List[str], logger=None, vm_mips: Dict[str, float] = None,
+                        arrival_rate: float = None, seed: int = None) -> List[Dict]:
+    return run_online_policy("priority", tasks, vm_names, get_vm_mips(vm_names, vm_mips), logger, arrival_rate, seed)
+
+def run_online_greedy(tasks: List[Dict], vm_names: List[str], logger=None, vm_mips: Dict[str, float] = None,
+                      arrival_rate: float = None, seed: int = None) -> List[Dict]:
+    return run_online_policy("greedy", tasks, vm_names, get_vm_mips(vm_names, vm_mips), logger, arrival_rate, seed)
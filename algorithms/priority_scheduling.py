@@ -1,47 +1,34 @@
 # algorithms/priority.py
-from typing import List, Dict
+from typing import Iterator, List, Dict
 from utils.docker_executor import run_tasks_parallel
+from utils.logger import DEBUG
+from utils.task_source import sorted_task_tuples
+from utils.vm_capacity import get_vm_mips
+from algorithms.vm_selector import LeastLoadedSelector
 
-VM_MIPS = {
-    "vm1": 5000,
-    "vm2": 6000,
-    "vm3": 7000,
-    "vm4": 8000,
-    "vm5": 10000,
-}
 
-# You'll receive VM_MIPS from run_experiment.py (see Step 3)
-def run_priority(tasks: List[Dict], vm_names: List[str], logger=None) -> List[Dict]:
-    # Step 1: Compute priority for each task
-    indexed_tasks = []
-    for i, task in enumerate(tasks):
-        mi = task["mi"]
-        sla = task["sla"]
-        # Priority score: lower = more urgent
-        priority_score = mi / sla  # or sla alone, or (mi * (1/sla))
-        indexed_tasks.append((i, task, priority_score))
-    
-    # Step 2: Sort by priority (ascending = most urgent first)
-    indexed_tasks.sort(key=lambda x: x[2])  # lowest score first = highest priority
+# vm_mips is resolved once per experiment by run_experiment.py (utils/vm_capacity.py)
+def schedule_priority(tasks, vm_names: List[str], logger=None, vm_mips: Dict[str, float] = None) -> Iterator[tuple]:
+    """Yield (task_id, vm, mi) assignments, most urgent (lowest MI/SLA) first."""
+    vm_mips = get_vm_mips(vm_names, vm_mips)
+    # Step 1 + 2: priority score = mi / sla (lower = more urgent), sorted ascending;
+    # chunked external sort when the task source is too big for memory
+    ordered = sorted_task_tuples(tasks, key="mi_per_sla")
 
     # Step 3: Assign using least-loaded VM (like your FCFS)
-    vm_load = {vm: 0.0 for vm in vm_names}
-    assignments = []
+    selector = LeastLoadedSelector(vm_names, vm_mips)
 
-    for i, task, _ in indexed_tasks:
-        task_id = i
-        task_mi = task["mi"]
+    for task_id, task_mi, sla in ordered:
         # Find least-loaded VM (in estimated time)
-        best_vm = min(vm_names, key=lambda vm: vm_load[vm])
-        exec_time = task_mi / VM_MIPS[best_vm]
-        vm_load[best_vm] += exec_time
+        best_vm, load = selector.assign(task_mi)
 
-        msg = f"[PRIORITY] Task {task_id} ({task_mi} MI, SLA={task['sla']}) → {best_vm} | load: {vm_load[best_vm]:.3f}s"
+        msg = f"[PRIORITY] Task {task_id} ({task_mi} MI, SLA={sla}) → {best_vm} | load: {load:.3f}s"
         if logger:
-            logger.log(msg)
+            logger.log(msg, level=DEBUG)
         else:
             print(msg)
 
-        assignments.append((task_id, best_vm, task_mi))
+        yield (task_id, best_vm, task_mi)
 
-    return run_tasks_parallel(assignments, logger)
\ No newline at end of file
+def run_priority(tasks: List[Dict], vm_names: List[str], logger=None, vm_mips: Dict[str, float] = None) -> List[Dict]:
+    return run_tasks_parallel(schedule_priority(tasks, vm_names, logger, vm_mips), logger)
@@ -0,0 +1,211 @@
+# algorithms/schedule_cost.py
+import heapq
+import random
+from typing import List, Dict
+
+from utils.docker_executor import run_tasks_parallel
+from utils.logger import DEBUG
+from algorithms.vm_selector import EarliestFinishSelector
+
+# ----------------------------
+# Incremental cost model shared by the local-search / evolutionary schedulers
+# (genetic.py, simulated_annealing.py, tabu_search.py).
+# A schedule keeps per-VM loads and a lazy max-heap over them, so the makespan
+# after moving one task or swapping two is known in O(log VMs) instead of
+# re-summing every task like g_pso.compute_makespans does.
+# ----------------------------
+
+class IncrementalSchedule:
+    """
+    Task → VM assignment (VM indices) with per-VM loads in seconds.
+
+    move_makespan()/swap_makespan() only evaluate; apply_move()/apply_swap()
+    commit. Heap entries are (-load, vm, version): a VM's entry goes stale
+    when its load changes and is dropped lazily when it reaches the top.
+    """
+
+    def __init__(self, tasks_mi: List[float], vm_mips: List[float], assignment: List[int]):
+        self.tasks_mi = [float(mi) for mi in tasks_mi]
+        self.vm_mips = [float(mips) for mips in vm_mips]
+        self.assignment = [int(vm) for vm in assignment]
+        num_vms = len(self.vm_mips)
+        self.loads = [0.0] * num_vms
+        self.vm_tasks = [[] for _ in range(num_vms)]  # tasks per VM, for O(1) random picks
+        self.position = [0] * len(self.tasks_mi)     # index of each task in its vm_tasks list
+        for task, vm in enumerate(self.assignment):
+            self.loads[vm] += self.tasks_mi[task] / self.vm_mips[vm]
+            self.position[task] = len(self.vm_tasks[vm])
+            self.vm_tasks[vm].append(task)
+        self.version = [0] * num_vms
+        self.evaluations = 0
+        self._rebuild_heap()
+
+    def _rebuild_heap(self):
+        self.heap = [(-load, vm, self.version[vm]) for vm, load in enumerate(self.loads)]
+        heapq.heapify(self.heap)
+
+    def _set_load(self, vm: int, load: float):
+        self.loads[vm] = load
+        self.version[vm] += 1
+        heapq.heappush(self.heap, (-load, vm, self.version[vm]))
+
+    def _max_excluding(self, a: int, b: int = -1) -> float:
+        """Largest load among the VMs other than a and b (0.0 if there are none)."""
+        heap = self.heap
+        skipped = []
+        result = 0.0
+        while heap:
+            neg_load, vm, version = heap[0]
+            if version != self.version[vm]:
+                heapq.heappop(heap)  # stale
+            elif vm == a or vm == b:
+                skipped.append(heapq.heappop(heap))
+            else:
+                result = -neg_load
+                break
+        for entry in skipped:
+            heapq.heappush(heap, entry)
+        return result
+
+    def makespan(self) -> float:
+        return self._max_excluding(-1)
+
+    def bottleneck(self) -> int:
+        """VM with the highest load."""
+        self.makespan()  # drops stale entries from the top
+        return self.heap[0][1]
+
+    def move_makespan(self, task: int, vm: int) -> float:
+        """Makespan if `task` moved to `vm`."""
+        self.evaluations += 1
+        src = self.assignment[task]
+        if src == vm:
+            return self.makespan()
+        mi = self.tasks_mi[task]
+        return max(self.loads[src] - mi / self.vm_mips[src], self.loads[vm] + mi / self.vm_mips[vm],
+                   self._max_excluding(src, vm))
+
+    def swap_makespan(self, task_a: int, task_b: int) -> float:
+        """Makespan if `task_a` and `task_b` traded VMs."""
+        self.evaluations += 1
+        vm_a, vm_b = self.assignment[task_a], self.assignment[task_b]
+        if vm_a == vm_b:
+            return self.makespan()
+        mi_a, mi_b = self.tasks_mi[task_a], self.tasks_mi[task_b]
+        return max(self.loads[vm_a] + (mi_b - mi_a) / self.vm_mips[vm_a],
+                   self.loads[vm_b] + (mi_a - mi_b) / self.vm_mips[vm_b],
+                   self._max_excluding(vm_a, vm_b))
+
+    def _detach(self, task: int):
+        vm = self.assignment[task]
+        tasks = self.vm_tasks[vm]
+        last = tasks.pop()
+        if last != task:
+            tasks[self.position[task]] = last
+            self.position[last] = self.position[task]
+
+    def _attach(self, task: int, vm: int):
+        self.assignment[task] = vm
+        self.position[task] = len(self.vm_tasks[vm])
+        self.vm_tasks[vm].append(task)
+
+    def apply_move(self, task: int, vm: int):
+        src = self.assignment[task]
+        if src == vm:
+            return
+        mi = self.tasks_mi[task]
+        self._detach(task)
+        self._attach(task, vm)
+        self._set_load(src, self.loads[src] - mi / self.vm_mips[src])
+        self._set_load(vm, self.loads[vm] + mi / self.vm_mips[vm])
+        self._compact()
+
+    def apply_swap(self, task_a: int, task_b: int):
+        vm_a, vm_b = self.assignment[task_a], self.assignment[task_b]
+        if vm_a == vm_b:
+            return
+        mi_a, mi_b = self.tasks_mi[task_a], self.tasks_mi[task_b]
+        self._detach(task_a)
+        self._detach(task_b)
+        self._attach(task_a, vm_b)
+        self._attach(task_b, vm_a)
+        self._set_load(vm_a, self.loads[vm_a] + (mi_b - mi_a) / self.vm_mips[vm_a])
+        self._set_load(vm_b, self.loads[vm_b] + (mi_a - mi_b) / self.vm_mips[vm_b])
+        self._compact()
+
+    def _compact(self):
+        # Stale entries only leave the heap when they surface; bound its size
+        if len(self.heap) > 4 * len(self.loads) + 16:
+            self._rebuild_heap()
+
+    def resync(self):
+        """Recompute loads from scratch (clears floating-point drift of many small updates)."""
+        self.loads = [0.0] * len(self.vm_mips)
+        for task, vm in enumerate(self.assignment):
+            self.loads[vm] += self.tasks_mi[task] / self.vm_mips[vm]
+        self.version = [v + 1 for v in self.version]
+        self._rebuild_heap()
+
+def initial_assignment(tasks_mi: List[float], vm_mips: List[float]) -> List[int]:
+    """Start point for the searches: longest task first onto the earliest-finishing VM (LPT)."""
+    selector = EarliestFinishSelector(list(range(len(vm_mips))), dict(enumerate(vm_mips)))
+    assignment = [0] * len(tasks_mi)
+    for task in sorted(range(len(tasks_mi)), key=lambda t: -tasks_mi[t]):
+        assignment[task], _ = selector.assign(tasks_mi[task])
+    return assignment
+
+def descend(schedule: IncrementalSchedule, max_evals: int, rng: random.Random) -> float:
+    """
+    First-improvement local search: move a bottleneck task to whichever VM
+    lowers the makespan most, until no such move exists or `max_evals`
+    evaluations are spent. Returns the final makespan.
+    """
+    num_vms = len(schedule.vm_mips)
+    current = schedule.makespan()
+    budget = schedule.evaluations + max_evals
+    while num_vms > 1 and schedule.evaluations < budget:
+        tasks = list(schedule.vm_tasks[schedule.bottleneck()])
+        rng.shuffle(tasks)
+        improved = False
+        for task in tasks:
+            best_vm, best = None, current
+            for vm in range(num_vms):
+                makespan = schedule.move_makespan(task, vm)
+                if makespan < best - 1e-12:
+                    best_vm, best = vm, makespan
+            if best_vm is not None:
+                schedule.apply_move(task, best_vm)
+                current = best
+                improved = True
+                break
+            if schedule.evaluations >= budget:
+                break
+        if not improved:
+            break
+    return current
+
+def task_mi_list(tasks) -> List[float]:
+    """MI of every task (task dicts or plain MI numbers)."""
+    return [task["mi"] if isinstance(task, dict) else task for task in tasks]
+
+def dispatch_schedule(tag: str, assignment: List[int], tasks_mi: List[float], vm_names: List[str],
+                      makespan: float, evaluations: int, elapsed: float, logger=None) -> List[Dict]:
+    """Log a searched schedule like the other schedulers and run it."""
+    assignments = []
+    for i, vm_idx in enumerate(assignment):
+        vm = vm_names[vm_idx]
+        msg = f"[{tag}] Task {i} ({tasks_mi[i]} MI) → {vm}"
+        if logger:
+            logger.log(msg, level=DEBUG)
+        else:
+            print(msg)
+        assignments.append((i, vm, tasks_mi[i]))
+
+    rate = evaluations / elapsed if elapsed > 0 else float("inf")
+    msg = f"[{tag}] Predicted makespan: {makespan:.3f}s ({evaluations} evaluations, {rate:,.0f}/s)"
+    if logger:
+        logger.log(msg)
+    else:
+        print(msg)
+
+    return run_tasks_parallel(assignments, logger)
@@ -0,0 +1,90 @@
+# algorithms/simulated_annealing.py
+import math
+import random
+import time
+from typing import List, Dict
+
+from utils.vm_capacity import get_vm_mips
+from algorithms.schedule_cost import (IncrementalSchedule, dispatch_schedule, initial_assignment,
+                                      task_mi_list)
+
+# ----------------------------
+# Simulated annealing over task → VM assignments.
+# Starts from the LPT schedule; each step proposes moving one task (usually
+# one on the bottleneck VM) or swapping two, scored in O(log VMs) by
+# IncrementalSchedule, and accepts worse schedules with probability
+# exp(-delta / T) under a geometric cooling schedule.
+# ----------------------------
+
+def optimize_sa(tasks_mi: List[float], vm_mips: List[float], max_iter: int = 200_000,
+                initial_temp: float = None, final_temp: float = None, swap_prob: float = 0.3,
+                bottleneck_prob: float = 0.7, seed: int = None, logger=None):
+    """
+    Returns (schedule as VM indices, predicted makespan, evaluations).
+    Temperatures default to 0.5% and 0.0001% of the starting makespan.
+    """
+    rng = random.Random(seed)
+    schedule = IncrementalSchedule(tasks_mi, vm_mips, initial_assignment(tasks_mi, vm_mips))
+    current = schedule.makespan()
+    best, best_assignment = current, list(schedule.assignment)
+    num_tasks, num_vms = len(tasks_mi), len(vm_mips)
+    if num_tasks < 2 or num_vms < 2 or current <= 0:
+        return best_assignment, best, schedule.evaluations
+
+    temp = initial_temp or 0.005 * current
+    end_temp = final_temp or 1e-6 * current
+    cooling = (end_temp / temp) ** (1.0 / max_iter)
+    log_every = max(1, max_iter // 4)
+
+    for it in range(max_iter):
+        bottleneck = schedule.bottleneck()
+        on_bottleneck = schedule.vm_tasks[bottleneck]
+        if on_bottleneck and rng.random() < bottleneck_prob:
+            task = on_bottleneck[rng.randrange(len(on_bottleneck))]
+        else:
+            task = rng.randrange(num_tasks)
+
+        if rng.random() < swap_prob:
+            other = rng.randrange(num_tasks)
+            candidate = schedule.swap_makespan(task, other)
+            move = (schedule.apply_swap, task, other)
+        else:
+            src = schedule.assignment[task]
+            vm = rng.randrange(num_vms - 1)
+            vm += vm >= src  # any VM but the current one
+            candidate = schedule.move_makespan(task, vm)
+            move = (schedule.apply_move, task, vm)
+
+        delta = candidate - current
+        if delta <= 0 or rng.random() < math.exp(-delta / temp):
+            apply, a, b = move
+            apply(a, b)
+            current = candidate
+            if current < best - 1e-12:
+                best, best_assignment = current, list(schedule.assignment)
+        temp *= cooling
+
+        if logger and it % log_every == 0:
+            logger.log(f"SA Iter {it}: T = {temp:.4f}, current = {current:.3f}s, best makespan = {best:.3f}s")
+
+    return best_assignment, best, schedule.evaluations
+
+def run_sa(tasks: List[Dict], vm_names: List[str], logger=None, vm_mips: Dict[str, float] = None,
+           max_iter: int = 200_000, seed: int = None) -> List[Dict]:
+    """
+    Simulated annealing scheduler.
+    - tasks: task dicts with "mi" (plain MI numbers are accepted too)
+    - vm_mips: {vm: MIPS}; defaults to the cached .env capacity (utils/vm_capacity.py)
+    """
+    if logger:
+        logger.log("[SA Scheduler (LPT start + simulated annealing)]")
+    else:
+        print("[SA Scheduler (LPT start + simulated annealing)]")
+
+    vm_mips = get_vm_mips(vm_names, vm_mips)
+    tasks_mi = task_mi_list(tasks)
+
+    t0 = time.time()
+    schedule, makespan, evaluations = optimize_sa(tasks_mi, [vm_mips[vm] for vm in vm_names],
+                                                  max_iter=max_iter, seed=seed, logger=logger)
+    return dispatch_schedule("SA", schedule, tasks_mi, vm_names, makespan, evaluations, time.time() - t0, logger)
@@ -1,44 +1,24 @@
 from typing import List, Dict
 from utils.docker_executor import run_tasks_parallel
+from utils.logger import DEBUG
+from utils.vm_capacity import get_vm_mips
+from algorithms.vm_selector import LeastLoadedSelector
 
-# VM MIPS (just for reference)
-VM_MIPS = {
-    "vm1": 1000,
-    "vm2": 1000,
-    "vm3": 1000,
-    "vm4": 1000,
-    "vm5": 1000,
-}
-
-def run_best_fit(tasks: List[float], vm_names: List[str], logger=None) -> List[Dict]:
-    # Initialize VM loads to zero
-    vm_load = {vm: 0.0 for vm in vm_names}  # estimated time per VM
+def run_best_fit(tasks: List[float], vm_names: List[str], logger=None, vm_mips: Dict[str, float] = None) -> List[Dict]:
+    vm_mips = get_vm_mips(vm_names, vm_mips)
+    # VM loads start at zero and live in a heap (smallest load first)
+    selector = LeastLoadedSelector(vm_names, vm_mips)  # estimated time per VM
 
     assignments = []
 
     # For each task, choose the VM with the best fit (least current load)
     for i, task_mi in enumerate(tasks):
-        candidates = []
-        
-        # Compute the task execution time for each VM and track the current load
-        for vm in vm_names:
-            exec_time = task_mi / VM_MIPS[vm]
-            candidates.append((vm_load[vm], vm))  # Sort based on current load
-        
-        # Sort VMs by their current load (smallest load first)
-        candidates.sort(key=lambda x: x[0])
-
-        # Select the VM with the least current load
-        best_vm = candidates[0][1]
-        
-        # Calculate the execution time and update the VM load
-        exec_time = task_mi / VM_MIPS[best_vm]
-        vm_load[best_vm] += exec_time
+        best_vm, load = selector.assign(task_mi)
 
         # Log or print assignment details
-        msg = f"[Best-Fit] Task {i} ({task_mi} MI) → {best_vm} | load: {vm_load[best_vm]:.3f}s"
+        msg = f"[Best-Fit] Task {i} ({task_mi} MI) → {best_vm} | load: {load:.3f}s"
         if logger:
-            logger.log(msg)
+            logger.log(msg, level=DEBUG)
         else:
             print(msg)
 
@@ -1,8 +1,10 @@
 # algorithms/default_algo.py
 from typing import List, Dict
 from utils.docker_executor import run_tasks_parallel
+from utils.logger import DEBUG
 
-def run_default(tasks: List[float], vm_names: List[str], logger=None) -> List[Dict]:
+def run_default(tasks: List[float], vm_names: List[str], logger=None, vm_mips: Dict[str, float] = None) -> List[Dict]:
+    # vm_mips is accepted for a uniform scheduler signature; this policy ignores capacity
     if logger:
         logger.log("[Default Scheduler (Round-Robin Assignment)]")
     else:
@@ -15,7 +17,7 @@ def run_default(tasks: List[float], vm_names: List[str], logger=None) -> List[Di
         assignments.append((i, vm, task))
         msg = f"Task {i:2d} ({task:4.2f} MI) → {vm}"
         if logger:
-            logger.log(msg)
+            logger.log(msg, level=DEBUG)
         else:
             print(msg)
 
@@ -1,41 +1,25 @@
-from typing import List, Dict
+from typing import Iterator, List, Dict
 from utils.docker_executor import run_tasks_parallel
+from utils.logger import DEBUG
+from utils.task_source import iter_task_tuples
+from utils.vm_capacity import get_vm_mips
+from algorithms.vm_selector import EarliestFinishSelector
 
-# VM performance in MIPS (from .env OR override here)
-VM_MIPS = {
-    "vm1": 1000,
-    "vm2": 1000,
-    "vm3": 1000,
-    "vm4": 1000,
-    "vm5": 1000,
-}
+def schedule_greedy(tasks, vm_names: List[str], logger=None, vm_mips: Dict[str, float] = None) -> Iterator[tuple]:
+    """Yield (task_id, vm, mi) assignments one task at a time, earliest predicted finish first."""
+    vm_mips = get_vm_mips(vm_names, vm_mips)
+    # Predicted finish time per VM, tie-breaking on task count
+    selector = EarliestFinishSelector(vm_names, vm_mips)
 
-def run_greedy(tasks: List[float], vm_names: List[str], logger=None) -> List[Dict]:
-    vm_load = {vm: 0.0 for vm in vm_names}       # estimated time
-    vm_task_count = {vm: 0 for vm in vm_names}   # tie-breaking
+    for i, task_mi, _ in iter_task_tuples(tasks):
+        target_vm, load = selector.assign(task_mi)
 
-    assignments = []
+        msg = f"[Greedy] Task {i} ({task_mi} MI) → {target_vm} | predicted load: {load:.3f}s"
+        (logger.log(msg, level=DEBUG) if logger else print(msg))
 
-    for i, task_mi in enumerate(tasks):
-        # Compute predicted finish time on each VM
-        candidates = []
-        for vm in vm_names:
-            exec_time = task_mi / VM_MIPS[vm]
-            finish = vm_load[vm] + exec_time
-            candidates.append((finish, vm_task_count[vm], vm))
+        yield (i, target_vm, task_mi)
 
-        candidates.sort(key=lambda x: (x[0], x[1]))
-        target_vm = candidates[0][2]
-
-        exec_time = task_mi / VM_MIPS[target_vm]
-        vm_load[target_vm] += exec_time
-        vm_task_count[target_vm] += 1
-
-        msg = f"[Greedy] Task {i} ({task_mi} MI) → {target_vm} | predicted load: {vm_load[target_vm]:.3f}s"
-        (logger.log(msg) if logger else print(msg))
-
-        assignments.append((i, target_vm, task_mi))
-
-    return run_tasks_parallel(assignments, logger)
+def run_greedy(tasks: List[float], vm_names: List[str], logger=None, vm_mips: Dict[str, float] = None) -> List[Dict]:
+    return run_tasks_parallel(schedule_greedy(tasks, vm_names, logger, vm_mips), logger)
 
 run_greedy = run_greedy
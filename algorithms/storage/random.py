@@ -1,8 +1,10 @@
 from typing import List, Dict
 from utils.docker_executor import run_tasks_parallel
+from utils.logger import DEBUG
 import random
 
-def run_random(tasks: List[float], vm_names: List[str], logger=None) -> List[Dict]:
+def run_random(tasks: List[float], vm_names: List[str], logger=None, vm_mips: Dict[str, float] = None) -> List[Dict]:
+    # vm_mips is accepted for a uniform scheduler signature; this policy ignores capacity
     assignments = []
 
     for i, task_mi in enumerate(tasks):
@@ -11,7 +13,7 @@ def run_random(tasks: List[float], vm_names: List[str], logger=None) -> List[Dic
 
         msg = f"[Random] Task {i} ({task_mi} MI) → {vm}"
         if logger:
-            logger.log(msg)
+            logger.log(msg, level=DEBUG)
         else:
             print(msg)
 
@@ -0,0 +1,91 @@
+# algorithms/tabu_search.py
+import random
+import time
+from typing import List, Dict
+
+from utils.vm_capacity import get_vm_mips
+from algorithms.schedule_cost import (IncrementalSchedule, dispatch_schedule, initial_assignment,
+                                      task_mi_list)
+
+# ----------------------------
+# Tabu search over task → VM assignments.
+# Every iteration scores a neighbourhood around the bottleneck VM (moves of
+# its tasks to every other VM plus swaps with random tasks elsewhere) with
+# IncrementalSchedule and takes the best move that isn't tabu. A task may not
+# return to the VM it just left for `tenure` iterations, unless that would
+# beat the best makespan found so far (aspiration).
+# ----------------------------
+
+def optimize_tabu(tasks_mi: List[float], vm_mips: List[float], max_iter: int = 2000, candidates: int = 32,
+                  tenure: int = 10, seed: int = None, logger=None):
+    """Returns (schedule as VM indices, predicted makespan, evaluations)."""
+    rng = random.Random(seed)
+    schedule = IncrementalSchedule(tasks_mi, vm_mips, initial_assignment(tasks_mi, vm_mips))
+    current = schedule.makespan()
+    best, best_assignment = current, list(schedule.assignment)
+    num_tasks, num_vms = len(tasks_mi), len(vm_mips)
+    if num_tasks < 2 or num_vms < 2:
+        return best_assignment, best, schedule.evaluations
+
+    tabu_until = {}  # (task, vm) → first iteration the task may go back to vm
+    log_every = max(1, max_iter // 4)
+
+    for it in range(max_iter):
+        bottleneck = schedule.bottleneck()
+        on_bottleneck = schedule.vm_tasks[bottleneck]
+        sample = on_bottleneck if len(on_bottleneck) <= candidates else rng.sample(on_bottleneck, candidates)
+
+        chosen, chosen_makespan = None, float("inf")
+        for task in sample:
+            for vm in range(num_vms):
+                if vm == bottleneck:
+                    continue
+                makespan = schedule.move_makespan(task, vm)
+                if makespan < chosen_makespan and (tabu_until.get((task, vm), 0) <= it or makespan < best - 1e-12):
+                    chosen, chosen_makespan = ("move", task, vm), makespan
+            other = rng.randrange(num_tasks)
+            other_vm = schedule.assignment[other]
+            if other_vm != bottleneck:
+                makespan = schedule.swap_makespan(task, other)
+                allowed = tabu_until.get((task, other_vm), 0) <= it and tabu_until.get((other, bottleneck), 0) <= it
+                if makespan < chosen_makespan and (allowed or makespan < best - 1e-12):
+                    chosen, chosen_makespan = ("swap", task, other), makespan
+
+        if chosen is None:
+            break
+        kind, task, target = chosen
+        if kind == "move":
+            tabu_until[(task, bottleneck)] = it + tenure
+            schedule.apply_move(task, target)
+        else:
+            tabu_until[(task, bottleneck)] = it + tenure
+            tabu_until[(target, schedule.assignment[target])] = it + tenure
+            schedule.apply_swap(task, target)
+        current = chosen_makespan
+        if current < best - 1e-12:
+            best, best_assignment = current, list(schedule.assignment)
+
+        if logger and it % log_every == 0:
+            logger.log(f"Tabu Iter {it}: current = {current:.3f}s, best makespan = {best:.3f}s")
+
+    return best_assignment, best, schedule.evaluations
+
+def run_tabu(tasks: List[Dict], vm_names: List[str], logger=None, vm_mips: Dict[str, float] = None,
+             max_iter: int = 2000, seed: int = None) -> List[Dict]:
+    """
+    Tabu search scheduler.
+    - tasks: task dicts with "mi" (plain MI numbers are accepted too)
+    - vm_mips: {vm: MIPS}; defaults to the cached .env capacity (utils/vm_capacity.py)
+    """
+    if logger:
+        logger.log("[Tabu Scheduler (LPT start + tabu search)]")
+    else:
+        print("[Tabu Scheduler (LPT start + tabu search)]")
+
+    vm_mips = get_vm_mips(vm_names, vm_mips)
+    tasks_mi = task_mi_list(tasks)
+
+    t0 = time.time()
+    schedule, makespan, evaluations = optimize_tabu(tasks_mi, [vm_mips[vm] for vm in vm_names],
+                                                    max_iter=max_iter, seed=seed, logger=logger)
+    return dispatch_schedule("TABU", schedule, tasks_mi, vm_names, makespan, evaluations, time.time() - t0, logger)
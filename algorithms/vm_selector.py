@@ -0,0 +1,114 @@
+# algorithms/vm_selector.py
+import heapq
+from typing import List, Dict, Tuple
+
+# ----------------------------
+# Shared VM-selection kernel for the list schedulers.
+# Loads are kept in a heap (least-loaded, O(log VMs) per task) or in per-speed
+# heaps under a pruned tournament tree (earliest finish time) instead of
+# scanning every VM per task.
+# ----------------------------
+
+class LeastLoadedSelector:
+    """
+    Picks the VM with the smallest estimated load (seconds of queued work),
+    ties going to the VM listed first - same choice as
+    min(vm_names, key=lambda vm: vm_load[vm]).
+    """
+
+    def __init__(self, vm_names: List[str], vm_mips: Dict[str, float]):
+        self.vm_names = list(vm_names)
+        self.vm_mips = [vm_mips[vm] for vm in self.vm_names]
+        self.heap = [(0.0, idx) for idx in range(len(self.vm_names))]
+        self.vm_load = {vm: 0.0 for vm in self.vm_names}
+
+    def assign(self, task_mi: float) -> Tuple[str, float]:
+        """Place one task; returns (vm, that VM's new load)."""
+        load, idx = self.heap[0]
+        load += task_mi / self.vm_mips[idx]
+        heapq.heapreplace(self.heap, (load, idx))
+        vm = self.vm_names[idx]
+        self.vm_load[vm] = load
+        return vm, load
+
+class EarliestFinishSelector:
+    """
+    Picks the VM where the task would finish first (load + MI / MIPS),
+    ties broken by fewer assigned tasks, then by VM order.
+
+    VMs are grouped by MIPS: inside a group the earliest finish is the heap
+    top (lowest load). The groups are the leaves of a tournament tree,
+    fastest first; each node keeps the smallest (load, task count, vm index)
+    of the group tops below it and its fastest MIPS, so
+    (min load + MI / max MIPS, count, index) bounds every VM under it. A
+    depth-first search follows the better bound and skips subtrees that
+    can't beat the best group found so far. A query costs O(log VMs) for a
+    handful of speeds and stays well below a full scan when every VM has its
+    own (calibrated or learned) speed.
+    """
+
+    def __init__(self, vm_names: List[str], vm_mips: Dict[str, float]):
+        self.vm_names = list(vm_names)
+        self.vm_load = {vm: 0.0 for vm in self.vm_names}
+        self.vm_task_count = {vm: 0 for vm in self.vm_names}
+        groups = {}
+        for idx, vm in enumerate(self.vm_names):
+            groups.setdefault(vm_mips[vm], []).append((0.0, 0, idx))
+        # Heaps of (load, task_count, vm index), fastest group first
+        self.groups = [groups[mips] for mips in sorted(groups, reverse=True)]
+        size = 1
+        while size < max(len(self.groups), 1):
+            size *= 2
+        self.size = size
+        self.mips = [1.0] * (2 * size)  # fastest MIPS under each node (padding leaves never win)
+        self.best = [(float("inf"), 0, -1)] * (2 * size)  # smallest group top under each node
+        for pos, mips in enumerate(sorted(groups, reverse=True)):
+            heapq.heapify(self.groups[pos])
+            self.mips[size + pos] = mips
+            self.best[size + pos] = self.groups[pos][0]
+        for node in range(size - 1, 0, -1):
+            self.mips[node] = max(self.mips[2 * node], self.mips[2 * node + 1])
+            self.best[node] = min(self.best[2 * node], self.best[2 * node + 1])
+
+    def assign(self, task_mi: float) -> Tuple[str, float]:
+        """Place one task; returns (vm, that VM's new load)."""
+        size, best, mips = self.size, self.best, self.mips
+        # Depth-first branch and bound, better child first
+        found = None
+        stack = [1]
+        while stack:
+            node = stack.pop()
+            load, count, idx = best[node]
+            key = (load + task_mi / mips[node], count, idx)
+            if found is not None and key >= found:
+                continue
+            while node < size:
+                left, right = 2 * node, 2 * node + 1
+                load, count, idx = best[left]
+                left_key = (load + task_mi / mips[left], count, idx)
+                load, count, idx = best[right]
+                right_key = (load + task_mi / mips[right], count, idx)
+                if right_key < left_key:
+                    left, right, left_key, right_key = right, left, right_key, left_key
+                if found is None or right_key < found:
+                    stack.append(right)
+                if found is not None and left_key >= found:
+                    node = 0
+                    break
+                node, key = left, left_key
+            if node:
+                found, leaf = key, node
+
+        finish, count, idx = found
+        heap = self.groups[leaf - size]
+        heapq.heapreplace(heap, (finish, count + 1, idx))
+        best[leaf] = heap[0]
+        node = leaf // 2
+        while node:
+            left, right = best[2 * node], best[2 * node + 1]
+            best[node] = left if left < right else right
+            node //= 2
+        vm = self.vm_names[idx]
+        self.vm_load[vm] = finish
+        self.vm_task_count[vm] = count + 1
+        return vm, finish
@@ -0,0 +1,35 @@
+# calibrate_vms.py
+import argparse
+import json
+
+from utils.vm_calibration import (
+    CALIBRATION_CACHE, DEFAULT_MAX_AGE, DEFAULT_PROBE_MI, DEFAULT_RUNS, calibrate
+)
+from utils.vm_capacity import env_vm_cpus
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure effective MI/s of each VM container.")
+    parser.add_argument("--vms", nargs="+", default=None, help="Containers to calibrate (default: VMs from .env)")
+    parser.add_argument("--probe-mi", type=float, default=DEFAULT_PROBE_MI, help="MI per probe run")
+    parser.add_argument("--runs", type=int, default=DEFAULT_RUNS, help="Probe runs per container")
+    parser.add_argument("--max-age", type=float, default=DEFAULT_MAX_AGE, help="Seconds before a cached result is stale")
+    parser.add_argument("--force", action="store_true", help="Ignore the cache and re-measure every VM")
+    parser.add_argument("--cache", type=str, default=CALIBRATION_CACHE, help="Calibration cache file")
+    parser.add_argument("--output", type=str, default=None,
+                        help="Also write {\"vm_mips\": ...} for run_experiment.py --calibration-file")
+    args = parser.parse_args()
+
+    vm_names = args.vms or list(env_vm_cpus().keys())
+    results = calibrate(vm_names, probe_mi=args.probe_mi, runs=args.runs, max_age=args.max_age,
+                        force=args.force, cache_path=args.cache)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({
+                "vm_mips": {vm: entry["mips"] for vm, entry in results.items()},
+                "vm_mips_stdev": {vm: entry["mips_stdev"] for vm, entry in results.items()},
+            }, f, indent=2)
+        print(f"✅ Calibration saved to {args.output}")
+
+if __name__ == "__main__":
+    main()
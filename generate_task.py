@@ -1,38 +1,257 @@
-import random
-import json
-import matplotlib.pyplot as plt
+# generate_task.py
+"""
+Seeded workload generator that streams tasks to disk in chunks.
 
-def generate_tasks(n=50):
+    python generate_task.py                                     # 50 tasks → storage/task/tasks.json
+    python generate_task.py -n 5000000 --distribution pareto --rate 200 \
+        --format ndjson --output storage/task/tasks_5m.ndjson --seed 7 --histogram
+
+Every task is {"mi", "type", "sla", "priority"} plus "arrival" (seconds from
+the start, Poisson) when --rate is given. Each field has its own random
+stream, so the same seed gives the same tasks whatever --chunk-size is.
+"""
+import argparse
+import os
+from typing import List, Dict
+
+import numpy as np
+
+from utils.task_source import TASK_DTYPE, TASK_TYPES
+
+DISTRIBUTIONS = ("mix", "small_mix", "bimodal", "lognormal", "pareto")
+FORMATS = ("json", "ndjson", "npy")
+
+# (share, MI range) of the low/medium/high task classes; like the original
+# generator, a workload holds exactly int(share * n) tasks of every class but
+# the first, which takes the rest, in random order
+# "mix": the original generator's classes, uniform MI in 0.1 MI steps
+MIX_CLASSES = ((0.4, 50, 200), (0.3, 300, 600), (0.3, 800, 1200))
+# "small_mix": the classes of storage/task/tasks.json, integer MI (~10x smaller tasks);
+# bimodal/lognormal/pareto are on this scale and take their types from its bounds
+SMALL_MIX_CLASSES = ((0.4, 5, 20), (0.3, 30, 60), (0.3, 80, 120))
+SLA_RANGE = (5, 20)
+PRIORITY_LEVELS = 5   # 1 = most urgent
+
+def class_counts(classes, n: int) -> List[int]:
+    """Tasks per class in a workload of n: int(share * n), the first class takes the rest."""
+    counts = [int(share * n) for share, _, _ in classes[1:]]
+    return [n - sum(counts)] + counts
+
+def _take_classes(u: np.ndarray, remaining: List[int]) -> np.ndarray:
+    """
+    Class of each next task, drawn without replacement from the `remaining`
+    counts (updated in place): a uniformly shuffled workload with exact counts,
+    one uniform per task.
+    """
+    types = np.empty(len(u), dtype=np.uint8)
+    left = sum(remaining)
+    last = len(remaining) - 1
+    for i, x in enumerate(u.tolist()):
+        t = min(int(x * left), left - 1)
+        c = 0
+        while c < last and t >= remaining[c]:
+            t -= remaining[c]
+            c += 1
+        remaining[c] -= 1
+        left -= 1
+        types[i] = c
+    return types
+
+def _draw_mi(rng_class: np.random.Generator, rng_mi: np.random.Generator, distribution: str, size: int,
+             pareto_alpha: float = 1.5, remaining: List[int] = None):
+    """
+    (mi, type index) for `size` tasks; one draw per task from each stream keeps chunking invisible.
+    remaining: tasks per class still to draw (mix distributions, updated in place).
+    """
+    if distribution in ("mix", "small_mix"):
+        classes = MIX_CLASSES if distribution == "mix" else SMALL_MIX_CLASSES
+        types = _take_classes(rng_class.random(size), remaining)
+        low = np.array([lo for _, lo, _ in classes])[types]
+        high = np.array([hi for _, _, hi in classes])[types]
+        if distribution == "mix":
+            return np.round(low + rng_mi.random(size) * (high - low), 1), types
+        return np.floor(low + rng_mi.random(size) * (high - low + 1)), types
+
+    if distribution == "bimodal":
+        # 70% short tasks around 15 MI, 30% long ones around 100 MI
+        long_task = rng_class.random(size) < 0.3
+        z = rng_mi.standard_normal(size)
+        mi = np.where(long_task, 100 + 15 * z, 15 + 4 * z)
+    elif distribution == "lognormal":
+        mi = rng_mi.lognormal(np.log(20), 1.0, size)
+    else:  # pareto: heavy tail above 5 MI
+        mi = (rng_mi.pareto(pareto_alpha, size) + 1) * 5
+    mi = np.round(np.maximum(mi, 1.0), 1)
+    types = np.digitize(mi, [SMALL_MIX_CLASSES[1][1], SMALL_MIX_CLASSES[2][1]]).astype(np.uint8)
+    return mi, types
+
+def iter_task_chunks(n: int, distribution: str = "mix", seed: int = None, rate: float = None,
+                     chunk_size: int = 100_000, pareto_alpha: float = 1.5):
+    """
+    Yield TASK_DTYPE record arrays of up to `chunk_size` tasks until `n` are made.
+    arrival is 0 for every task when no `rate` is given.
+    """
+    if distribution not in DISTRIBUTIONS:
+        raise ValueError(f"Unknown distribution '{distribution}' (expected one of {DISTRIBUTIONS})")
+    rng_class, rng_mi, rng_sla, rng_priority, rng_arrival = (np.random.default_rng(s)
+                                                             for s in np.random.SeedSequence(seed).spawn(5))
+    clock = 0.0
+    remaining = None
+    if distribution in ("mix", "small_mix"):
+        remaining = class_counts(MIX_CLASSES if distribution == "mix" else SMALL_MIX_CLASSES, n)
+    for offset in range(0, n, chunk_size):
+        size = min(chunk_size, n - offset)
+        chunk = np.empty(size, dtype=TASK_DTYPE)
+        chunk["mi"], chunk["type"] = _draw_mi(rng_class, rng_mi, distribution, size, pareto_alpha, remaining)
+        chunk["sla"] = rng_sla.integers(SLA_RANGE[0], SLA_RANGE[1] + 1, size)
+        chunk["priority"] = rng_priority.integers(1, PRIORITY_LEVELS + 1, size)
+        if rate:
+            gaps = rng_arrival.exponential(1.0 / rate, size)
+            if offset == 0:
+                gaps[0] = 0.0  # first task arrives at t=0
+            arrivals = clock + np.cumsum(gaps)
+            clock = arrivals[-1]
+            chunk["arrival"] = np.round(arrivals, 6)
+        else:
+            chunk["arrival"] = 0.0
+        yield chunk
+
+def chunk_to_dicts(chunk: np.ndarray, with_arrival: bool = True) -> List[Dict]:
+    """Task dicts (the format the schedulers take) from a TASK_DTYPE chunk."""
+    tasks = []
+    for mi, type_idx, sla, priority, arrival in zip(chunk["mi"].tolist(), chunk["type"].tolist(), chunk["sla"].tolist(),
+                                                    chunk["priority"].tolist(), chunk["arrival"].tolist()):
+        task = {"mi": int(mi) if mi.is_integer() else mi, "type": TASK_TYPES[type_idx],
+                "sla": int(sla), "priority": priority}
+        if with_arrival:
+            task["arrival"] = arrival
+        tasks.append(task)
+    return tasks
+
+def _json_lines(chunk: np.ndarray, with_arrival: bool) -> List[str]:
+    """One compact JSON object per task (same content as chunk_to_dicts, without json.dumps per row)."""
+    mi = [str(int(v)) if v.is_integer() else repr(v) for v in chunk["mi"].tolist()]
+    types = [TASK_TYPES[t] for t in chunk["type"].tolist()]
+    sla = chunk["sla"].astype(np.int64).tolist()
+    priority = chunk["priority"].tolist()
+    if with_arrival:
+        return [f'{{"mi":{m},"type":"{t}","sla":{s},"priority":{p},"arrival":{a!r}}}'
+                for m, t, s, p, a in zip(mi, types, sla, priority, chunk["arrival"].tolist())]
+    return [f'{{"mi":{m},"type":"{t}","sla":{s},"priority":{p}}}' for m, t, s, p in zip(mi, types, sla, priority)]
+
+def generate_tasks(n=50, distribution: str = "mix", seed: int = None, rate: float = None) -> List[Dict]:
+    """In-memory task list, for small workloads and tests."""
     tasks = []
-    num_high = int(0.3 * n)
-    num_medium = int(0.3 * n)
-    num_small = n - num_high - num_medium 
-
-    # High MI: 800–1200 MI
-    tasks += [round(random.uniform(800, 1200), 1) for _ in range(num_high)]
-    # Medium MI: 300–600 MI
-    tasks += [round(random.uniform(300, 600), 1) for _ in range(num_medium)]
-    # Small MI: 50–200 MI
-    tasks += [round(random.uniform(50, 200), 1) for _ in range(num_small)]
-
-    random.shuffle(tasks)
+    for chunk in iter_task_chunks(n, distribution, seed, rate):
+        tasks.extend(chunk_to_dicts(chunk, with_arrival=bool(rate)))
     return tasks
 
-def plot_tasks(tasks, save_path="./storage/task/task_distribution.png"):
+class IncrementalHistogram:
+    """Histogram over fixed bin edges, updated one chunk at a time."""
+
+    def __init__(self, edges: np.ndarray):
+        self.edges = edges
+        self.counts = np.zeros(len(edges) - 1, dtype=np.int64)
+        self.underflow = 0
+        self.overflow = 0
+
+    def add(self, values: np.ndarray):
+        self.counts += np.histogram(values, bins=self.edges)[0]
+        self.underflow += int((values < self.edges[0]).sum())
+        self.overflow += int((values > self.edges[-1]).sum())
+
+def histogram_edges(distribution: str) -> np.ndarray:
+    if distribution in ("lognormal", "pareto"):
+        return np.logspace(0, 6, 61)   # 1 MI … 1e6 MI, log bins for heavy tails
+    if distribution == "mix":
+        return np.linspace(0, 1300, 53)
+    return np.linspace(0, 200, 41)
+
+def plot_tasks(histogram: IncrementalHistogram, save_path="./storage/task/task_distribution.png", log_x: bool = False):
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
     plt.figure(figsize=(10, 5))
-    plt.hist(tasks, bins=20, color='skyblue', edgecolor='black')
-    plt.title("Task Workload Distribution (Millions of Instructions)")
+    edges = histogram.edges
+    plt.bar(edges[:-1], histogram.counts, width=np.diff(edges), align="edge", color='skyblue', edgecolor='black')
+    if log_x:
+        plt.xscale("log")
+    title = "Task Workload Distribution (Millions of Instructions)"
+    if histogram.overflow:
+        title += f" — {histogram.overflow} tasks above {edges[-1]:g} MI not shown"
+    plt.title(title)
     plt.xlabel("Task Size (MI)")
     plt.ylabel("Frequency")
     plt.grid(True, linestyle='--', alpha=0.6)
     plt.savefig(save_path)
-    plt.show()
+    plt.close()
     print(f"✅ Task distribution saved to {save_path}")
 
+def write_tasks(path: str, n: int, fmt: str, distribution: str = "mix", seed: int = None, rate: float = None,
+                chunk_size: int = 100_000, pareto_alpha: float = 1.5, histogram: IncrementalHistogram = None) -> int:
+    """Stream `n` generated tasks to `path`; only one chunk is in memory at a time. Returns n."""
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown format '{fmt}' (expected one of {FORMATS})")
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    chunks = iter_task_chunks(n, distribution, seed, rate, chunk_size, pareto_alpha)
+
+    if fmt == "npy":
+        out = np.lib.format.open_memmap(path, mode="w+", dtype=TASK_DTYPE, shape=(n,))
+        offset = 0
+        for chunk in chunks:
+            out[offset:offset + len(chunk)] = chunk
+            offset += len(chunk)
+            if histogram:
+                histogram.add(chunk["mi"])
+        out.flush()
+        del out
+        return n
+
+    with open(path, "w", encoding="utf-8", buffering=1 << 20) as f:
+        if fmt == "json":
+            f.write("[\n")
+        first = True
+        for chunk in chunks:
+            lines = _json_lines(chunk, with_arrival=bool(rate))
+            if fmt == "json":
+                f.write(("" if first else ",\n") + ",\n".join(lines))
+            else:
+                f.write("\n".join(lines) + "\n")
+            first = False
+            if histogram:
+                histogram.add(chunk["mi"])
+        if fmt == "json":
+            f.write("\n]\n")
+    return n
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate a seeded task workload.")
+    parser.add_argument("-n", "--num-tasks", type=int, default=50)
+    parser.add_argument("--distribution", choices=DISTRIBUTIONS, default="mix",
+                        help="mix: the original 50-200/300-600/800-1200 MI classes (exactly 40/30/30%%, shuffled) | "
+                             "small_mix: 5-20/30-60/80-120 MI classes, as in storage/task/tasks.json | "
+                             "bimodal | lognormal (heavy tail) | pareto (the last three on the small_mix scale)")
+    parser.add_argument("--pareto-alpha", type=float, default=1.5, help="Tail index for --distribution pareto")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--rate", type=float, default=None, help="Add Poisson arrival times at this many tasks/s")
+    parser.add_argument("--format", choices=FORMATS, default=None,
+                        help="Output format (default: from the --output extension)")
+    parser.add_argument("--output", default="./storage/task/tasks.json")
+    parser.add_argument("--chunk-size", type=int, default=100_000)
+    parser.add_argument("--histogram", action="store_true", help="Also save task_distribution.png next to the output")
+    args = parser.parse_args()
+
+    fmt = args.format or {".npy": "npy", ".ndjson": "ndjson", ".jsonl": "ndjson"}.get(
+        os.path.splitext(args.output)[1], "json")
+    histogram = IncrementalHistogram(histogram_edges(args.distribution)) if args.histogram else None
+
+    write_tasks(args.output, args.num_tasks, fmt, args.distribution, args.seed, args.rate,
+                args.chunk_size, args.pareto_alpha, histogram)
+    print(f"Generated {args.num_tasks} MI-based tasks ({args.distribution}) → {args.output} [{fmt}]")
+    if histogram:
+        plot_tasks(histogram, os.path.join(os.path.dirname(args.output) or ".", "task_distribution.png"),
+                   log_x=args.distribution in ("lognormal", "pareto"))
+
 if __name__ == "__main__":
-    TASKS = generate_tasks(50)
-    with open("./storage/task/tasks.json", "w") as f:
-        json.dump(TASKS, f)
-    print(f"Generated {len(TASKS)} MI-based tasks.")
-    print("Sample tasks:", TASKS[:10])
-    plot_tasks(TASKS)
+    main()
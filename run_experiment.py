@@ -3,30 +3,55 @@ from dotenv import load_dotenv
 import os
 import json
 import argparse
-from utils.result_saver import create_experiment_dir, save_config, save_results_csv, save_summary_csv
-from utils.logger import ExperimentLogger
-from utils.gantt_plotter import plot_gantt
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+from utils.result_saver import create_experiment_dir, save_config, save_records_csv, save_results_csv, save_summary_csv
+from utils.result_store import ResultSink, makespan as stored_makespan, overhead_summary, read_results
+from utils.logger import ExperimentLogger, LEVELS
+from utils.report_builder import ReportBuilder
+from utils.online_dispatcher import response_metrics
+from utils.catalog import connect as connect_catalog, ingest_experiment
+from utils.task_source import open_task_source, task_mi_array
+from utils.makespan_bounds import optimality_gap, records_planned_makespan, reference_solution
 
 # Import algorithms
-from algorithms.default_algo import run_default
+from algorithms.fcfs import run_fcfs
+from algorithms.sjf import run_sjf
+from algorithms.ljf import run_ljf
+from algorithms.priority_scheduling import run_priority
+from algorithms.storage.greedy import run_greedy
 # from algorithms.first_fit import run_first_fit
-# from algorithms.g_pso import run_g_pso
+from algorithms.g_pso import run_g_pso
+from algorithms.island_pso import run_island_pso
+from algorithms.genetic import run_ga
+from algorithms.simulated_annealing import run_sa
+from algorithms.tabu_search import run_tabu
+from algorithms.online import run_online_fcfs, run_online_sjf, run_online_priority, run_online_greedy
 # from algorithms.g_pso_2 import run_g_pso_2
-from algorithms.greedy import run_greedy
 
-from utils.docker_stats_logger import DockerStatsLogger
-from utils.docker_stats_plotter import plot_docker_stats
-import threading
-import time
+from utils.docker_executor import STEAL_POLICIES, configure_execution, execution_overrides
+from utils.capacity_estimator import get_estimator
+from utils.container_pool import ContainerPool, max_concurrent_pools
+from utils.vm_capacity import CAPACITY_SOURCES, resolve_vm_capacity
+from utils.vm_calibration import calibrated_overheads
 
-def log_docker_stats_periodically(stats_logger, stop_event, interval=0.5):
-    while not stop_event.is_set():
-        stats_logger.log_stats()
-        time.sleep(interval)
+from utils.docker_stats_logger import DockerStatsLogger, STATS_MODES
 
 ALGORITHM_REGISTRY = {
-    "default": run_default,
+    "fcfs": run_fcfs,
+    "sjf": run_sjf,
+    "ljf": run_ljf,
+    "priority": run_priority,
     "greedy": run_greedy,
+    "gpso": run_g_pso,
+    "island_pso": run_island_pso,
+    "ga": run_ga,
+    "sa": run_sa,
+    "tabu": run_tabu,
+    "online_fcfs": run_online_fcfs,
+    "online_sjf": run_online_sjf,
+    "online_priority": run_online_priority,
+    "online_greedy": run_online_greedy,
 }
 
 def main():
@@ -35,89 +60,374 @@ def main():
         "--algorithms",
         nargs="+",
         choices=list(ALGORITHM_REGISTRY.keys()),
-        default=[ "default", "greedy"],
-        help="List of algorithms to run (e.g., --algorithms default greedy)"
+        default=["fcfs", "sjf", "ljf", "priority"],
+        help="List of algorithms to run (e.g., --algorithms fcfs sjf)"
     )
     parser.add_argument(
         "--tasks",
         type=str,
         default="./storage/task/tasks.json",
-        help="Path to tasks JSON file"
+        help="Path to the tasks file: JSON list, .ndjson/.jsonl (one task per line) or .npy (generate_task.py)"
+    )
+    parser.add_argument(
+        "--slots-per-vm",
+        type=int,
+        default=1,
+        help="Max tasks running concurrently inside one container"
+    )
+    parser.add_argument(
+        "--worker",
+        choices=["exec", "daemon"],
+        default="exec",
+        help="exec: one docker exec per task | daemon: persistent worker process per container slot"
+    )
+    parser.add_argument(
+        "--backend",
+        choices=["thread", "async", "sim"],
+        default="thread",
+        help="thread: one OS thread per container slot | async: single asyncio event loop | sim: discrete-event simulation, no Docker"
+    )
+    parser.add_argument(
+        "--work-stealing",
+        choices=["off", *STEAL_POLICIES],
+        default="off",
+        help="thread backend: idle VMs steal queued tasks from a victim picked by this policy"
+    )
+    parser.add_argument(
+        "--batch",
+        type=lambda value: value if value in ("off", "auto") else int(value),
+        default="off",
+        help="thread backend, exec worker: run several queued tasks per docker exec "
+             "('auto': sized from measured exec overhead, or a max batch size)"
+    )
+    parser.add_argument(
+        "--sim-overhead",
+        type=float,
+        default=0.0,
+        help="Per-task dispatch overhead (seconds) added by the sim backend"
+    )
+    parser.add_argument(
+        "--capacity-source",
+        choices=list(CAPACITY_SOURCES),
+        default="env",
+        help="Where VM speeds come from: .env CPU limits, docker inspect quotas, a calibration file, or speeds learned from earlier runs"
+    )
+    parser.add_argument(
+        "--calibration-file",
+        type=str,
+        default=None,
+        help="Calibration JSON with measured MIPS per VM (for --capacity-source calibration; default: cached calibrate_vms.py results)"
+    )
+    parser.add_argument(
+        "--keep-output",
+        action="store_true",
+        help="Keep every task's stdout in memory (stderr is always kept)"
+    )
+    parser.add_argument(
+        "--stream-results",
+        action="store_true",
+        help="Don't keep result dicts in memory: completions only go to <algo>_results.bin (for very large task files)"
+    )
+    parser.add_argument(
+        "--stats-interval",
+        type=float,
+        default=0.5,
+        help="Container stats sample interval in seconds (cgroup mode; down to ~0.01)"
+    )
+    parser.add_argument(
+        "--stats-mode",
+        choices=list(STATS_MODES),
+        default="auto",
+        help="cgroup: read cgroup v2 files directly | stream: one long-lived docker stats session | auto"
+    )
+    parser.add_argument(
+        "--log-level",
+        choices=list(LEVELS),
+        default="DEBUG",
+        help="Minimum log level; per-task lines are DEBUG"
+    )
+    parser.add_argument(
+        "--log-debug-every",
+        type=int,
+        default=1,
+        help="Keep every N-th per-task (DEBUG) log line; 0 suppresses them"
+    )
+    parser.add_argument(
+        "--log-format",
+        choices=["text", "jsonl"],
+        default="text",
+        help="text: schedule_log.txt | jsonl: structured schedule_log.jsonl"
+    )
+    parser.add_argument(
+        "--islands",
+        type=int,
+        default=None,
+        help="island_pso: number of swarms/processes (default: CPU count)"
+    )
+    parser.add_argument(
+        "--migration-interval",
+        type=int,
+        default=20,
+        help="island_pso: iterations between migrations"
+    )
+    parser.add_argument(
+        "--topology",
+        choices=["ring", "full"],
+        default="ring",
+        help="island_pso: migration topology"
+    )
+    parser.add_argument(
+        "--pso-update",
+        choices=["async", "sync"],
+        default="async",
+        help="gpso/island_pso: refresh gbest after every particle (async, as the original G&PSO loop) or once per iteration (sync, batched and faster)"
+    )
+    parser.add_argument(
+        "--arrival-rate",
+        type=float,
+        default=None,
+        help="online_*: Poisson arrival rate in tasks/s (default: the tasks' 'arrival' field, else all at once)"
+    )
+    parser.add_argument(
+        "--arrival-seed",
+        type=int,
+        default=None,
+        help="online_*: seed of the Poisson arrival generator"
+    )
+    parser.add_argument(
+        "--reference-time",
+        type=float,
+        default=2.0,
+        help="Seconds for the reference solver (LPT/MULTIFIT/branch-and-bound) behind the optimality gaps; 0 = lower bounds only"
+    )
+    parser.add_argument(
+        "--parallel-pools",
+        action="store_true",
+        help="Run the algorithms at the same time, each on its own identically-configured container pool"
+    )
+    parser.add_argument(
+        "--report-workers",
+        type=int,
+        default=None,
+        help="Processes rendering charts in the background (default: min(4, CPU count))"
     )
     args = parser.parse_args()
+    if args.backend == "async" and (args.work_stealing != "off" or args.batch != "off"):
+        parser.error("--work-stealing and --batch need the thread backend (--backend thread)")
 
     load_dotenv()
-    
+    configure_execution(slots_per_vm=args.slots_per_vm, worker=args.worker, backend=args.backend,
+                        sim_overhead=args.sim_overhead, keep_output=args.keep_output,
+                        return_results=not args.stream_results,
+                        work_stealing=None if args.work_stealing == "off" else args.work_stealing,
+                        batch=None if args.batch == "off" else args.batch)
+    simulated = args.backend == "sim"
+
     exp_dir = create_experiment_dir()
-    logger = ExperimentLogger(exp_dir)
+    logger = ExperimentLogger(exp_dir, level=LEVELS[args.log_level], debug_every=args.log_debug_every,
+                              json_lines=args.log_format == "jsonl")
 
-    # Load tasks
-    with open(args.tasks, "r") as f:
-        tasks = json.load(f)
+    # Load tasks (.ndjson and .npy files are read lazily, chunk by chunk)
+    tasks = open_task_source(args.tasks)
 
-    # Load VM config from .env
-    vm_config = {f"vm{i+1}": float(os.getenv(f"VM{i+1}_CPUS")) for i in range(5)}
-    vm_names = list(vm_config.keys())
+    # Resolve VM capacity once; every scheduler receives the same vm_mips
+    capacity = resolve_vm_capacity(args.capacity_source, calibration_file=args.calibration_file)
+    vm_config = capacity.vm_cpus
+    vm_names = capacity.vm_names
+    VM_MIPS = capacity.vm_mips
+    configure_execution(vm_mips=VM_MIPS)
 
-    VM_MIPS = {}
-    for i, vm in enumerate(vm_names):
-        cpu_quota = float(os.getenv(f"VM{i+1}_CPUS"))
-        # Linear map: 0.5 → 500, 0.6 → 600, ..., 1.0 → 1000
-        mips = int(500 + (cpu_quota - 0.5) * (1000 - 500) / (1.0 - 0.5))
-        VM_MIPS[vm] = mips
+    # Learn VM speeds from real completions; the next run can start from them (--capacity-source learned)
+    estimator = None if simulated else get_estimator()
+    if estimator is not None:
+        estimator.exec_overhead = calibrated_overheads(vm_names)
+    configure_execution(capacity_estimator=estimator)
 
-    # Ensure task_runner.py is in all containers (one-time setup)
+    # Ensure task_runner.py (and the worker daemon that imports it) is in all containers (one-time setup);
+    # container pools copy it into their own containers
+    use_pools = args.parallel_pools and len(args.algorithms) > 1
     import subprocess
-    for vm in vm_names:
+    for vm in ([] if simulated or use_pools else vm_names):
         subprocess.run(["docker", "cp", "task_runner.py", f"{vm}:/task_runner.py"], check=True)
+        subprocess.run(["docker", "cp", "worker_daemon.py", f"{vm}:/worker_daemon.py"], check=True)
 
     save_config(exp_dir, vm_config, {
         "num_tasks": len(tasks),
         "algorithms_run": args.algorithms,
-        "task_file": args.tasks
+        "task_file": args.tasks,
+        "slots_per_vm": args.slots_per_vm,
+        "worker": args.worker,
+        "backend": args.backend,
+        "work_stealing": args.work_stealing,
+        "batch": args.batch,
+        "vm_mips": VM_MIPS,
+        "capacity_source": capacity.source,
+        "parallel_pools": args.parallel_pools,
+        "stream_results": args.stream_results,
+        "pso_update": args.pso_update,
+        "arrival_rate": args.arrival_rate,
+        "arrival_seed": args.arrival_seed
     })
 
     logger.log(f"🚀 Running experiments with algorithms: {', '.join(args.algorithms)}")
     logger.log(f"Loading {len(tasks)} tasks from {args.tasks}")
 
-    # Run selected algorithms
-    summary = {}
-    all_results = {}
+    # How good could a schedule be? Lower bounds + reference solution, shared by every algorithm's gap
+    tasks_mi = task_mi_array(tasks)
+    reference = reference_solution(tasks_mi, [VM_MIPS[vm] for vm in vm_names], time_limit=args.reference_time)
+    reference.pop("assignment")
+    with open(os.path.join(exp_dir, "reference_solution.json"), "w") as f:
+        json.dump(reference, f, indent=2)
+    if reference["method"] == "none":
+        reason = (f"no reference within --reference-time {args.reference_time:g}s" if reference["timed_out"]
+                  else "reference solver disabled")
+        logger.log(f"📐 Makespan lower bound: {reference['lower_bound']:.3f}s ({reason})")
+    else:
+        logger.log(f"📐 Makespan lower bound: {reference['lower_bound']:.3f}s | reference ({reference['method']}"
+                   f"{', optimal' if reference['optimal'] else ''}): {reference['reference_makespan']:.3f}s "
+                   f"in {reference['elapsed_s']:.2f}s")
+    del tasks_mi
 
-    for algo_name in args.algorithms:
+    # Extra keyword arguments for algorithms that take tuning options
+    algo_kwargs = {
+        "island_pso": {
+            "num_islands": args.islands,
+            "migration_interval": args.migration_interval,
+            "topology": args.topology,
+            "update": args.pso_update,
+        },
+        "gpso": {"update": args.pso_update},
+    }
+    for algo_name in ALGORITHM_REGISTRY:
+        if algo_name.startswith("online_"):
+            algo_kwargs[algo_name] = {"arrival_rate": args.arrival_rate, "seed": args.arrival_seed}
+
+    def execute_algorithm(algo_name, containers=None):
+        """Run one algorithm (optionally on a private container pool); returns its result dicts."""
         algo_func = ALGORITHM_REGISTRY[algo_name]
         logger.log(f"\n▶️  Running {algo_name.upper()}...")
 
-        # Start Docker stats logging
-        stats_logger = DockerStatsLogger(exp_dir, vm_names, algo_name)
-        stop_stats = threading.Event()
-        stats_thread = threading.Thread(
-            target=log_docker_stats_periodically,
-            args=(stats_logger, stop_stats)
-        )
-        stats_thread.start()
+        # Stream completions to <algo>_results.bin while the run is in progress
+        result_sink = ResultSink(exp_dir, algo_name, vm_names)
+        try:
+            with execution_overrides(result_sink=result_sink, vm_aliases=containers):
+                if simulated:
+                    return algo_func(tasks, vm_names, logger, vm_mips=VM_MIPS, **algo_kwargs.get(algo_name, {}))
 
-        results = algo_func(tasks, vm_names, logger)
+                # Start Docker stats logging
+                stats_logger = DockerStatsLogger(exp_dir, list((containers or {}).values()) or vm_names, algo_name,
+                                                 interval=args.stats_interval, mode=args.stats_mode)
+                stats_logger.start()
+                try:
+                    return algo_func(tasks, vm_names, logger, vm_mips=VM_MIPS, **algo_kwargs.get(algo_name, {}))
+                finally:
+                    # Stop stats logging
+                    overhead = stats_logger.stop()
+                    interval_txt = f"{overhead['real_interval_s']:.3f}s" if overhead["real_interval_s"] else "n/a"
+                    child_txt = (f", docker stats {overhead['child_cpu_s']:.3f}s"
+                                 if overhead["child_cpu_s"] is not None else "")
+                    logger.log(f"📈 [{algo_name}] Stats collector ({overhead['mode']}): {overhead['samples']} samples, "
+                               f"real interval {interval_txt}, collector CPU {overhead['collector_cpu_s']:.3f}s "
+                               f"({overhead['cpu_overhead_percent']:.2f}%{child_txt})")
+        finally:
+            result_sink.close()
 
-        # Stop stats logging
-        stop_stats.set()
-        stats_thread.join()
+    def execute_on_pool(algo_name):
+        if simulated:
+            return execute_algorithm(algo_name)
+        pool = ContainerPool(algo_name, vm_config)
+        logger.log(f"🐳 Creating container pool for {algo_name}: {', '.join(pool.containers.values())}")
+        with pool:
+            return execute_algorithm(algo_name, pool.containers)
 
-        plot_docker_stats(exp_dir, algo_name)
+    # Charts are rendered in worker processes from the stored results, so the
+    # next algorithm doesn't wait on matplotlib
+    reports = ReportBuilder(exp_dir, max_workers=args.report_workers, logger=logger)
 
-        start_times = [r["start"] for r in results]
-        end_times = [r["end"] for r in results]
-        makespan = max(end_times) - min(start_times)
+    def report_algorithm(algo_name, results):
+        """Store one finished algorithm's results and queue its charts."""
+        records, stored_vms = read_results(exp_dir, algo_name)
+        makespan = stored_makespan(records)
 
         summary[algo_name] = makespan
         all_results[algo_name] = results
 
-        save_results_csv(exp_dir, results, algo_name)
+        planned = records_planned_makespan(records, stored_vms, VM_MIPS)
+        summary_metrics[algo_name] = {
+            "planned_makespan": planned,
+            "gap_percent": optimality_gap(planned, reference["lower_bound"]),
+            "reference_gap_percent": optimality_gap(planned, reference["reference_makespan"]),
+        }
+        logger.log(f"📏 {algo_name}: planned makespan {planned:.3f}s, "
+                   f"{summary_metrics[algo_name]['gap_percent']:.2f}% above the lower bound")
+
+        overheads = overhead_summary(records)
+        summary_metrics[algo_name].update(overheads)
+        if overheads:
+            o = overheads
+            logger.log(f"🧩 {algo_name} per task: spawn {o['mean_spawn_s'] * 1000:.1f}ms, "
+                       f"startup {o['mean_startup_s'] * 1000:.1f}ms, compute {o['mean_compute_s'] * 1000:.1f}ms, "
+                       f"return {o['mean_return_s'] * 1000:.1f}ms | overhead {o['overhead_percent']:.1f}% of task time")
+
+        if args.stream_results:
+            save_records_csv(exp_dir, records, stored_vms, algo_name)
+        else:
+            save_results_csv(exp_dir, results, algo_name)
+
+        if results and "arrival" in results[0]:
+            metrics = response_metrics(results)
+            with open(os.path.join(exp_dir, f"{algo_name}_online_metrics.json"), "w") as f:
+                json.dump(metrics, f, indent=2)
+            logger.log(f"⏱️  {algo_name}: mean response {metrics['mean_response_s']:.3f}s, "
+                       f"p95 {metrics['p95_response_s']:.3f}s, throughput {metrics['throughput_tps']:.2f} tasks/s")
+
+        reports.submit(algo_name)
+
+        if estimator is not None:
+            estimator.save()
 
-        plot_gantt(results, exp_dir, vm_names, algo_name)
+    # Run selected algorithms
+    summary = {}
+    all_results = {}
+    summary_metrics = {}
+
+    if use_pools:
+        # One private pool of containers per algorithm, run at the same time
+        if simulated:
+            concurrency = len(args.algorithms)
+        else:
+            headroom = max_concurrent_pools(vm_config, len(args.algorithms))
+            concurrency = headroom["pools"]
+            logger.log(f"🧮 Host CPU headroom: {headroom['available_cpus']:.1f} of {headroom['host_cpus']:.0f} CPUs free "
+                       f"(load {headroom['load']:.2f}), {headroom['per_pool_cpus']:.1f} CPUs per pool")
+            if concurrency < len(args.algorithms):
+                logger.warning(f"⚠️ Only {concurrency} pool(s) fit without sharing CPUs; "
+                               f"running {len(args.algorithms)} algorithms in waves of {concurrency}")
+
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            futures = {algo_name: executor.submit(contextvars.copy_context().run, execute_on_pool, algo_name)
+                       for algo_name in args.algorithms}
+            for algo_name, future in futures.items():
+                report_algorithm(algo_name, future.result())
+    else:
+        for algo_name in args.algorithms:
+            report_algorithm(algo_name, execute_algorithm(algo_name))
 
     # Save summary
-    save_summary_csv(exp_dir, summary)
+    save_summary_csv(exp_dir, summary, summary_metrics)
+
+    report = reports.wait()
+    reports.close()
+    logger.log(f"🖼️  Charts: {len(report['rendered'])} rendered, {len(report['skipped'])} unchanged, "
+               f"{len(report['failed'])} failed")
+
+    # Index the finished experiment in results/catalog.sqlite
+    try:
+        catalog = connect_catalog()
+        ingest_experiment(catalog, exp_dir)
+        catalog.close()
+    except Exception as e:
+        logger.warning(f"⚠️ Could not update experiment catalog: {e}")
 
     # Plot Gantt for best-performing algorithm
     if len(all_results) > 0:
@@ -125,7 +435,13 @@ def main():
         logger.log(f"🏆 Best algorithm: {best_algo.upper()} (makespan: {summary[best_algo]:.2f}s)")
         # plot_gantt(all_results[best_algo], exp_dir, vm_names, best_algo)
 
+    if estimator is not None:
+        learned = ", ".join(f"{vm}: {estimator.speed(vm):.1f}±{estimator.uncertainty(vm):.1f}"
+                            for vm in vm_names if estimator.speed(vm) is not None)
+        logger.log(f"🧠 Learned VM speeds (MI/s): {learned}")
+
     logger.log(f"✅ Experiment complete! Results saved to: {exp_dir}")
+    logger.close()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -2,30 +2,98 @@
 import sys
 import time
 
-if len(sys.argv) != 2:
-    print("Usage: python task_runner.py <task_mi>")
-    sys.exit(1)
+PROCESS_START = time.time()  # interpreter is up and this module is being imported
 
-try:
-    task_mi = float(sys.argv[1])
-except ValueError:
-    print("Error: task_mi must be a number (e.g., 1000 for 1000 MI)")
-    sys.exit(1)
+import json
+import os
 
 # Scale MI to loop iterations (e.g., 1 MI = 1000 integer ops)
 # Adjust SCALE_FACTOR to control real runtime (start with 1000)
 SCALE_FACTOR = 1000
-iterations = int(task_mi * SCALE_FACTOR)
 
-print(f"[Task] Executing {task_mi:.1f} MI ({iterations:,} iterations)...")
+# Last stdout line of a run: this prefix + JSON timings (parsed by utils/docker_executor.py)
+TIMINGS_PREFIX = "[Timings] "
 
-start = time.time()
+def process_created() -> float:
+    """
+    Epoch time the kernel created this process (before the interpreter
+    started), from /proc; None where /proc isn't available.
+    Resolution is one clock tick (usually 10 ms).
+    """
+    try:
+        with open("/proc/self/stat", "r") as f:
+            # Field 22 (starttime, in ticks since boot); the name in field 2 may contain spaces
+            fields = f.read().rsplit(")", 1)[1].split()
+        ticks = int(fields[19])
+        boot_epoch = time.time() - time.clock_gettime(time.CLOCK_BOOTTIME)
+        return boot_epoch + ticks / os.sysconf("SC_CLK_TCK")
+    except (OSError, IndexError, ValueError, AttributeError):
+        return None
 
-# CPU-bound computation: integer multiply + add (no I/O, no sleep)
-total = 0
-for i in range(iterations):
-    total += i * i  # This is real work
+def measure_workload(task_mi: float) -> dict:
+    """
+    CPU-bound computation for `task_mi` MI (integer multiply + add, no I/O, no sleep).
+    Returns {"compute_start", "compute_end", "cpu_time"} (epoch seconds / CPU seconds).
+    Shared by the one-shot CLI below and the long-lived worker_daemon.py.
+    """
+    iterations = int(task_mi * SCALE_FACTOR)
+    cpu_start = time.process_time()
+    start = time.time()
 
-end = time.time()
+    total = 0
+    for i in range(iterations):
+        total += i * i  # This is real work
 
-print(f"[Task] Completed {task_mi:.1f} MI in {end - start:.2f} seconds.")
\ No newline at end of file
+    return {"compute_start": start, "compute_end": time.time(), "cpu_time": time.process_time() - cpu_start}
+
+def run_batch(specs: list):
+    """
+    Batch mode: run "<task_id>:<mi>" tasks one after the other in this
+    process and stream one TIMINGS_PREFIX record per task as it finishes.
+    The first record carries the process timings; later ones "received",
+    the moment that task was picked up.
+    """
+    tasks = []
+    for spec in specs:
+        task_id, _, task_mi = spec.partition(":")
+        tasks.append((int(task_id), float(task_mi)))
+
+    for i, (task_id, task_mi) in enumerate(tasks):
+        if i == 0:
+            record = {"task_id": task_id, "process_created": process_created(), "process_start": PROCESS_START}
+        else:
+            record = {"task_id": task_id, "received": time.time()}
+        record.update(measure_workload(task_mi))
+        sys.stdout.write(TIMINGS_PREFIX + json.dumps(record) + "\n")
+        sys.stdout.flush()
+
+def main():
+    if len(sys.argv) > 2 and sys.argv[1] == "--batch":
+        try:
+            run_batch(sys.argv[2:])
+        except ValueError:
+            print("Error: batch tasks must be <task_id>:<task_mi> (e.g., 3:120.5)")
+            sys.exit(1)
+        return
+
+    if len(sys.argv) != 2:
+        print("Usage: python task_runner.py <task_mi> | --batch <task_id>:<task_mi> ...")
+        sys.exit(1)
+
+    try:
+        task_mi = float(sys.argv[1])
+    except ValueError:
+        print("Error: task_mi must be a number (e.g., 1000 for 1000 MI)")
+        sys.exit(1)
+
+    iterations = int(task_mi * SCALE_FACTOR)
+    print(f"[Task] Executing {task_mi:.1f} MI ({iterations:,} iterations)...")
+
+    timings = measure_workload(task_mi)
+    elapsed = timings["compute_end"] - timings["compute_start"]
+
+    print(f"[Task] Completed {task_mi:.1f} MI in {elapsed:.2f} seconds.")
+    print(TIMINGS_PREFIX + json.dumps({"process_created": process_created(), "process_start": PROCESS_START, **timings}))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,6 @@
+# tests/conftest.py
+import os
+import sys
+
+# Tests import the project modules the same way run_experiment.py does
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
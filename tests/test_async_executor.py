@@ -0,0 +1,56 @@
+# tests/test_async_executor.py
+import asyncio
+
+import pytest
+
+from utils import async_executor
+from utils.docker_executor import execution_overrides, run_tasks_parallel
+
+VMS = ("vm1", "vm2")
+
+@pytest.fixture
+def fake_tasks(monkeypatch):
+    """Replace the docker exec of one task with a short sleep; records what ran."""
+    state = {"produced": 0, "finished": 0, "max_ahead": 0, "order": {vm: [] for vm in VMS}}
+
+    async def run_one(vm, task_id, duration, daemon=None, logger=None):
+        await asyncio.sleep(0.001)
+        if duration < 0:
+            raise RuntimeError("task failed")
+        state["finished"] += 1
+        state["order"][vm].append(task_id)
+        return {"task_id": task_id, "vm": vm, "duration": duration}
+
+    monkeypatch.setattr(async_executor, "_run_one", run_one)
+    return state
+
+def schedule(state, n: int, bad: int = None):
+    for tid in range(n):
+        state["produced"] += 1
+        state["max_ahead"] = max(state["max_ahead"], state["produced"] - state["finished"])
+        yield tid, VMS[tid % 2], -1 if tid == bad else 10
+
+def test_iterator_is_consumed_with_bounded_lookahead(fake_tasks):
+    with execution_overrides(backend="async", slots_per_vm=2, max_pending=5):
+        results = run_tasks_parallel(schedule(fake_tasks, 200))
+    assert len(results) == 200
+    # max_pending queued plus one running task per slot (and the one being produced)
+    assert fake_tasks["max_ahead"] <= 5 + 2 * len(VMS) + 1
+    assert fake_tasks["order"]["vm1"] == sorted(fake_tasks["order"]["vm1"])
+
+def test_return_results_false_returns_nothing(fake_tasks):
+    with execution_overrides(backend="async", return_results=False):
+        assert run_tasks_parallel(schedule(fake_tasks, 20)) == []
+    assert fake_tasks["finished"] == 20
+
+def test_failed_task_stops_the_stream(fake_tasks):
+    with execution_overrides(backend="async", max_pending=4):
+        with pytest.raises(RuntimeError, match="task failed"):
+            run_tasks_parallel(schedule(fake_tasks, 500, bad=3))
+    assert fake_tasks["produced"] < 500
+
+@pytest.mark.parametrize("setting", [{"work_stealing": "max_work"}, {"batch": "auto"}])
+def test_thread_only_settings_are_rejected(setting):
+    with execution_overrides(backend="async", **setting):
+        with pytest.raises(ValueError, match="async backend"):
+            run_tasks_parallel([(0, "vm1", 10)])
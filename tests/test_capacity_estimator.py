@@ -0,0 +1,64 @@
+# tests/test_capacity_estimator.py
+import pytest
+
+from utils import docker_executor, vm_calibration
+from utils.capacity_estimator import CapacityEstimator
+from utils.docker_executor import execution_overrides, make_event
+
+MIPS = 400.0
+OVERHEAD = 0.25  # constant docker exec + interpreter overhead (seconds)
+
+def calibrated_mips(monkeypatch) -> dict:
+    """vm_calibration.measure_vm on a container that runs at MIPS with a constant exec overhead."""
+    monkeypatch.setattr(vm_calibration, "_timed_exec", lambda vm, mi: OVERHEAD + mi / MIPS)
+    return vm_calibration.measure_vm("vm1", probe_mi=2000, runs=3)
+
+def timings(start: float, mi: float) -> dict:
+    compute_start = start + 0.2
+    return {"process_start": start + 0.1, "compute_start": compute_start,
+            "compute_end": compute_start + mi / MIPS}
+
+def run_events(estimator, with_timings: bool, stderr: str = ""):
+    with execution_overrides(capacity_estimator=estimator, slots_per_vm=1):
+        start = 100.0
+        for mi in (50, 200, 800, 1600):
+            end = start + OVERHEAD + mi / MIPS
+            make_event(0, "vm1", mi, start, end, "", stderr, logger=_Quiet(),
+                       timings=timings(start, mi) if with_timings else None)
+            start = end
+
+class _Quiet:
+    def log(self, *args, **kwargs):
+        pass
+
+def test_learned_speed_matches_calibration_from_task_timings(monkeypatch):
+    calibration = calibrated_mips(monkeypatch)
+    estimator = CapacityEstimator(path=None)
+    run_events(estimator, with_timings=True)
+    assert estimator.speed("vm1") == pytest.approx(calibration["mips"])
+
+def test_learned_speed_matches_calibration_from_wall_time(monkeypatch):
+    calibration = calibrated_mips(monkeypatch)
+    estimator = CapacityEstimator(path=None)
+    estimator.exec_overhead = {"vm1": calibration["overhead_s"]}
+    run_events(estimator, with_timings=False)
+    assert estimator.speed("vm1") == pytest.approx(calibration["mips"])
+
+def test_failed_tasks_are_not_observed():
+    estimator = CapacityEstimator(path=None)
+    run_events(estimator, with_timings=True, stderr="Traceback ...")
+    assert estimator.speed("vm1") is None
+
+def test_explicit_slot_count_scales_observed_speed(monkeypatch):
+    def two_slot_task(vm, mi, task_id, logger=None):
+        # Two concurrent slots: each task runs at half the container's speed
+        return make_event(task_id, vm, mi, 0.0, 1.0, "", "", logger=_Quiet(),
+                          timings={"process_start": 0.0, "compute_start": 0.0, "compute_end": 2 * mi / MIPS})
+
+    monkeypatch.setattr(docker_executor, "run_single_task_in_vm", two_slot_task)
+    estimator = CapacityEstimator(path=None)
+    with execution_overrides(capacity_estimator=estimator, slots_per_vm=1, backend="thread", worker="exec",
+                             work_stealing=None, batch=None):
+        docker_executor.run_tasks_parallel([(i, "vm1", mi) for i, mi in enumerate((100, 400, 800))],
+                                           logger=_Quiet(), slots_per_vm=2)
+    assert estimator.speed("vm1") == pytest.approx(MIPS)
@@ -0,0 +1,49 @@
+# tests/test_catalog.py
+import os
+import sqlite3
+
+from utils.catalog import connect, ingest_all, makespan_trend, query_runs
+from utils.result_saver import save_config, save_summary_csv
+
+VM_CONFIG = {"vm1": 0.5, "vm2": 0.6, "vm3": 0.7, "vm4": 0.8, "vm5": 1.0}
+
+def make_experiment(root, name: str, backend: str, makespan: float, slots: int = 1):
+    exp_dir = os.path.join(root, f"experiment_{name}")
+    os.makedirs(exp_dir)
+    save_config(exp_dir, VM_CONFIG, {"num_tasks": 100, "backend": backend, "worker": "exec", "slots_per_vm": slots})
+    save_summary_csv(exp_dir, {"fcfs": makespan})
+    return exp_dir
+
+def test_trend_keeps_backends_apart(tmp_path):
+    make_experiment(tmp_path, "sim_a", "sim", 2.0)
+    make_experiment(tmp_path, "sim_b", "sim", 2.2)
+    make_experiment(tmp_path, "docker", "thread", 88.0)
+    conn = connect(str(tmp_path / "catalog.sqlite"))
+    assert ingest_all(conn, str(tmp_path)) == 3
+
+    trend = {row["backend"]: row for row in makespan_trend(conn, algorithm="fcfs")}
+    assert trend["sim"]["runs"] == 2 and abs(trend["sim"]["mean_makespan"] - 2.1) < 1e-9
+    assert trend["thread"]["runs"] == 1 and trend["thread"]["mean_makespan"] == 88.0
+    assert [row["backend"] for row in query_runs(conn, backend="thread")] == ["thread"]
+
+def test_vm_signature_from_docstring_matches(tmp_path):
+    make_experiment(tmp_path, "docker", "thread", 88.0)
+    conn = connect(str(tmp_path / "catalog.sqlite"))
+    ingest_all(conn, str(tmp_path))
+    assert len(query_runs(conn, vm_signature="0.5,0.6,0.7,0.8,1", backend="thread")) == 1
+
+def test_old_catalog_is_migrated_and_reingested(tmp_path):
+    db = str(tmp_path / "catalog.sqlite")
+    old = sqlite3.connect(db)
+    old.executescript("""
+        CREATE TABLE experiments (id INTEGER PRIMARY KEY, dir TEXT UNIQUE NOT NULL, started_at TEXT,
+            num_tasks INTEGER, vm_count INTEGER, vm_signature TEXT, total_cpus REAL, config TEXT, source_mtime REAL);
+        CREATE TABLE runs (experiment_id INTEGER NOT NULL REFERENCES experiments(id) ON DELETE CASCADE,
+            algorithm TEXT NOT NULL, makespan REAL, num_results INTEGER, mean_task_time REAL, metrics TEXT,
+            PRIMARY KEY (experiment_id, algorithm));
+    """)
+    old.close()
+    make_experiment(tmp_path, "sim", "sim", 2.0)
+    conn = connect(db)
+    assert ingest_all(conn, str(tmp_path)) == 1
+    assert [row["backend"] for row in query_runs(conn)] == ["sim"]
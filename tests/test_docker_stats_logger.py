@@ -0,0 +1,28 @@
+# tests/test_docker_stats_logger.py
+import subprocess
+import sys
+
+from utils import docker_stats_logger
+from utils.docker_stats_logger import DockerStatsLogger
+
+# Stands in for `docker stats`: burns CPU while printing frames
+BUSY_STATS = ("import time\n"
+              "end = time.process_time() + 0.3\n"
+              "while time.process_time() < end: pass\n"
+              "print('vm1\\t1.00%\\t1MiB / 2MiB', flush=True)\n"
+              "time.sleep(30)\n")
+
+def test_stream_overhead_includes_the_stats_process(tmp_path, monkeypatch):
+    real_popen = subprocess.Popen
+    monkeypatch.setattr(docker_stats_logger.subprocess, "Popen",
+                        lambda cmd, **kw: real_popen([sys.executable, "-c", BUSY_STATS], **kw))
+    logger = DockerStatsLogger(str(tmp_path), ["vm1"], "fcfs", mode="stream", columnar=False)
+    logger.start()
+    for _ in range(200):
+        if logger.samples:
+            break
+        logger._thread.join(0.05)
+    overhead = logger.stop()
+    assert overhead["child_cpu_s"] >= 0.25
+    assert overhead["collector_cpu_s"] == overhead["thread_cpu_s"] + overhead["child_cpu_s"]
+    assert logger._proc.returncode is not None
@@ -0,0 +1,40 @@
+# tests/test_g_pso.py
+import numpy as np
+import pytest
+
+from algorithms.g_pso import Swarm, compute_makespans, optimize_g_pso
+
+TASKS = np.array([120.0, 75.0, 300.0, 42.0, 980.0, 510.0, 66.0, 250.0, 830.0, 15.0])
+MIPS = np.array([500.0, 600.0, 800.0])
+
+def brute_makespan(schedule, tasks, mips):
+    loads = np.zeros(len(mips))
+    for task, vm in enumerate(schedule):
+        loads[vm] += tasks[task] / mips[vm]
+    return loads.max()
+
+def test_compute_makespans_matches_per_particle_loop():
+    positions = np.random.default_rng(0).integers(0, len(MIPS), size=(25, len(TASKS)))
+    expected = [brute_makespan(p, TASKS, MIPS) for p in positions]
+    assert np.allclose(compute_makespans(positions, TASKS, MIPS), expected)
+
+@pytest.mark.parametrize("update", ["sync", "async"])
+def test_optimize_is_seeded_and_reports_its_schedule(update):
+    first = optimize_g_pso(TASKS, MIPS, num_particles=20, max_iter=30, seed=5, update=update)
+    second = optimize_g_pso(TASKS, MIPS, num_particles=20, max_iter=30, seed=5, update=update)
+    assert np.array_equal(first[0], second[0]) and first[1] == second[1]
+    assert first[1] == pytest.approx(brute_makespan(first[0], TASKS, MIPS))
+
+def test_async_step_refreshes_gbest_after_each_particle():
+    rng = np.random.default_rng(1)
+    swarm = Swarm(15, TASKS, MIPS, rng)
+    gbest, gbest_makespan = swarm.pbest[0].copy(), float(swarm.pbest_makespan[0])
+    makespans, new_gbest, new_makespan = swarm.step_async(gbest, gbest_makespan, rng)
+    assert new_makespan == pytest.approx(min(gbest_makespan, makespans.min()))
+    assert new_makespan == pytest.approx(brute_makespan(new_gbest, TASKS, MIPS))
+    assert np.allclose(swarm.pbest_makespan, [brute_makespan(p, TASKS, MIPS) for p in swarm.pbest])
+
+def test_default_update_is_the_original_per_particle_rule():
+    default = optimize_g_pso(TASKS, MIPS, num_particles=20, max_iter=30, seed=5)
+    per_particle = optimize_g_pso(TASKS, MIPS, num_particles=20, max_iter=30, seed=5, update="async")
+    assert np.array_equal(default[0], per_particle[0]) and default[1] == per_particle[1]
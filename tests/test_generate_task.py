@@ -0,0 +1,46 @@
+# tests/test_generate_task.py
+import numpy as np
+import pytest
+
+import generate_task
+from generate_task import DISTRIBUTIONS, MIX_CLASSES, SMALL_MIX_CLASSES, class_counts, iter_task_chunks, write_tasks
+from utils.task_source import open_task_source
+
+@pytest.mark.parametrize("distribution, classes", [("mix", MIX_CLASSES), ("small_mix", SMALL_MIX_CLASSES)])
+def test_mix_classes_keep_their_ranges_and_shares(distribution, classes):
+    tasks = np.concatenate(list(iter_task_chunks(20_000, distribution, seed=1)))
+    for type_idx, (share, low, high) in enumerate(classes):
+        mi = tasks["mi"][tasks["type"] == type_idx]
+        assert low <= mi.min() and mi.max() <= high
+        assert len(mi) == class_counts(classes, len(tasks))[type_idx]
+
+def test_default_run_matches_the_original_generator(tmp_path, monkeypatch):
+    # Original generator: 50 tasks, 15 in 800-1200 MI, 15 in 300-600 MI, 20 in 50-200 MI, 0.1 MI steps
+    path = tmp_path / "tasks.json"
+    monkeypatch.setattr("sys.argv", ["generate_task.py", "--seed", "3", "--output", str(path)])
+    generate_task.main()
+    mi = np.array([task["mi"] for task in open_task_source(str(path))])
+    assert len(mi) == 50
+    assert [int(((low <= mi) & (mi <= high)).sum()) for low, high in ((50, 200), (300, 600), (800, 1200))] == [20, 15, 15]
+    assert np.array_equal(mi, np.round(mi, 1))
+    # Shuffled, not grouped by class
+    assert not np.array_equal(mi, np.sort(mi)) and not np.array_equal(mi, np.sort(mi)[::-1])
+
+@pytest.mark.parametrize("distribution", DISTRIBUTIONS)
+def test_same_seed_same_tasks_whatever_the_chunk_size(distribution):
+    whole = np.concatenate(list(iter_task_chunks(5_000, distribution, seed=7, rate=50.0, chunk_size=5_000)))
+    for chunk_size in (1, 333, 4_096):
+        chunked = np.concatenate(list(iter_task_chunks(5_000, distribution, seed=7, rate=50.0, chunk_size=chunk_size)))
+        for field in ("mi", "type", "sla", "priority"):
+            assert np.array_equal(whole[field], chunked[field])
+        assert np.allclose(whole["arrival"], chunked["arrival"])
+
+@pytest.mark.parametrize("fmt", ["json", "ndjson", "npy"])
+def test_written_files_do_not_depend_on_chunk_size(tmp_path, fmt):
+    files = []
+    for chunk_size in (64, 1_000):
+        path = str(tmp_path / f"tasks_{chunk_size}.{fmt}")
+        write_tasks(path, 1_000, fmt, seed=11, chunk_size=chunk_size)
+        files.append(path)
+    loaded = [list(open_task_source(path)) for path in files]
+    assert loaded[0] == loaded[1]
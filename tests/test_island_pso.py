@@ -0,0 +1,17 @@
+# tests/test_island_pso.py
+import numpy as np
+import pytest
+
+from algorithms.island_pso import optimize_island_pso
+
+TASKS = np.array([120.0, 75.0, 300.0, 42.0, 980.0, 510.0, 66.0, 250.0, 830.0, 15.0])
+MIPS = np.array([500.0, 600.0, 800.0])
+
+def test_spawned_islands_are_seeded_and_report_their_schedule():
+    kwargs = dict(num_islands=2, migration_interval=5, num_particles=10, max_iter=20, seed=3)
+    schedule, makespan, per_island = optimize_island_pso(TASKS, MIPS, **kwargs)
+    again = optimize_island_pso(TASKS, MIPS, **kwargs)
+    assert np.array_equal(schedule, again[0]) and makespan == again[1]
+    loads = np.zeros(len(MIPS))
+    np.add.at(loads, schedule, TASKS / MIPS[schedule])
+    assert makespan == pytest.approx(loads.max()) == min(per_island)
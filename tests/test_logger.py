@@ -0,0 +1,25 @@
+# tests/test_logger.py
+import pytest
+
+from utils.logger import ExperimentLogger
+
+def test_flush_writes_queued_lines(tmp_path):
+    logger = ExperimentLogger(str(tmp_path), console=False)
+    logger.log("hello")
+    logger.flush()
+    assert (tmp_path / "schedule_log.txt").read_text(encoding="utf-8").endswith("hello\n")
+    logger.close()
+
+def test_flush_and_close_surface_writer_failure(tmp_path):
+    logger = ExperimentLogger(str(tmp_path), console=False)
+
+    def disk_full(_text):
+        raise OSError(28, "No space left on device")
+
+    logger._file.write = disk_full
+    logger.log("lost")
+    with pytest.raises(RuntimeError) as err:
+        logger.flush(timeout=5)
+    assert isinstance(err.value.__cause__, OSError)
+    with pytest.raises(RuntimeError):
+        logger.close()
@@ -0,0 +1,76 @@
+# tests/test_makespan_bounds.py
+import itertools
+import random
+import time
+
+import numpy as np
+import pytest
+
+from utils.makespan_bounds import (branch_and_bound, lower_bounds, lpt_schedule, multifit_schedule,
+                                   optimality_gap, planned_makespan, reference_solution)
+
+def exhaustive_optimum(tasks_mi, vm_mips) -> float:
+    return min(planned_makespan(list(assignment), tasks_mi, vm_mips)
+               for assignment in itertools.product(range(len(vm_mips)), repeat=len(tasks_mi)))
+
+def small_instances(count: int = 60):
+    rng = random.Random(0)
+    for _ in range(count):
+        tasks_mi = [rng.choice([rng.randint(1, 20), rng.uniform(1, 100)]) for _ in range(rng.randint(1, 8))]
+        vm_mips = [rng.choice([1.0, 2.0, 3.0, rng.uniform(0.5, 4.0)]) for _ in range(rng.randint(1, 3))]
+        yield tasks_mi, vm_mips
+
+def test_branch_and_bound_finds_the_exhaustive_optimum():
+    for tasks_mi, vm_mips in small_instances():
+        optimum = exhaustive_optimum(tasks_mi, vm_mips)
+        bounds = lower_bounds(tasks_mi, vm_mips)
+        assert bounds["fluid"] <= bounds["best"] <= optimum * (1 + 1e-9)
+        assert bounds["preemptive"] <= optimum * (1 + 1e-9)
+        assert bounds["pigeonhole"] <= optimum * (1 + 1e-9)
+
+        incumbent, incumbent_makespan = lpt_schedule(tasks_mi, vm_mips)
+        assignment, makespan, proved = branch_and_bound(tasks_mi, vm_mips, list(incumbent), incumbent_makespan,
+                                                        bounds["best"], time_limit=10.0)
+        assert proved
+        assert makespan == pytest.approx(optimum)
+        assert planned_makespan(assignment, tasks_mi, vm_mips) == pytest.approx(optimum)
+
+def test_heuristics_return_the_makespan_of_their_schedule():
+    for tasks_mi, vm_mips in small_instances(30):
+        optimum = exhaustive_optimum(tasks_mi, vm_mips)
+        assignment, makespan = lpt_schedule(tasks_mi, vm_mips)
+        assert makespan == pytest.approx(planned_makespan(assignment, tasks_mi, vm_mips))
+        assert makespan >= optimum * (1 - 1e-9)
+        packed, packed_makespan = multifit_schedule(tasks_mi, vm_mips)
+        if packed is not None:
+            assert packed_makespan == pytest.approx(planned_makespan(packed, tasks_mi, vm_mips))
+            assert packed_makespan >= optimum * (1 - 1e-9)
+
+def test_reference_solution_is_proven_optimal_on_small_instances():
+    for tasks_mi, vm_mips in small_instances(20):
+        reference = reference_solution(tasks_mi, vm_mips, time_limit=10.0)
+        assert reference["optimal"]
+        assert reference["reference_makespan"] == pytest.approx(exhaustive_optimum(tasks_mi, vm_mips))
+        assert reference["lower_bound"] == pytest.approx(reference["reference_makespan"])
+
+def test_bounds_only_without_a_time_budget():
+    reference = reference_solution([5, 7, 9], [1.0, 2.0], time_limit=0)
+    assert reference["method"] == "none" and reference["assignment"] == []
+    assert reference["reference_makespan"] != reference["reference_makespan"]  # NaN
+
+def test_optimality_gap():
+    assert optimality_gap(110.0, 100.0) == pytest.approx(10.0)
+    assert optimality_gap(100.0, 100.0) == 0.0
+    assert optimality_gap(1.0, float("nan")) != optimality_gap(1.0, float("nan"))
+
+def test_reference_solution_keeps_to_its_time_budget():
+    tasks_mi = np.random.default_rng(0).uniform(50, 1200, 300_000)
+    vm_mips = [500.0, 600.0, 800.0, 1000.0, 1200.0]
+    started = time.time()
+    reference = reference_solution(tasks_mi, vm_mips, time_limit=0.05)
+    assert time.time() - started < 2.0
+    assert reference["timed_out"] and reference["method"] in ("none", "lpt")
+    assert reference["lower_bound"] == lower_bounds(tasks_mi, vm_mips)["best"]
+    started = time.time()
+    assert multifit_schedule(tasks_mi, vm_mips, deadline=time.time() + 0.05)[0] is None
+    assert time.time() - started < 2.0
@@ -0,0 +1,15 @@
+# tests/test_online_dispatcher.py
+import pytest
+
+from utils.online_dispatcher import ONLINE_POLICIES, arrival_times, simulate_online
+
+VM_MIPS = {"vm1": 500.0, "vm2": 1000.0}
+
+@pytest.mark.parametrize("policy", ONLINE_POLICIES)
+def test_plain_mi_lists_run_as_a_batch(policy):
+    tasks = [1000, 500, 250.5, 2000]
+    arrivals = arrival_times(tasks)
+    assert arrivals.tolist() == [0.0] * len(tasks)
+    results = simulate_online(tasks, arrivals, policy, VM_MIPS)
+    assert sorted((r["task_id"], r["duration"]) for r in results) == list(enumerate(tasks))
+    assert all(r["end"] - r["start"] == pytest.approx(r["duration"] / VM_MIPS[r["vm"]]) for r in results)
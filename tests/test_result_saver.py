@@ -0,0 +1,14 @@
+# tests/test_result_saver.py
+import csv
+
+from utils.result_saver import save_summary_csv
+
+def test_summary_writes_blank_for_nan_and_no_negative_zero(tmp_path):
+    save_summary_csv(str(tmp_path), {"fcfs": 1.948, "sa": 1.95},
+                     {"fcfs": {"gap_percent": -1e-12, "reference_gap_percent": float("nan")},
+                      "sa": {"gap_percent": 0.022512, "reference_gap_percent": 0.0}})
+    with open(tmp_path / "makespan_summary.csv", newline="") as f:
+        rows = {row["Algorithm"]: row for row in csv.DictReader(f)}
+    assert rows["fcfs"]["Gap vs lower bound (%)"] == "0.0"
+    assert rows["fcfs"]["Gap vs reference (%)"] == ""
+    assert rows["sa"]["Gap vs lower bound (%)"] == "0.0225"
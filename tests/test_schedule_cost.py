@@ -0,0 +1,101 @@
+# tests/test_schedule_cost.py
+import random
+
+import numpy as np
+import pytest
+
+from algorithms.genetic import apply_gene_moves, optimize_ga, population_loads
+from algorithms.schedule_cost import IncrementalSchedule, descend, initial_assignment
+from algorithms.simulated_annealing import optimize_sa
+from algorithms.tabu_search import optimize_tabu
+
+def loads_of(assignment, tasks_mi, vm_mips):
+    loads = [0.0] * len(vm_mips)
+    for task, vm in enumerate(assignment):
+        loads[vm] += tasks_mi[task] / vm_mips[vm]
+    return loads
+
+def instance(rng, num_tasks=60, num_vms=6):
+    tasks_mi = [rng.uniform(5, 1200) for _ in range(num_tasks)]
+    vm_mips = [rng.choice([500.0, 600.0, 700.0, 800.0, 1000.0]) for _ in range(num_vms)]
+    return tasks_mi, vm_mips
+
+def test_incremental_schedule_matches_brute_force_recompute():
+    rng = random.Random(0)
+    tasks_mi, vm_mips = instance(rng)
+    schedule = IncrementalSchedule(tasks_mi, vm_mips, [rng.randrange(len(vm_mips)) for _ in tasks_mi])
+    for _ in range(3000):
+        task, other = rng.randrange(len(tasks_mi)), rng.randrange(len(tasks_mi))
+        if rng.random() < 0.5:
+            vm = rng.randrange(len(vm_mips))
+            predicted = schedule.move_makespan(task, vm)
+            schedule.apply_move(task, vm)
+        else:
+            predicted = schedule.swap_makespan(task, other)
+            schedule.apply_swap(task, other)
+        loads = loads_of(schedule.assignment, tasks_mi, vm_mips)
+        assert predicted == pytest.approx(max(loads))
+        assert schedule.makespan() == pytest.approx(max(loads))
+        assert schedule.loads == pytest.approx(loads)
+        assert loads[schedule.bottleneck()] == pytest.approx(max(loads))
+        for vm, on_vm in enumerate(schedule.vm_tasks):
+            assert sorted(on_vm) == [t for t, v in enumerate(schedule.assignment) if v == vm]
+    assert len(schedule.heap) <= 4 * len(vm_mips) + 16 + 2
+
+def test_evaluating_a_move_does_not_change_the_schedule():
+    rng = random.Random(1)
+    tasks_mi, vm_mips = instance(rng, 20, 4)
+    schedule = IncrementalSchedule(tasks_mi, vm_mips, initial_assignment(tasks_mi, vm_mips))
+    before = (list(schedule.assignment), list(schedule.loads), schedule.makespan())
+    for task in range(len(tasks_mi)):
+        schedule.move_makespan(task, (schedule.assignment[task] + 1) % len(vm_mips))
+        schedule.swap_makespan(task, (task + 1) % len(tasks_mi))
+    assert (list(schedule.assignment), list(schedule.loads), schedule.makespan()) == before
+
+def test_initial_assignment_is_lpt_onto_earliest_finish():
+    rng = random.Random(2)
+    tasks_mi, vm_mips = instance(rng, 40, 5)
+    loads = [0.0] * len(vm_mips)
+    expected = [0] * len(tasks_mi)
+    for task in sorted(range(len(tasks_mi)), key=lambda t: -tasks_mi[t]):
+        vm = min(range(len(vm_mips)), key=lambda v: loads[v] + tasks_mi[task] / vm_mips[v])
+        loads[vm] += tasks_mi[task] / vm_mips[vm]
+        expected[task] = vm
+    assert initial_assignment(tasks_mi, vm_mips) == expected
+
+def test_descend_never_makes_the_schedule_worse():
+    rng = random.Random(3)
+    tasks_mi, vm_mips = instance(rng)
+    schedule = IncrementalSchedule(tasks_mi, vm_mips, [0] * len(tasks_mi))
+    start = schedule.makespan()
+    result = descend(schedule, 5000, rng)
+    assert result <= start
+    assert result == pytest.approx(max(loads_of(schedule.assignment, tasks_mi, vm_mips)))
+
+@pytest.mark.parametrize("optimize, options", [
+    (optimize_ga, {"population": 20, "generations": 30}),
+    (optimize_sa, {"max_iter": 5000}),
+    (optimize_tabu, {"max_iter": 300}),
+])
+def test_searches_are_seeded_and_never_worse_than_lpt(optimize, options):
+    rng = random.Random(4)
+    tasks_mi, vm_mips = instance(rng, 80, 6)
+    lpt = max(loads_of(initial_assignment(tasks_mi, vm_mips), tasks_mi, vm_mips))
+    first = optimize(tasks_mi, vm_mips, seed=9, **options)
+    second = optimize(tasks_mi, vm_mips, seed=9, **options)
+    assert list(first[0]) == list(second[0]) and first[1] == second[1]
+    assert first[1] == pytest.approx(max(loads_of(first[0], tasks_mi, vm_mips)))
+    assert first[1] <= lpt + 1e-9
+
+def test_ga_gene_moves_match_a_full_rescore():
+    rng = np.random.default_rng(2)
+    tasks, mips = rng.random(300) * 100 + 1, np.array([500.0, 600.0, 800.0, 1000.0])
+    parents = rng.integers(0, len(mips), size=(12, 300))
+    children = parents.copy()
+    mutate = rng.random(children.shape) < 0.05
+    children[mutate] = rng.integers(0, len(mips), size=int(mutate.sum()))
+    loads = population_loads(parents, tasks, mips)
+    rows, genes = np.nonzero(mutate)
+    apply_gene_moves(loads, rows, genes, parents[rows, genes], children[rows, genes], tasks, mips)
+    assert np.allclose(loads, population_loads(children, tasks, mips))
+    assert np.allclose(loads.max(axis=1), [max(loads_of(c, tasks, mips)) for c in children])
@@ -0,0 +1,49 @@
+# tests/test_simulator.py
+import random
+
+import pytest
+
+from utils.result_store import ResultSink, read_results
+from utils.simulator import iter_simulated_events, simulate_tasks
+
+VM_MIPS = {"vm1": 500.0, "vm2": 1000.0}
+
+def schedule(n: int, seed: int = 0):
+    rng = random.Random(seed)
+    return [(tid, rng.choice(list(VM_MIPS)), rng.uniform(5, 1200)) for tid in range(n)]
+
+def brute_force(assignments, slots: int, overhead: float):
+    """Per VM: each task starts on the slot that frees up first (FIFO), at 1/slots of the VM's speed."""
+    free = {vm: [0.0] * slots for vm in VM_MIPS}
+    events = {}
+    for tid, vm, mi in assignments:
+        slot = min(range(slots), key=lambda s: free[vm][s])
+        start = free[vm][slot]
+        free[vm][slot] = start + overhead + mi / (VM_MIPS[vm] / slots)
+        events[tid] = (vm, start, free[vm][slot])
+    return events
+
+@pytest.mark.parametrize("slots", [1, 3])
+def test_events_match_a_brute_force_timeline(slots):
+    assignments = schedule(300)
+    expected = brute_force(assignments, slots, 0.05)
+    events = list(iter_simulated_events(iter(assignments), VM_MIPS, slots, 0.05))
+    assert [e["task_id"] for e in events] == [tid for tid, _, _ in assignments]
+    for event in events:
+        vm, start, end = expected[event["task_id"]]
+        assert event["vm"] == vm
+        assert event["start"] == pytest.approx(start) and event["end"] == pytest.approx(end)
+
+def test_unknown_vm_is_rejected():
+    with pytest.raises(ValueError, match="vm9"):
+        simulate_tasks([(0, "vm9", 10)], VM_MIPS)
+
+def test_keep_false_returns_nothing_but_fills_the_sink(tmp_path):
+    assignments = schedule(50)
+    sink = ResultSink(str(tmp_path), "fcfs", list(VM_MIPS))
+    assert simulate_tasks(iter(assignments), VM_MIPS, sink=sink, keep=False) == []
+    sink.close()
+    records, vm_names = read_results(str(tmp_path), "fcfs")
+    assert sorted(records["task_id"].tolist()) == list(range(50))
+    kept = simulate_tasks(assignments, VM_MIPS)
+    assert records["end"].max() == pytest.approx(max(event["end"] for event in kept))
@@ -0,0 +1,59 @@
+# tests/test_task_source.py
+import os
+import random
+
+import numpy as np
+import pytest
+
+from generate_task import write_tasks
+from utils.task_source import TaskSource, iter_task_tuples, open_task_source, sorted_task_tuples
+
+def task_dicts(n: int, seed: int = 0):
+    rng = random.Random(seed)
+    # Few distinct values, so ties (ordered by task_id) are common
+    return [{"mi": rng.choice([5, 10, 12.5, 40, 100]), "sla": rng.choice([2, 5, 10])} for _ in range(n)]
+
+def expected_order(tasks, key: str, reverse: bool):
+    def sort_key(i):
+        value = tasks[i]["mi"] if key == "mi" else tasks[i]["mi"] / tasks[i]["sla"]
+        return (-value if reverse else value, i)
+    return [(i, tasks[i]["mi"], tasks[i]["sla"]) for i in sorted(range(len(tasks)), key=sort_key)]
+
+@pytest.mark.parametrize("key", ["mi", "mi_per_sla"])
+@pytest.mark.parametrize("reverse", [False, True])
+@pytest.mark.parametrize("chunk_size", [7, 100, 10_000])
+def test_sorted_tuples_match_a_stable_in_memory_sort(tmp_path, key, reverse, chunk_size):
+    tasks = task_dicts(1_000)
+    result = list(sorted_task_tuples(tasks, key=key, reverse=reverse, chunk_size=chunk_size, tmp_dir=str(tmp_path)))
+    assert result == expected_order(tasks, key, reverse)
+    assert os.listdir(tmp_path) == []  # spilled runs are cleaned up
+
+def test_sorted_tuples_from_a_task_file(tmp_path):
+    path = str(tmp_path / "tasks.npy")
+    write_tasks(path, 2_000, "npy", seed=5)
+    source = open_task_source(path)
+    result = list(sorted_task_tuples(source, key="mi", chunk_size=256, tmp_dir=str(tmp_path)))
+    mi = [task["mi"] for task in source]
+    assert [task_id for task_id, _, _ in result] == sorted(range(len(mi)), key=lambda i: (mi[i], i))
+    assert all(isinstance(value, int) or not float(value).is_integer() for _, value, _ in result)
+
+@pytest.mark.parametrize("fmt", ["json", "ndjson", "npy"])
+def test_every_format_yields_the_same_tuples(tmp_path, fmt):
+    path = str(tmp_path / f"tasks.{fmt}")
+    write_tasks(path, 500, fmt, seed=2)
+    source = open_task_source(path)
+    assert len(source) == 500
+    tuples = list(iter_task_tuples(source))
+    reference = [(i, task["mi"], task["sla"]) for i, task in enumerate(open_task_source(path))]
+    assert tuples == reference
+    assert np.allclose([mi for _, mi, _ in tuples], [task["mi"] for task in source])
+
+def test_ndjson_len_counts_tasks_not_newlines(tmp_path):
+    path = tmp_path / "tasks.ndjson"
+    path.write_text('{"mi": 5}\n\n{"mi": 7}\n  \n{"mi": 9}')
+    source = open_task_source(str(path))
+    assert len(source) == len(list(source)) == 3
+
+def test_task_source_base_is_abstract():
+    with pytest.raises(TypeError):
+        TaskSource("tasks.json")
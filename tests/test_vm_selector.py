@@ -0,0 +1,42 @@
+# tests/test_vm_selector.py
+import random
+
+import pytest
+
+from algorithms.vm_selector import EarliestFinishSelector, LeastLoadedSelector
+
+# Power-of-two speeds and integer MI keep every load exact, so ties are real ties
+SPEED_MIXES = {
+    "one_speed": lambda rng, n: [4.0] * n,
+    "few_speeds": lambda rng, n: [rng.choice([2.0, 4.0, 8.0]) for _ in range(n)],
+    "distinct": lambda rng, n: [2.0 ** rng.randint(-6, 6) for _ in range(n)],
+}
+
+def scan_earliest_finish(vm_names, vm_mips, vm_load, vm_task_count, task_mi):
+    """The original greedy loop: every VM's (finish, task count), first listed wins ties."""
+    return min(vm_names, key=lambda vm: (vm_load[vm] + task_mi / vm_mips[vm], vm_task_count[vm]))
+
+@pytest.mark.parametrize("mix", sorted(SPEED_MIXES))
+def test_earliest_finish_matches_full_scan(mix):
+    rng = random.Random(7)
+    for _ in range(50):
+        vm_names = [f"vm{i}" for i in range(rng.randint(1, 40))]
+        vm_mips = dict(zip(vm_names, SPEED_MIXES[mix](rng, len(vm_names))))
+        selector = EarliestFinishSelector(vm_names, vm_mips)
+        for _ in range(200):
+            task_mi = rng.randint(0, 64)
+            expected = scan_earliest_finish(vm_names, vm_mips, selector.vm_load, selector.vm_task_count, task_mi)
+            finish = selector.vm_load[expected] + task_mi / vm_mips[expected]
+            assert selector.assign(task_mi) == (expected, finish)
+
+def test_least_loaded_matches_full_scan():
+    rng = random.Random(3)
+    vm_names = [f"vm{i}" for i in range(17)]
+    vm_mips = dict(zip(vm_names, SPEED_MIXES["distinct"](rng, len(vm_names))))
+    selector = LeastLoadedSelector(vm_names, vm_mips)
+    vm_load = dict.fromkeys(vm_names, 0.0)
+    for _ in range(2000):
+        task_mi = rng.randint(0, 64)
+        vm = min(vm_names, key=lambda v: vm_load[v])
+        vm_load[vm] += task_mi / vm_mips[vm]
+        assert selector.assign(task_mi) == (vm, vm_load[vm])
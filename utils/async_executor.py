@@ -0,0 +1,135 @@
+# utils/async_executor.py
+import asyncio
+import json
+import time
+from typing import List, Dict
+
+from utils.docker_executor import container_name, execution_setting, make_event, parse_task_timings
+
+class AsyncVMWorkerDaemon:
+    """asyncio twin of docker_executor.VMWorkerDaemon (one worker_daemon.py per slot)."""
+
+    def __init__(self, vm: str, proc):
+        self.vm = vm
+        self.proc = proc
+
+    @classmethod
+    async def start(cls, vm: str) -> "AsyncVMWorkerDaemon":
+        proc = await asyncio.create_subprocess_exec(
+            "docker", "exec", "-i", container_name(vm), "python3", "-u", "/worker_daemon.py",
+            stdin=asyncio.subprocess.PIPE, stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL
+        )
+        return cls(vm, proc)
+
+    async def run(self, task_id: int, duration: float) -> Dict:
+        self.proc.stdin.write((json.dumps({"task_id": task_id, "mi": duration}) + "\n").encode())
+        await self.proc.stdin.drain()
+        line = await self.proc.stdout.readline()
+        if not line:
+            raise RuntimeError(f"[{self.vm}] worker daemon exited (code {self.proc.returncode})")
+        return json.loads(line)
+
+    async def close(self):
+        if self.proc.returncode is None:
+            try:
+                self.proc.stdin.write((json.dumps({"cmd": "stop"}) + "\n").encode())
+                self.proc.stdin.close()
+                await asyncio.wait_for(self.proc.wait(), timeout=5)
+            except (OSError, asyncio.TimeoutError):
+                self.proc.kill()
+
+async def _run_one(vm: str, task_id: int, duration: float, daemon: AsyncVMWorkerDaemon = None,
+                   logger=None) -> Dict:
+    if daemon is not None:
+        start = time.time()
+        reply = await daemon.run(task_id, duration)
+        end = time.time()
+        stdout, stderr, timings = reply.get("stdout", ""), reply.get("stderr", ""), reply
+    else:
+        start = time.time()
+        proc = await asyncio.create_subprocess_exec(
+            "docker", "exec", container_name(vm), "python3", "/task_runner.py", str(duration),
+            stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
+        )
+        out, err = await proc.communicate()
+        end = time.time()
+        stdout, timings = parse_task_timings(out.decode().strip())
+        stderr = err.decode().strip()
+        if proc.returncode != 0 and not stderr:
+            stderr = f"task_runner.py exited with code {proc.returncode}"
+
+    return make_event(task_id, vm, duration, start, end, stdout, stderr, logger, timings)
+
+async def _drain_slot(vm: str, queue: asyncio.Queue, pending: asyncio.Semaphore, results: List[Dict],
+                      failures: List[BaseException], worker: str, keep: bool, logger=None):
+    """One execution slot of a VM: runs its queue's tasks in order until the None sentinel."""
+    daemon = None
+    try:
+        while True:
+            item = await queue.get()
+            if item is None:
+                return
+            pending.release()
+            if worker == "daemon" and daemon is None:
+                daemon = await AsyncVMWorkerDaemon.start(vm)
+            event = await _run_one(vm, *item, daemon, logger)
+            if keep:
+                results.append(event)
+    except Exception as e:
+        failures.append(e)
+        # Keep taking this VM's tasks so the producer never waits on a dead slot
+        while await queue.get() is not None:
+            pending.release()
+    finally:
+        if daemon is not None:
+            await daemon.close()
+
+async def _run_stream(assignments, logger, slots_per_vm: int, worker: str, max_pending: int,
+                      keep: bool) -> List[Dict]:
+    pending = asyncio.Semaphore(max(1, max_pending))  # tasks queued ahead of execution
+    queues = {}
+    slots = []
+    results = []
+    failures = []
+    try:
+        for count, (tid, vm, duration) in enumerate(assignments):
+            if failures:
+                raise failures[0]
+            queue = queues.get(vm)
+            if queue is None:
+                queue = queues[vm] = asyncio.Queue()
+                slots += [asyncio.create_task(_drain_slot(vm, queue, pending, results, failures, worker, keep,
+                                                          logger))
+                          for _ in range(slots_per_vm)]
+            await pending.acquire()
+            queue.put_nowait((tid, duration))
+            if count % 256 == 255:
+                await asyncio.sleep(0)  # let slots start while a long schedule is still being read
+        for queue in queues.values():
+            for _ in range(slots_per_vm):
+                queue.put_nowait(None)
+        await asyncio.gather(*slots)
+    finally:
+        for slot in slots:
+            slot.cancel()  # only still running if the producer failed
+        await asyncio.gather(*slots, return_exceptions=True)
+    if failures:
+        raise failures[0]
+    return results
+
+def run_tasks_async(assignments, logger=None, slots_per_vm: int = 1, worker: str = "exec") -> List[Dict]:
+    """
+    asyncio backend for run_tasks_parallel: one event loop drives every container.
+    assignments = [(task_id, vm, duration), ...] in scheduler order, as a list
+    or an iterator. Like the thread backend's streaming mode, tasks go into one
+    FIFO queue per VM drained by `slots_per_vm` slot coroutines, and at most
+    `max_pending` tasks are queued ahead of execution, so a long schedule is
+    read as it runs instead of becoming one coroutine per task up front.
+    Returns the same event dicts (task_id, vm, duration, start, end, stdout,
+    stderr) as the thread backend ([] with return_results=False).
+    Work stealing and batching are thread-backend features (run_tasks_parallel
+    rejects them here).
+    """
+    return asyncio.run(_run_stream(assignments, logger, slots_per_vm, worker, execution_setting("max_pending"),
+                                   execution_setting("return_results")))
@@ -0,0 +1,95 @@
+# utils/capacity_estimator.py
+import json
+import math
+import os
+import threading
+import time
+from typing import List, Dict
+
+LEARNED_CAPACITY = "./storage/vms/learned_capacity.json"
+
+class CapacityEstimator:
+    """
+    Exponentially weighted speed (MI/s) per VM, learned from task completions.
+
+    docker_executor.make_event feeds every successful completion (MI, compute
+    seconds) through observe() when the estimator is set as the
+    `capacity_estimator` execution setting. Compute time is the task's own
+    measurement (compute_s), or wall time minus `exec_overhead` (the 0-MI
+    docker exec overhead from utils/vm_calibration.py) when the task reports
+    no timings. Speeds are in the same unit as vm_mips, so schedulers
+    can use speed()/vm_mips() wherever they'd use the configured MIPS.
+    The state is saved to storage/vms/ and reloaded by the next experiment.
+    """
+
+    def __init__(self, path: str = LEARNED_CAPACITY, alpha: float = 0.2):
+        self.path = path
+        self.alpha = alpha
+        self.state = {}  # vm → {"mean", "var", "count", "updated_at"}
+        self.exec_overhead = {}  # vm → calibrated docker exec overhead (seconds)
+        self._lock = threading.Lock()
+        if path and os.path.exists(path):
+            with open(path, "r") as f:
+                self.state = json.load(f).get("vms", {})
+
+    def observe(self, vm: str, mi: float, elapsed: float):
+        """Fold one completion (mi done in `elapsed` seconds) into vm's estimate."""
+        if elapsed <= 0 or mi <= 0:
+            return
+        rate = mi / elapsed
+        with self._lock:
+            entry = self.state.get(vm)
+            if entry is None:
+                self.state[vm] = {"mean": rate, "var": 0.0, "count": 1, "updated_at": time.time()}
+                return
+            # Incremental exponentially weighted mean/variance
+            diff = rate - entry["mean"]
+            incr = self.alpha * diff
+            entry["mean"] += incr
+            entry["var"] = (1 - self.alpha) * (entry["var"] + diff * incr)
+            entry["count"] += 1
+            entry["updated_at"] = time.time()
+
+    def speed(self, vm: str, default: float = None) -> float:
+        """Current MI/s estimate of vm (`default` if it was never observed)."""
+        entry = self.state.get(vm)
+        return entry["mean"] if entry else default
+
+    def uncertainty(self, vm: str) -> float:
+        """Standard deviation of vm's observed speed (inf until it was observed twice)."""
+        entry = self.state.get(vm)
+        return math.sqrt(entry["var"]) if entry and entry["count"] > 1 else float("inf")
+
+    def estimate(self, vm: str) -> Dict:
+        """{"speed", "std", "relative_std", "count"} for one VM."""
+        entry = self.state.get(vm)
+        if entry is None:
+            return {"speed": None, "std": float("inf"), "relative_std": float("inf"), "count": 0}
+        std = self.uncertainty(vm)
+        return {"speed": entry["mean"], "std": std, "relative_std": std / entry["mean"] if entry["mean"] else float("inf"),
+                "count": entry["count"]}
+
+    def vm_mips(self, vm_names: List[str], fallback: Dict[str, float] = None) -> Dict[str, float]:
+        """Learned speed per VM, `fallback` (e.g. configured MIPS) for VMs never observed."""
+        fallback = fallback or {}
+        return {vm: self.speed(vm, fallback.get(vm)) for vm in vm_names}
+
+    def save(self):
+        if not self.path:
+            return
+        with self._lock:
+            data = {"alpha": self.alpha, "saved_at": time.time(), "vms": self.state}
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            tmp_path = self.path + ".tmp"
+            with open(tmp_path, "w") as f:
+                json.dump(data, f, indent=2)
+            os.replace(tmp_path, self.path)
+
+_ESTIMATOR = None
+
+def get_estimator(path: str = LEARNED_CAPACITY) -> CapacityEstimator:
+    """Process-wide estimator, loaded from `path` on first use."""
+    global _ESTIMATOR
+    if _ESTIMATOR is None or _ESTIMATOR.path != path:
+        _ESTIMATOR = CapacityEstimator(path)
+    return _ESTIMATOR
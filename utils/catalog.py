@@ -0,0 +1,288 @@
+# utils/catalog.py
+"""
+SQLite catalog of every experiment under results/.
+
+    python -m utils.catalog ingest                      # index new/changed experiment dirs
+    python -m utils.catalog runs --algorithm fcfs --tasks 100
+    python -m utils.catalog trend --vm-config 0.5,0.6,0.7,0.8,1 --backend thread
+
+run_experiment.py ingests each experiment as soon as its summary is written,
+so queries never have to rescan the results tree.
+"""
+import argparse
+import csv
+import glob
+import json
+import os
+import re
+import sqlite3
+from datetime import datetime
+from typing import List, Dict
+
+from utils.result_store import read_results, results_path
+
+RESULTS_ROOT = "results"
+CATALOG_DB = os.path.join(RESULTS_ROOT, "catalog.sqlite")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS experiments (
+    id INTEGER PRIMARY KEY,
+    dir TEXT UNIQUE NOT NULL,
+    started_at TEXT,
+    num_tasks INTEGER,
+    vm_count INTEGER,
+    vm_signature TEXT,          -- sorted CPU limits, e.g. "0.5,0.6,0.7,0.8,1"
+    total_cpus REAL,
+    backend TEXT,               -- execution backend: "thread" (docker), "async" or "sim"
+    worker TEXT,                -- "exec" or "daemon"
+    slots_per_vm INTEGER,
+    config TEXT,                -- full config.json
+    source_mtime REAL           -- makespan_summary.csv mtime at ingestion
+);
+CREATE TABLE IF NOT EXISTS runs (
+    experiment_id INTEGER NOT NULL REFERENCES experiments(id) ON DELETE CASCADE,
+    algorithm TEXT NOT NULL,
+    makespan REAL,
+    num_results INTEGER,        -- completed tasks in <algo>_results
+    mean_task_time REAL,        -- mean end - start per task
+    metrics TEXT,               -- any extra summary columns as JSON
+    PRIMARY KEY (experiment_id, algorithm)
+);
+CREATE INDEX IF NOT EXISTS idx_runs_algorithm ON runs(algorithm, makespan);
+CREATE INDEX IF NOT EXISTS idx_experiments_tasks ON experiments(num_tasks);
+CREATE INDEX IF NOT EXISTS idx_experiments_vms ON experiments(vm_signature);
+CREATE INDEX IF NOT EXISTS idx_experiments_started ON experiments(started_at);
+"""
+
+# Columns added after the first catalogs were created: (name, SQL type)
+_ADDED_COLUMNS = (("backend", "TEXT"), ("worker", "TEXT"), ("slots_per_vm", "INTEGER"))
+
+# Experiments from before config.json recorded these ran one docker exec per task on threads
+DEFAULT_EXECUTION = {"backend": "thread", "worker": "exec", "slots_per_vm": 1}
+
+_DIR_TIMESTAMP = re.compile(r"experiment_(\d{4}-\d{2}-\d{2}_\d{2}-\d{2}-\d{2})")
+_DIR_TASKS = re.compile(r"\[(\d+)\s*tasks?\]", re.IGNORECASE)
+
+def connect(db_path: str = CATALOG_DB) -> sqlite3.Connection:
+    os.makedirs(os.path.dirname(db_path) or ".", exist_ok=True)
+    conn = sqlite3.connect(db_path)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA foreign_keys = ON")
+    conn.executescript(SCHEMA)
+    _migrate(conn)
+    return conn
+
+def _migrate(conn: sqlite3.Connection):
+    """Add columns missing from an older catalog; its experiments are re-ingested by the next ingest."""
+    existing = {row["name"] for row in conn.execute("PRAGMA table_info(experiments)")}
+    missing = [(name, kind) for name, kind in _ADDED_COLUMNS if name not in existing]
+    with conn:
+        for name, kind in missing:
+            conn.execute(f"ALTER TABLE experiments ADD COLUMN {name} {kind}")
+        if missing:
+            conn.execute("UPDATE experiments SET source_mtime = NULL")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_experiments_backend ON experiments(backend, worker, slots_per_vm)")
+
+def _vm_signature(vm_config: Dict[str, float]) -> str:
+    return ",".join(f"{cpus:g}" for cpus in sorted(vm_config.values()))
+
+def _parse_float(value: str):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return value
+
+def _read_summary(path: str) -> Dict[str, Dict]:
+    """{algorithm: {"makespan": float, "metrics": {other columns}}} from makespan_summary.csv."""
+    runs = {}
+    with open(path, newline="") as f:
+        for row in csv.DictReader(f):
+            algo = row.pop("Algorithm")
+            makespan = _parse_float(row.pop("Makespan (s)", None))
+            runs[algo] = {"makespan": makespan, "metrics": {k: _parse_float(v) for k, v in row.items()}}
+    return runs
+
+def _result_stats(exp_dir: str, algo: str):
+    """(num_results, mean_task_time) from <algo>_results.bin, else the CSV; (None, None) if absent."""
+    if os.path.exists(results_path(exp_dir, algo)):
+        records, _ = read_results(exp_dir, algo)
+        if len(records) == 0:
+            return 0, None
+        return len(records), float((records["end"] - records["start"]).mean())
+    csv_path = os.path.join(exp_dir, f"{algo}_results.csv")
+    if not os.path.exists(csv_path):
+        return None, None
+    times = []
+    with open(csv_path, newline="") as f:
+        for row in csv.DictReader(f):
+            times.append(float(row["end"]) - float(row["start"]))
+    return len(times), (sum(times) / len(times) if times else None)
+
+def ingest_experiment(conn: sqlite3.Connection, exp_dir: str, force: bool = False) -> bool:
+    """
+    Add or refresh one experiment directory. Returns True if it was (re)ingested,
+    False if it was unchanged or has no summary yet.
+    Directory names of any shape are accepted ("[50 Task]", "[100 task]", none).
+    """
+    exp_dir = os.path.normpath(exp_dir)
+    summary_path = os.path.join(exp_dir, "makespan_summary.csv")
+    if not os.path.exists(summary_path):
+        return False
+    mtime = os.path.getmtime(summary_path)
+
+    row = conn.execute("SELECT id, source_mtime FROM experiments WHERE dir = ?", (exp_dir,)).fetchone()
+    if row and row["source_mtime"] == mtime and not force:
+        return False
+
+    config = {}
+    config_path = os.path.join(exp_dir, "config.json")
+    if os.path.exists(config_path):
+        with open(config_path) as f:
+            config = json.load(f)
+
+    name = os.path.basename(exp_dir)
+    started_at = config.get("timestamp")
+    if not started_at:
+        match = _DIR_TIMESTAMP.search(name)
+        started_at = datetime.strptime(match.group(1), "%Y-%m-%d_%H-%M-%S").isoformat() if match else None
+    num_tasks = config.get("task_distribution", {}).get("num_tasks")
+    if num_tasks is None:
+        match = _DIR_TASKS.search(name)
+        num_tasks = int(match.group(1)) if match else None
+    vm_config = config.get("vm_config", {})
+    params = config.get("task_distribution", {})
+    execution = {key: params.get(key) or default for key, default in DEFAULT_EXECUTION.items()}
+
+    with conn:
+        if row:
+            conn.execute("DELETE FROM experiments WHERE id = ?", (row["id"],))
+        cur = conn.execute(
+            "INSERT INTO experiments (dir, started_at, num_tasks, vm_count, vm_signature, total_cpus,"
+            " backend, worker, slots_per_vm, config, source_mtime)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (exp_dir, started_at, num_tasks, len(vm_config) or None, _vm_signature(vm_config) or None,
+             sum(vm_config.values()) if vm_config else None, execution["backend"], execution["worker"],
+             execution["slots_per_vm"], json.dumps(config), mtime)
+        )
+        conn.executemany(
+            "INSERT INTO runs (experiment_id, algorithm, makespan, num_results, mean_task_time, metrics)"
+            " VALUES (?, ?, ?, ?, ?, ?)",
+            [(cur.lastrowid, algo, run["makespan"], *_result_stats(exp_dir, algo), json.dumps(run["metrics"]))
+             for algo, run in _read_summary(summary_path).items()]
+        )
+    return True
+
+def ingest_all(conn: sqlite3.Connection, results_root: str = RESULTS_ROOT, force: bool = False) -> int:
+    """Ingest every new or changed results/experiment_* directory; returns how many were (re)ingested."""
+    count = 0
+    for exp_dir in sorted(glob.glob(os.path.join(glob.escape(results_root), "experiment_*"))):
+        if os.path.isdir(exp_dir) and ingest_experiment(conn, exp_dir, force):
+            count += 1
+    return count
+
+def _filters(algorithm=None, num_tasks=None, vm_signature=None, since=None, until=None,
+             backend=None, worker=None, slots_per_vm=None):
+    clauses, params = [], []
+    if algorithm:
+        clauses.append("r.algorithm = ?")
+        params.append(algorithm)
+    if num_tasks is not None:
+        clauses.append("e.num_tasks = ?")
+        params.append(num_tasks)
+    if vm_signature:
+        clauses.append("e.vm_signature = ?")
+        params.append(vm_signature)
+    if since:
+        clauses.append("e.started_at >= ?")
+        params.append(since)
+    if until:
+        clauses.append("e.started_at < ?")
+        params.append(until)
+    if backend:
+        clauses.append("e.backend = ?")
+        params.append(backend)
+    if worker:
+        clauses.append("e.worker = ?")
+        params.append(worker)
+    if slots_per_vm is not None:
+        clauses.append("e.slots_per_vm = ?")
+        params.append(slots_per_vm)
+    return (" WHERE " + " AND ".join(clauses)) if clauses else "", params
+
+def query_runs(conn: sqlite3.Connection, algorithm: str = None, num_tasks: int = None,
+               vm_signature: str = None, since: str = None, until: str = None,
+               backend: str = None, worker: str = None, slots_per_vm: int = None) -> List[Dict]:
+    """Every matching (experiment, algorithm) run, oldest first."""
+    where, params = _filters(algorithm, num_tasks, vm_signature, since, until, backend, worker, slots_per_vm)
+    rows = conn.execute(
+        "SELECT e.dir, e.started_at, e.num_tasks, e.vm_signature, e.backend, e.worker, e.slots_per_vm,"
+        " r.algorithm, r.makespan,"
+        " r.num_results, r.mean_task_time, r.metrics"
+        " FROM runs r JOIN experiments e ON e.id = r.experiment_id" + where +
+        " ORDER BY e.started_at, r.algorithm", params
+    ).fetchall()
+    return [dict(row, metrics=json.loads(row["metrics"] or "{}")) for row in rows]
+
+def makespan_trend(conn: sqlite3.Connection, algorithm: str = None, num_tasks: int = None,
+                   vm_signature: str = None, since: str = None, until: str = None,
+                   backend: str = None, worker: str = None, slots_per_vm: int = None) -> List[Dict]:
+    """
+    Makespan count/mean/min/max per algorithm and task count, kept apart per
+    backend, worker and slots (simulated and real runs never share a row).
+    """
+    where, params = _filters(algorithm, num_tasks, vm_signature, since, until, backend, worker, slots_per_vm)
+    rows = conn.execute(
+        "SELECT e.backend, e.worker, e.slots_per_vm, r.algorithm, e.num_tasks, COUNT(*) AS runs,"
+        " AVG(r.makespan) AS mean_makespan,"
+        " MIN(r.makespan) AS min_makespan, MAX(r.makespan) AS max_makespan,"
+        " MIN(e.started_at) AS first_run, MAX(e.started_at) AS last_run"
+        " FROM runs r JOIN experiments e ON e.id = r.experiment_id" + where +
+        " GROUP BY e.backend, e.worker, e.slots_per_vm, r.algorithm, e.num_tasks"
+        " ORDER BY e.backend, e.worker, e.slots_per_vm, e.num_tasks, mean_makespan", params
+    ).fetchall()
+    return [dict(row) for row in rows]
+
+def _print_rows(rows: List[Dict], columns: List[str]):
+    print("\t".join(columns))
+    for row in rows:
+        print("\t".join(f"{row[c]:.2f}" if isinstance(row[c], float) else str(row[c]) for c in columns))
+
+def main():
+    parser = argparse.ArgumentParser(description="Catalog and query experiments under results/.")
+    parser.add_argument("--db", default=CATALOG_DB, help="Catalog database path")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    ingest = sub.add_parser("ingest", help="Index new or changed experiment directories")
+    ingest.add_argument("--root", default=RESULTS_ROOT)
+    ingest.add_argument("--force", action="store_true", help="Re-ingest every directory")
+
+    for name in ("runs", "trend"):
+        q = sub.add_parser(name, help="List runs" if name == "runs" else "Makespan statistics per algorithm/task count")
+        q.add_argument("--algorithm")
+        q.add_argument("--tasks", type=int)
+        q.add_argument("--vm-config", help="Sorted CPU limits, e.g. 0.5,0.6,0.7,0.8,1")
+        q.add_argument("--since", help="ISO date/time lower bound")
+        q.add_argument("--until", help="ISO date/time upper bound")
+        q.add_argument("--backend", choices=("thread", "async", "sim"), help="Execution backend")
+        q.add_argument("--worker", choices=("exec", "daemon"), help="Worker mode")
+        q.add_argument("--slots", type=int, help="Slots per VM")
+    args = parser.parse_args()
+
+    conn = connect(args.db)
+    if args.command == "ingest":
+        print(f"✅ Ingested {ingest_all(conn, args.root, args.force)} experiment(s) into {args.db}")
+        return
+
+    filters = dict(algorithm=args.algorithm, num_tasks=args.tasks, vm_signature=args.vm_config,
+                   since=args.since, until=args.until, backend=args.backend, worker=args.worker,
+                   slots_per_vm=args.slots)
+    if args.command == "runs":
+        _print_rows(query_runs(conn, **filters), ["started_at", "num_tasks", "vm_signature", "backend", "algorithm",
+                                                   "makespan", "num_results", "dir"])
+    else:
+        _print_rows(makespan_trend(conn, **filters),
+                    ["backend", "worker", "slots_per_vm", "algorithm", "num_tasks", "runs", "mean_makespan",
+                     "min_makespan", "max_makespan", "last_run"])
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+# utils/container_pool.py
+import os
+import subprocess
+from typing import List, Dict
+
+# Same image/memory limit as the containers in docker-compose.yaml
+POOL_IMAGE = "python:3.10-slim"
+POOL_MEMORY = "512m"
+
+# CPUs kept free for run_experiment itself (dispatch threads, docker CLI, stats collector)
+ORCHESTRATOR_CPUS = 1.0
+
+class ContainerPool:
+    """
+    A private, identically-configured copy of the experiment VMs for one
+    algorithm: vm1 → pool_<name>_vm1, ... with the same --cpus limits.
+    Schedulers keep using the logical VM names; the executor maps them to
+    `containers` through execution_overrides(vm_aliases=...).
+    """
+
+    def __init__(self, name: str, vm_cpus: Dict[str, float], image: str = POOL_IMAGE, memory: str = POOL_MEMORY):
+        self.name = name
+        self.vm_cpus = vm_cpus
+        self.image = image
+        self.memory = memory
+        self.containers = {vm: f"pool_{name}_{vm}" for vm in vm_cpus}
+
+    def create(self, files: List[str] = ("task_runner.py", "worker_daemon.py")):
+        """Start the pool's containers (replacing leftovers from a crashed run) and copy the task files in."""
+        self.remove()
+        for vm, container in self.containers.items():
+            subprocess.run(
+                ["docker", "run", "-d", "--name", container, "--cpus", str(self.vm_cpus[vm]),
+                 "--memory", self.memory, self.image, "sleep", "infinity"],
+                capture_output=True, check=True
+            )
+            for path in files:
+                subprocess.run(["docker", "cp", path, f"{container}:/{os.path.basename(path)}"], check=True)
+
+    def remove(self):
+        subprocess.run(["docker", "rm", "-f", *self.containers.values()], capture_output=True)
+
+    def __enter__(self):
+        self.create()
+        return self
+
+    def __exit__(self, *exc):
+        self.remove()
+
+def host_cpus() -> float:
+    """CPUs Docker can schedule on (docker info), else the host's CPU count."""
+    try:
+        result = subprocess.run(["docker", "info", "--format", "{{.NCPU}}"],
+                                capture_output=True, text=True, timeout=10)
+        if result.returncode == 0 and result.stdout.strip():
+            return float(result.stdout.strip())
+    except (OSError, subprocess.TimeoutExpired, ValueError):
+        pass
+    return float(os.cpu_count() or 1)
+
+def max_concurrent_pools(vm_cpus: Dict[str, float], requested: int) -> Dict:
+    """
+    How many pools can run at once without competing for host CPUs.
+    Every pool needs sum(vm_cpus); the orchestrator and the host's current
+    load (1-minute load average) are subtracted from the CPUs available.
+    Returns {"pools", "per_pool_cpus", "available_cpus", "host_cpus", "load"}.
+    """
+    per_pool = sum(vm_cpus.values())
+    total = host_cpus()
+    load = os.getloadavg()[0] if hasattr(os, "getloadavg") else 0.0
+    available = max(0.0, total - load - ORCHESTRATOR_CPUS)
+    pools = max(1, min(requested, int(available // per_pool))) if per_pool > 0 else requested
+    return {"pools": pools, "per_pool_cpus": per_pool, "available_cpus": available,
+            "host_cpus": total, "load": load}
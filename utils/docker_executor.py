@@ -1,52 +1,678 @@
 # utils/docker_executor.py
+import contextvars
+import json
+import math
+import random
 import subprocess
+import threading
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from typing import List, Dict
 
-def run_single_task_in_vm(vm: str, duration: float, task_id: int, logger=None) -> Dict:
+from utils.logger import DEBUG
+from utils.result_store import TIMING_FIELDS
+
+# Execution settings shared by every scheduler; run_experiment.py overrides them
+# through configure_execution() before any algorithm runs.
+EXECUTION_CONFIG = {
+    "slots_per_vm": 1,   # max tasks running at the same time inside one container
+    "worker": "exec",    # "exec": docker exec per task | "daemon": persistent worker_daemon.py per slot
+    "backend": "thread", # "thread": one OS thread per slot | "async": single asyncio event loop | "sim": no Docker
+    "vm_mips": None,     # {vm: MIPS}, required by the "sim" backend
+    "sim_overhead": 0.0, # simulated per-task dispatch overhead (seconds)
+    "result_sink": None, # utils.result_store.ResultSink receiving every completion as it happens
+    "keep_output": True, # keep task stdout/stderr in the returned dicts (stderr is always kept on errors)
+    "vm_aliases": None,  # {vm: container name} when a VM runs in a differently named container (pools)
+    "capacity_estimator": None, # utils.capacity_estimator.CapacityEstimator learning VM speeds from completions
+    "work_stealing": None, # None | STEAL_POLICIES name | callable(queues, thief, vm_mips) → victim VM (thread backend)
+    "return_results": True, # False: completions only go to result_sink, run_tasks_parallel returns []
+    "max_pending": 10_000, # streamed assignments queued ahead of execution before the scheduler is paused
+    "batch": None,       # None | "auto" | max tasks per docker exec (thread backend, exec worker)
+}
+
+WORKER_MODES = ("exec", "daemon")
+BACKENDS = ("thread", "async", "sim")
+
+# Per-run overrides of EXECUTION_CONFIG (see execution_overrides); a context
+# variable so algorithms running at the same time in different threads each
+# see their own result sink and containers.
+_OVERRIDES = contextvars.ContextVar("execution_overrides", default={})
+
+def _validate_settings(settings: Dict):
+    unknown = set(settings) - set(EXECUTION_CONFIG)
+    if unknown:
+        raise ValueError(f"Unknown execution setting(s): {', '.join(sorted(unknown))}")
+    if settings.get("worker", EXECUTION_CONFIG["worker"]) not in WORKER_MODES:
+        raise ValueError(f"worker must be one of {WORKER_MODES}")
+    if settings.get("backend", EXECUTION_CONFIG["backend"]) not in BACKENDS:
+        raise ValueError(f"backend must be one of {BACKENDS}")
+    steal = settings.get("work_stealing")
+    if isinstance(steal, str) and steal not in STEAL_POLICIES:
+        raise ValueError(f"work_stealing must be one of {tuple(STEAL_POLICIES)} or a callable")
+    batch = settings.get("batch")
+    if batch is not None and batch != "auto" and not (isinstance(batch, int) and batch >= 1):
+        raise ValueError("batch must be None, 'auto' or a positive int")
+
+def configure_execution(**settings) -> Dict:
     """
-    Execute ONE task inside a VM container.
-    Returns dict with timing and metadata.
+    Override entries of EXECUTION_CONFIG (e.g. slots_per_vm=2).
+    Returns the resulting config.
     """
-    scaled_duration = duration
-    start = time.time()
-    result = subprocess.run(
-        ["docker", "exec", vm, "python3", "/task_runner.py", str(scaled_duration)],
-        capture_output=True, text=True
-    )
-    end = time.time()
+    _validate_settings(settings)
+    EXECUTION_CONFIG.update(settings)
+    return EXECUTION_CONFIG
+
+@contextmanager
+def execution_overrides(**settings):
+    """
+    Override EXECUTION_CONFIG entries for the current thread (and the
+    executor threads it starts) only, e.g.
+        with execution_overrides(result_sink=sink, vm_aliases={"vm1": "pool_fcfs_vm1"}): ...
+    """
+    _validate_settings(settings)
+    token = _OVERRIDES.set({**_OVERRIDES.get(), **settings})
+    try:
+        yield
+    finally:
+        _OVERRIDES.reset(token)
+
+def execution_setting(name: str):
+    """Current value of one execution setting, honouring execution_overrides."""
+    overrides = _OVERRIDES.get()
+    return overrides[name] if name in overrides else EXECUTION_CONFIG[name]
+
+def container_name(vm: str) -> str:
+    """Container that runs `vm`'s tasks (the VM name itself unless a pool aliases it)."""
+    aliases = execution_setting("vm_aliases")
+    return aliases.get(vm, vm) if aliases else vm
+
+# ----------------------------
+# Work stealing: a slot whose own queue is empty takes a not-yet-started task
+# from the TAIL of a victim VM's queue. A victim policy picks the VM; the
+# steal only happens if the thief would finish the task before the victim
+# could even start it (when MIPS are known).
+# ----------------------------
+
+def _queued_work(queue: deque, mips: float) -> float:
+    return sum(duration for _, duration in list(queue)) / mips
+
+def steal_max_work(queues: Dict[str, deque], thief: str, vm_mips: Dict[str, float] = None) -> str:
+    """VM with the most queued work in estimated seconds (MI/MIPS); falls back to max_count without MIPS."""
+    if not vm_mips:
+        return steal_max_count(queues, thief)
+    candidates = [(_queued_work(q, vm_mips[vm]), vm) for vm, q in queues.items() if vm != thief and q]
+    return max(candidates)[1] if candidates else None
+
+def steal_max_count(queues: Dict[str, deque], thief: str, vm_mips: Dict[str, float] = None) -> str:
+    """VM with the longest queue."""
+    candidates = [(len(q), vm) for vm, q in queues.items() if vm != thief and q]
+    return max(candidates)[1] if candidates else None
+
+def steal_random(queues: Dict[str, deque], thief: str, vm_mips: Dict[str, float] = None) -> str:
+    """Any VM with queued tasks."""
+    candidates = [vm for vm, q in queues.items() if vm != thief and q]
+    return random.choice(candidates) if candidates else None
+
+STEAL_POLICIES = {
+    "max_work": steal_max_work,
+    "max_count": steal_max_count,
+    "random": steal_random,
+}
+
+def steal_task(thief: str, queues: Dict[str, deque], policy, vm_mips: Dict[str, float] = None):
+    """
+    Take one task from the tail of a victim's queue for `thief`.
+    Returns (task_id, duration, victim) or None if nothing is worth stealing.
+    """
+    pick = STEAL_POLICIES[policy] if isinstance(policy, str) else policy
+    victim = pick(queues, thief, vm_mips)
+    if victim is None:
+        return None
+    victim_queue = queues[victim]
+    try:
+        tid, duration = victim_queue.pop()
+    except IndexError:  # the victim drained it meanwhile
+        return None
+    if vm_mips and thief in vm_mips and victim in vm_mips:
+        # Not worth it if the victim would have started and finished it first
+        if duration / vm_mips[thief] >= _queued_work(victim_queue, vm_mips[victim]) + duration / vm_mips[victim]:
+            victim_queue.append((tid, duration))
+            return None
+    return tid, duration, victim
 
+def build_vm_queues(assignments: List[tuple]) -> "OrderedDict[str, deque]":
+    """
+    Split assignments into one FIFO queue per VM.
+    Order inside each queue is the order the scheduler emitted the tasks.
+    """
+    queues = OrderedDict()
+    for tid, vm, duration in assignments:
+        queues.setdefault(vm, deque()).append((tid, duration))
+    return queues
+
+class StreamingQueues:
+    """
+    Per-VM FIFO queues filled while the scheduler is still producing
+    assignments. put() blocks once `max_pending` tasks are waiting (so a
+    scheduler over millions of tasks stays only a bounded distance ahead of
+    execution); get() blocks until the VM has a task or the stream is closed.
+    """
+
+    def __init__(self, max_pending: int = 10_000):
+        self.max_pending = max(1, max_pending)
+        self.queues = OrderedDict()
+        self.pending = 0
+        self.closed = False
+        self.error = None
+        self._cond = threading.Condition()
+
+    def put(self, tid: int, vm: str, duration: float) -> bool:
+        """Queue one task; True if it's the first task seen for `vm`."""
+        with self._cond:
+            while self.pending >= self.max_pending and self.error is None:
+                self._cond.wait()
+            if self.error is not None:
+                raise self.error
+            queue = self.queues.get(vm)
+            new_vm = queue is None
+            if new_vm:
+                queue = self.queues[vm] = deque()
+            queue.append((tid, duration))
+            self.pending += 1
+            self._cond.notify_all()
+            return new_vm
+
+    def get(self, vm: str):
+        """Next (tid, duration) for `vm`, or None once the stream is closed and drained."""
+        with self._cond:
+            queue = self.queues[vm]
+            while not queue and not self.closed:
+                self._cond.wait()
+            if not queue or self.error is not None:
+                return None
+            self.pending -= 1
+            self._cond.notify_all()
+            return queue.popleft()
+
+    def get_nowait(self, vm: str):
+        """Next (tid, duration) for `vm` if one is queued right now, else None."""
+        with self._cond:
+            queue = self.queues[vm]
+            if not queue or self.error is not None:
+                return None
+            self.pending -= 1
+            self._cond.notify_all()
+            return queue.popleft()
+
+    def queued(self, vm: str) -> int:
+        return len(self.queues[vm])
+
+    def close(self):
+        with self._cond:
+            self.closed = True
+            self._cond.notify_all()
+
+    def fail(self, error: BaseException):
+        """A slot died: stop every slot and make the producer raise `error`."""
+        with self._cond:
+            if self.error is None:
+                self.error = error
+            self.closed = True
+            self._cond.notify_all()
+
+# Per-task phases (seconds, result_store.TIMING_FIELDS) added to every real completion record:
+#   spawn_s   dispatch → task process exists (docker exec + runtime) | daemon: request reaches the worker
+#   startup_s process exists → workload starts (interpreter + imports) | daemon: request parsing
+#   compute_s the workload itself (wall clock)
+#   return_s  workload done → result back in the executor (process exit, docker exec teardown, pipes)
+#   cpu_s     CPU time of the workload inside the container
+# NaN where a phase can't be measured (e.g. an older task_runner.py, or no /proc).
+TIMINGS_PREFIX = "[Timings] "  # same as task_runner.TIMINGS_PREFIX
+
+def parse_task_timings(stdout: str):
+    """(stdout without the timings line, timings dict or None) from task_runner.py output."""
+    head, sep, line = stdout.rpartition(TIMINGS_PREFIX)
+    if not sep:
+        return stdout, None
+    try:
+        timings = json.loads(line.strip())
+    except json.JSONDecodeError:
+        return stdout, None
+    return head.strip(), timings
+
+def overhead_breakdown(dispatch: float, returned: float, timings: Dict = None) -> Dict[str, float]:
+    """TIMING_FIELDS for one task from executor timestamps and the task's own timings."""
+    nan = float("nan")
+    breakdown = dict.fromkeys(TIMING_FIELDS, nan)
+    if not timings or timings.get("compute_start") is None:
+        return breakdown
+    if timings.get("received") is not None:
+        # Worker daemon: the request line reached an already running interpreter
+        breakdown["spawn_s"] = timings["received"] - dispatch
+        breakdown["startup_s"] = timings["compute_start"] - timings["received"]
+    elif timings.get("process_start") is not None:
+        # One-shot task_runner.py; without process_created spawn_s includes interpreter startup.
+        # process_created has clock-tick resolution, so it can read slightly before dispatch
+        ready = max(timings.get("process_created") or timings["process_start"], dispatch)
+        breakdown["spawn_s"] = ready - dispatch
+        breakdown["startup_s"] = timings["compute_start"] - ready
+    breakdown["compute_s"] = timings["compute_end"] - timings["compute_start"]
+    breakdown["return_s"] = returned - timings["compute_end"]
+    if timings.get("cpu_time") is not None:
+        breakdown["cpu_s"] = timings["cpu_time"]
+    return breakdown
+
+def make_event(task_id: int, vm: str, duration: float, start: float, end: float,
+               stdout: str = "", stderr: str = "", logger=None, timings: Dict = None,
+               returned: float = None) -> Dict:
+    """
+    Build the completion record every execution backend returns and log it.
+    start/end are the executor's dispatch and return times; `timings` are the
+    task's own (task_runner.py / worker_daemon.py) and give the TIMING_FIELDS.
+    `returned` is when the result reached the executor, if later than `end`.
+    """
     event = {
         "task_id": task_id,
         "vm": vm,
         "duration": duration,
         "start": start,
         "end": end,
-        "stdout": result.stdout.strip(),
-        "stderr": result.stderr.strip()
+        "stdout": stdout if execution_setting("keep_output") else "",
+        "stderr": stderr
     }
+    event.update(overhead_breakdown(start, returned or end, timings))
+
+    sink = execution_setting("result_sink")
+    if sink is not None:
+        sink.append_event(event)
+
+    estimator = execution_setting("capacity_estimator")
+    if estimator is not None and not stderr:
+        # Learn from compute time only, like vm_calibration: the task's own measurement,
+        # else wall time minus the calibrated exec overhead. Failed tasks say nothing about speed.
+        compute = event["compute_s"]
+        if compute != compute:
+            compute = end - start - estimator.exec_overhead.get(vm, dispatch_overhead(vm))
+        # Concurrent slots share the container, so one task sees ~1/slots of its speed
+        # (run_tasks_parallel overrides slots_per_vm with the slot count it runs)
+        estimator.observe(vm, duration * execution_setting("slots_per_vm"), compute)
 
     msg = f"[{vm}] Task {task_id} ({duration:.2f} MI) completed in {end - start:.3f}s"
     if logger:
-        logger.log(msg)
+        logger.log(msg, level=DEBUG, task_id=task_id, vm=vm, start=start, end=end)
     else:
         print(msg)
 
     return event
 
-def run_tasks_parallel(assignments: List[tuple], logger=None) -> List[Dict]:
+# ----------------------------
+# Batching: several queued tasks of a VM in one docker exec (task_runner.py --batch).
+# "auto" grows a batch until its estimated compute time is large enough that the
+# measured per-exec overhead stays under BATCH_OVERHEAD_SHARE of the batch.
+# ----------------------------
+
+MAX_BATCH = 64
+BATCH_OVERHEAD_SHARE = 0.1
+DEFAULT_DISPATCH_OVERHEAD = 0.2  # seconds per docker exec + interpreter start, until measured
+
+_DISPATCH_OVERHEAD = {}  # vm → EWMA of (exec wall time - compute time)
+_dispatch_lock = threading.Lock()
+
+def dispatch_overhead(vm: str) -> float:
+    """Measured docker exec overhead of `vm` in seconds (DEFAULT_DISPATCH_OVERHEAD before any exec)."""
+    return _DISPATCH_OVERHEAD.get(vm, DEFAULT_DISPATCH_OVERHEAD)
+
+def observe_dispatch_overhead(vm: str, seconds: float, alpha: float = 0.3):
+    if seconds != seconds or seconds < 0:
+        return
+    with _dispatch_lock:
+        previous = _DISPATCH_OVERHEAD.get(vm)
+        _DISPATCH_OVERHEAD[vm] = seconds if previous is None else previous + alpha * (seconds - previous)
+
+def estimated_task_seconds(vm: str, mi: float, slots: int = 1) -> float:
+    """Expected compute time of `mi` on one of `vm`'s slots (learned speed if available)."""
+    mips = (execution_setting("vm_mips") or {}).get(vm)
+    estimator = execution_setting("capacity_estimator")
+    if estimator is not None:
+        mips = estimator.speed(vm, mips)
+    return mi / (mips / slots) if mips else float("inf")
+
+def fill_batch(vm: str, first: tuple, pop, queued: int, slots: int = 1) -> List[tuple]:
+    """
+    `first` plus more (tid, duration) tasks taken with pop() (returns None
+    when nothing is left), per the `batch` setting. A batch never takes more
+    than its slot's share of the `queued` tasks, so other slots keep work.
+    """
+    setting = execution_setting("batch")
+    batch = [first]
+    if not setting:
+        return batch
+    limit = min(MAX_BATCH, math.ceil((queued + 1) / slots))
+    if setting == "auto":
+        budget = dispatch_overhead(vm) * (1 - BATCH_OVERHEAD_SHARE) / BATCH_OVERHEAD_SHARE
+    else:
+        limit, budget = min(limit, setting), float("inf")
+    planned = estimated_task_seconds(vm, first[1], slots)
+    while len(batch) < limit and planned < budget:
+        item = pop()
+        if item is None:
+            break
+        batch.append(item)
+        planned += estimated_task_seconds(vm, item[1], slots)
+    return batch
+
+def run_batch_in_vm(vm: str, batch: List[tuple], logger=None) -> List[Dict]:
+    """
+    Execute several (tid, duration) tasks with ONE docker exec.
+    Completion records are streamed back, so each task's event is made (and
+    reaches the sink) as soon as it finishes. A task starts when the batch is
+    dispatched (first) or when the runner picked it up (later ones) and ends
+    when its compute ends, so tasks of a batch never overlap on the Gantt;
+    the delay until its record arrives is its return_s.
+    """
+    dispatch = time.time()
+    proc = subprocess.Popen(
+        ["docker", "exec", container_name(vm), "python3", "/task_runner.py", "--batch",
+         *(f"{tid}:{duration}" for tid, duration in batch)],
+        stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True
+    )
+    events = []
+    other_output = []
+    for line in proc.stdout:
+        _, timings = parse_task_timings(line.strip())
+        if timings is None or len(events) >= len(batch):
+            other_output.append(line.rstrip("\n"))
+            continue
+        returned = time.time()
+        tid, duration = batch[len(events)]
+        start = timings.get("received", dispatch)
+        end = max(timings["compute_end"], start)
+        events.append(make_event(tid, vm, duration, start, end, "", "", logger, timings, returned))
+    proc.wait()
+    finished = time.time()
+
+    # Tasks the runner never reported (crash, bad container): keep them visible as failed
+    error = "\n".join(other_output).strip() or f"task_runner.py --batch exited with code {proc.returncode}"
+    for tid, duration in batch[len(events):]:
+        events.append(make_event(tid, vm, duration, finished, finished, "", error, logger))
+
+    computed = [e["compute_s"] for e in events if e["compute_s"] == e["compute_s"]]
+    if computed:
+        observe_dispatch_overhead(vm, finished - dispatch - sum(computed))
+    return events
+
+def run_single_task_in_vm(vm: str, duration: float, task_id: int, logger=None) -> Dict:
+    """
+    Execute ONE task inside a VM container.
+    Returns dict with timing and metadata.
+    """
+    scaled_duration = duration
+    start = time.time()
+    result = subprocess.run(
+        ["docker", "exec", container_name(vm), "python3", "/task_runner.py", str(scaled_duration)],
+        capture_output=True, text=True
+    )
+    end = time.time()
+
+    stdout, timings = parse_task_timings(result.stdout.strip())
+    stderr = result.stderr.strip()
+    if result.returncode != 0 and not stderr:
+        stderr = f"task_runner.py exited with code {result.returncode}"
+    event = make_event(task_id, vm, duration, start, end, stdout, stderr, logger, timings)
+    observe_dispatch_overhead(vm, end - start - event["compute_s"])
+    return event
+
+class VMWorkerDaemon:
+    """
+    One persistent worker_daemon.py process inside a container.
+    Tasks are sent as JSON lines over the `docker exec -i` stdin pipe, so a task
+    costs a pipe round trip instead of a docker exec + interpreter start.
+    """
+
+    def __init__(self, vm: str):
+        self.vm = vm
+        self.proc = subprocess.Popen(
+            ["docker", "exec", "-i", container_name(vm), "python3", "-u", "/worker_daemon.py"],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+            text=True, bufsize=1
+        )
+
+    def run(self, task_id: int, duration: float) -> Dict:
+        self.proc.stdin.write(json.dumps({"task_id": task_id, "mi": duration}) + "\n")
+        self.proc.stdin.flush()
+        line = self.proc.stdout.readline()
+        if not line:
+            raise RuntimeError(f"[{self.vm}] worker daemon exited (code {self.proc.poll()})")
+        return json.loads(line)
+
+    def close(self):
+        if self.proc.poll() is None:
+            try:
+                self.proc.stdin.write(json.dumps({"cmd": "stop"}) + "\n")
+                self.proc.stdin.close()
+                self.proc.wait(timeout=5)
+            except (OSError, subprocess.TimeoutExpired):
+                self.proc.kill()
+
+def run_single_task_in_daemon(daemon: VMWorkerDaemon, duration: float, task_id: int, logger=None) -> Dict:
+    """
+    Execute ONE task through an already running worker daemon.
+    Returns the same event dict as run_single_task_in_vm.
+    """
+    start = time.time()
+    reply = daemon.run(task_id, duration)
+    end = time.time()
+
+    return make_event(task_id, daemon.vm, duration, start, end, reply.get("stdout", ""), reply.get("stderr", ""), logger,
+                      reply)
+
+def _pop(queue: deque):
+    try:
+        return queue.popleft()
+    except IndexError:
+        return None
+
+def _drain_vm_queue(vm: str, queue: deque, results: List[Dict], logger=None, worker: str = "exec",
+                    queues: Dict[str, deque] = None, steal=None, vm_mips: Dict[str, float] = None,
+                    steals: List[tuple] = None, slots: int = 1, batches: List[int] = None):
+    """
+    Worker loop for one execution slot of a VM: pop tasks in FIFO order until
+    empty, then (with `steal`) keep taking tasks from other VMs' queues.
+    With the `batch` setting (exec worker) consecutive queued tasks share one
+    docker exec; stolen tasks always run alone.
+    """
+    keep = execution_setting("return_results")
+    daemon = VMWorkerDaemon(vm) if worker == "daemon" else None
+    try:
+        while True:
+            stolen_from = None
+            try:
+                tid, duration = queue.popleft()
+            except IndexError:
+                stolen = steal_task(vm, queues, steal, vm_mips) if steal else None
+                if stolen is None:
+                    return
+                tid, duration, stolen_from = stolen
+                steals.append((tid, stolen_from, vm))
+                msg = f"🔀 [{vm}] stole Task {tid} ({duration:.2f} MI) from {stolen_from}"
+                if logger:
+                    logger.log(msg, level=DEBUG, task_id=tid, vm=vm, stolen_from=stolen_from)
+                else:
+                    print(msg)
+            if daemon:
+                event = run_single_task_in_daemon(daemon, duration, tid, logger)
+            elif stolen_from is None and batches is not None:
+                batch = fill_batch(vm, (tid, duration), lambda: _pop(queue), len(queue), slots)
+                batches.append(len(batch))
+                if len(batch) > 1:
+                    events = run_batch_in_vm(vm, batch, logger)
+                    if keep:
+                        results.extend(events)
+                    continue
+                event = run_single_task_in_vm(vm, duration, tid, logger)
+            else:
+                event = run_single_task_in_vm(vm, duration, tid, logger)
+            if stolen_from:
+                event["stolen_from"] = stolen_from
+            if keep:
+                results.append(event)
+    finally:
+        if daemon:
+            daemon.close()
+
+def _drain_stream(vm: str, stream: StreamingQueues, results: List[Dict], logger=None, worker: str = "exec",
+                  slots: int = 1, batches: List[int] = None):
+    """Worker loop for one execution slot of a VM fed by a StreamingQueues (batching as in _drain_vm_queue)."""
+    keep = execution_setting("return_results")
+    daemon = None
+    try:
+        daemon = VMWorkerDaemon(vm) if worker == "daemon" else None
+        while True:
+            item = stream.get(vm)
+            if item is None:
+                return
+            tid, duration = item
+            if daemon:
+                events = [run_single_task_in_daemon(daemon, duration, tid, logger)]
+            elif batches is not None:
+                batch = fill_batch(vm, item, lambda: stream.get_nowait(vm), stream.queued(vm), slots)
+                batches.append(len(batch))
+                if len(batch) > 1:
+                    events = run_batch_in_vm(vm, batch, logger)
+                else:
+                    events = [run_single_task_in_vm(vm, duration, tid, logger)]
+            else:
+                events = [run_single_task_in_vm(vm, duration, tid, logger)]
+            if keep:
+                results.extend(events)
+    except BaseException as e:
+        stream.fail(e)
+    finally:
+        if daemon:
+            daemon.close()
+
+def run_tasks_streaming(assignments, logger=None, slots: int = 1, worker: str = "exec") -> List[Dict]:
+    """
+    Thread backend for an assignment iterator (e.g. a scheduler generator):
+    tasks start running while the scheduler is still placing the rest.
+    The calling thread consumes the iterator; a VM's slot threads start with
+    its first task and exit when the stream is exhausted and their queue empty.
+    Work stealing is not applied here (see run_tasks_parallel).
+    """
+    stream = StreamingQueues(execution_setting("max_pending"))
+    results = []
+    threads = []
+    batches = [] if execution_setting("batch") and worker == "exec" else None
+    try:
+        for tid, vm, duration in assignments:
+            if stream.put(tid, vm, duration):
+                for _ in range(slots):
+                    # Same context copy as the pooled slots: keeps execution_overrides
+                    thread = threading.Thread(target=contextvars.copy_context().run,
+                                              args=(_drain_stream, vm, stream, results, logger, worker, slots, batches),
+                                              daemon=True)
+                    thread.start()
+                    threads.append(thread)
+    finally:
+        stream.close()
+        for thread in threads:
+            thread.join()
+    if stream.error is not None:
+        raise stream.error
+    _log_batches(batches, logger)
+    return results
+
+def _log_batches(batches: List[int], logger=None):
+    if not batches:
+        return
+    tasks = sum(batches)
+    msg = (f"[BATCH] {tasks} tasks in {len(batches)} docker exec calls "
+           f"(avg {tasks / len(batches):.1f}, max {max(batches)} per call, batch={execution_setting('batch')})")
+    if logger:
+        logger.log(msg)
+    else:
+        print(msg)
+
+def run_tasks_parallel(assignments, logger=None, slots_per_vm: int = None) -> List[Dict]:
     """
-    Run multiple tasks in parallel.
-    assignments = [(task_id, vm, duration), ...]
+    Run tasks with one ordered dispatch queue per VM.
+    assignments = [(task_id, vm, duration), ...] in scheduler order, as a list
+    or as an iterator: every backend then executes tasks as they are
+    produced, without materializing the whole schedule.
+    Each VM drains its own queue with `slots_per_vm` concurrent tasks, so a
+    container never runs more tasks at once than the schedule planned for.
+    The backend (threads, asyncio or the simulator) is picked from EXECUTION_CONFIG.
+    Thread backend only (the async backend raises ValueError for them): with
+    `work_stealing` set, idle slots steal queued tasks from other VMs and the
+    moved tasks' events carry "stolen_from" (stealing needs the full queues,
+    so iterators are materialized first); with `batch` set, exec-worker slots
+    run several queued tasks per docker exec.
+    With return_results=False completions only reach the result sink.
     """
+    slots = slots_per_vm or execution_setting("slots_per_vm")
+    if slots < 1:
+        raise ValueError("slots_per_vm must be >= 1")
+    # Every slot thread (and make_event's speed learning) sees the slot count actually used
+    with execution_overrides(slots_per_vm=slots):
+        return _run_tasks(assignments, logger, slots)
+
+def _run_tasks(assignments, logger, slots: int) -> List[Dict]:
+    worker = execution_setting("worker")
+    backend = execution_setting("backend")
+    if backend == "sim":
+        from utils.simulator import simulate_tasks
+        vm_mips = execution_setting("vm_mips")
+        if not vm_mips:
+            raise ValueError("The sim backend needs vm_mips (configure_execution(vm_mips=...))")
+        return simulate_tasks(assignments, vm_mips, slots, execution_setting("sim_overhead"), logger,
+                              sink=execution_setting("result_sink"), keep=execution_setting("return_results"))
+
+    steal = execution_setting("work_stealing")
+    if backend == "async":
+        unsupported = [name for name in ("work_stealing", "batch") if execution_setting(name)]
+        if unsupported:
+            raise ValueError(f"The async backend does not support {' / '.join(unsupported)} (use the thread backend)")
+        from utils.async_executor import run_tasks_async
+        return run_tasks_async(assignments, logger, slots, worker)
+
+    if not isinstance(assignments, (list, tuple)):
+        if not steal:
+            return run_tasks_streaming(assignments, logger, slots, worker)
+        assignments = list(assignments)
+
+    queues = build_vm_queues(assignments)
     results = []
-    # Use one thread per VM to avoid overwhelming Docker
-    with ThreadPoolExecutor(max_workers=len(set(vm for _, vm, _ in assignments))) as executor:
+    if not queues:
+        return results
+
+    vm_mips = execution_setting("vm_mips")
+    if steal and vm_mips:
+        # VMs the plan left idle can still steal
+        for vm in vm_mips:
+            queues.setdefault(vm, deque())
+    steals = []
+    batches = [] if execution_setting("batch") and worker == "exec" else None
+
+    with ThreadPoolExecutor(max_workers=len(queues) * slots) as executor:
+        # Each slot thread runs in a copy of the caller's context so it keeps
+        # the caller's execution_overrides (result sink, container aliases)
         futures = [
-            executor.submit(run_single_task_in_vm, vm, duration, tid, logger)
-            for (tid, vm, duration) in assignments
+            executor.submit(contextvars.copy_context().run, _drain_vm_queue, vm, queue, results, logger, worker,
+                            queues, steal, vm_mips, steals, slots, batches)
+            for vm, queue in queues.items()
+            for _ in range(slots)
         ]
-        for future in as_completed(futures):
-            results.append(future.result())
-    return results
\ No newline at end of file
+        for future in futures:
+            future.result()
+
+    if steal:
+        policy = steal if isinstance(steal, str) else getattr(steal, "__name__", "custom")
+        msg = f"[STEAL] {len(steals)} of {len(assignments)} tasks moved at runtime ({policy})"
+        if logger:
+            logger.log(msg)
+        else:
+            print(msg)
+    _log_batches(batches, logger)
+    return results
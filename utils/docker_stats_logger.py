@@ -1,42 +1,240 @@
 # utils/stats_logger.py
-import subprocess
-import time
 import csv
 import os
+import re
+import subprocess
+import threading
+import time
+from typing import List, Dict
+
+from utils.result_store import StatsSink
+
+STATS_MODES = ("auto", "cgroup", "stream")
+
+# cgroup v2 locations of a container's group (systemd and cgroupfs drivers)
+CGROUP_PATTERNS = (
+    "/sys/fs/cgroup/system.slice/docker-{id}.scope",
+    "/sys/fs/cgroup/docker/{id}",
+)
+
+_ANSI_ESCAPE = re.compile(r"\x1b\[[0-9;]*[A-Za-z]")
+
+def _format_mem(used_bytes: float, limit: str) -> str:
+    """Same shape as `docker stats` MemUsage, e.g. '4.117MiB / 512MiB'."""
+    if limit.strip() == "max":
+        limit_txt = "max"
+    else:
+        limit_txt = f"{int(limit) / 2**20:g}MiB"
+    return f"{used_bytes / 2**20:.3f}MiB / {limit_txt}"
+
+def _reap(proc: subprocess.Popen, timeout: float = 5.0):
+    """
+    Wait for `proc` to exit (killing it after `timeout`) and return its
+    rusage, which covers the process and the children it waited for.
+    Returns None where os.wait4 is unavailable or the process was already reaped.
+    """
+    if not hasattr(os, "wait4"):
+        try:
+            proc.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
+        return None
+    deadline = time.monotonic() + timeout
+    flags = os.WNOHANG
+    try:
+        while True:
+            pid, status, usage = os.wait4(proc.pid, flags)
+            if pid:
+                proc.returncode = os.waitstatus_to_exitcode(status)
+                return usage
+            if time.monotonic() >= deadline:
+                proc.kill()
+                flags = 0
+            else:
+                time.sleep(0.01)
+    except ChildProcessError:
+        proc.wait()
+        return None
 
 class DockerStatsLogger:
-    def __init__(self, exp_dir, vm_names, algo_name):
+    """
+    Per-container CPU/memory sampler writing docker_stats_<algo>.csv.
+
+    Modes:
+    - cgroup: reads cgroup v2 cpu.stat / memory.current of each container
+      directly, at any interval down to ~10 ms
+    - stream: keeps ONE `docker stats` session open and records every frame
+      it prints (Docker refreshes about once per second)
+    - auto: cgroup when every container's cgroup directory is readable, else stream
+
+    The CSV stays open behind a buffered writer for the whole run; stop()
+    returns the collector's own overhead (CPU time, samples, real interval).
+    In stream mode the CPU time includes the `docker stats` process itself,
+    which does most of the work, not only the reader thread.
+    """
+
+    def __init__(self, exp_dir, vm_names, algo_name, interval: float = 0.5, mode: str = "auto",
+                 columnar: bool = True):
+        if mode not in STATS_MODES:
+            raise ValueError(f"Unknown stats mode '{mode}' (expected one of {STATS_MODES})")
         self.exp_dir = exp_dir
         self.vm_names = vm_names
+        self.interval = interval
         self.stats_file = os.path.join(exp_dir, f"docker_stats_{algo_name}.csv")
-        with open(self.stats_file, "w", newline="") as f:
-            writer = csv.writer(f)
-            writer.writerow(["timestamp", "container", "cpu_percent", "mem_usage"])
+        self._file = open(self.stats_file, "w", newline="", buffering=1 << 16)
+        self._writer = csv.writer(self._file)
+        self._writer.writerow(["timestamp", "container", "cpu_percent", "mem_usage"])
+        self._lock = threading.Lock()
+        # Typed twin of the CSV that plot_docker_stats memory-maps
+        self.sink = StatsSink(exp_dir, algo_name, vm_names) if columnar else None
 
-    def log_stats(self):
+        self.cgroup_dirs = self._find_cgroup_dirs() if mode in ("auto", "cgroup") else None
+        if mode == "cgroup" and self.cgroup_dirs is None:
+            raise RuntimeError("cgroup v2 directories for the containers were not found")
+        self.mode = "cgroup" if self.cgroup_dirs else "stream"
+
+        self._stop = threading.Event()
+        self._thread = None
+        self._proc = None
+        self._prev_usage = {}
+        self.samples = 0
+        self.sample_time = 0.0   # wall time spent inside sampling calls
+        self.cpu_time = 0.0      # collector thread CPU time
+        self.child_cpu_time = None  # `docker stats` process CPU time (stream mode)
+        self.started_at = None
+        self.stopped_at = None
+
+    # ---------- cgroup v2 ----------
+
+    def _find_cgroup_dirs(self):
         try:
-            result = subprocess.run(
-                ["docker", "stats", "--no-stream", "--format", "{{.Name}}\t{{.CPUPerc}}\t{{.MemUsage}}"],
-                capture_output=True,
-                text=True,
-                timeout=5
+            result = subprocess.run(["docker", "inspect", "--format", "{{.Id}}", *self.vm_names],
+                                    capture_output=True, text=True, timeout=10)
+        except (OSError, subprocess.TimeoutExpired):
+            return None
+        ids = result.stdout.split()
+        if result.returncode != 0 or len(ids) != len(self.vm_names):
+            return None
+        dirs = {}
+        for vm, cid in zip(self.vm_names, ids):
+            for pattern in CGROUP_PATTERNS:
+                path = pattern.format(id=cid)
+                if os.path.exists(os.path.join(path, "cpu.stat")):
+                    dirs[vm] = path
+                    break
+            else:
+                return None
+        return dirs
+
+    def _sample_cgroups(self):
+        now = time.time()
+        rows = []
+        for vm, path in self.cgroup_dirs.items():
+            with open(os.path.join(path, "cpu.stat")) as f:
+                usage_usec = int(f.readline().split()[1])  # first line: usage_usec
+            with open(os.path.join(path, "memory.current")) as f:
+                mem = int(f.read())
+            with open(os.path.join(path, "memory.max")) as f:
+                mem_limit = f.read()
+
+            prev = self._prev_usage.get(vm)
+            self._prev_usage[vm] = (now, usage_usec)
+            if prev is None:
+                continue
+            elapsed_usec = (now - prev[0]) * 1e6
+            cpu = 100.0 * (usage_usec - prev[1]) / elapsed_usec if elapsed_usec > 0 else 0.0
+            rows.append([now, vm, f"{cpu:.2f}", _format_mem(mem, mem_limit)])
+            if self.sink:
+                self.sink.append((now, self.sink.code("container", vm), cpu, mem))
+        with self._lock:
+            self._writer.writerows(rows)
+
+    def _run_cgroup(self):
+        next_sample = time.perf_counter()
+        while not self._stop.is_set():
+            t0 = time.perf_counter()
+            try:
+                self._sample_cgroups()
+            except OSError as e:
+                print(f"Error logging stats: {e}")
+            self.sample_time += time.perf_counter() - t0
+            self.samples += 1
+            next_sample += self.interval
+            self._stop.wait(max(0.0, next_sample - time.perf_counter()))
+        self.cpu_time = time.thread_time()
+
+    # ---------- streaming docker stats ----------
+
+    def _run_stream(self):
+        for line in self._proc.stdout:
+            if self._stop.is_set():
+                break
+            t0 = time.perf_counter()
+            parts = _ANSI_ESCAPE.sub("", line).strip().split("\t")
+            if len(parts) >= 3:
+                now = time.time()
+                cpu = parts[1].rstrip('%')
+                with self._lock:
+                    self._writer.writerow([now, parts[0], cpu, parts[2]])
+                if self.sink:
+                    try:
+                        self.sink.append_sample(now, parts[0], float(cpu), parts[2])
+                    except ValueError:  # "--" while a container starts
+                        pass
+                self.samples += 1
+            self.sample_time += time.perf_counter() - t0
+        self.cpu_time = time.thread_time()
+
+    # ---------- public API ----------
+
+    def start(self):
+        self.started_at = time.time()
+        if self.mode == "cgroup":
+            target = self._run_cgroup
+        else:
+            target = self._run_stream
+            self._proc = subprocess.Popen(
+                ["docker", "stats", "--format", "{{.Name}}\t{{.CPUPerc}}\t{{.MemUsage}}", *self.vm_names],
+                stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True, bufsize=1
             )
-            output = result.stdout.strip()
-            if not output:
-                return
-
-            lines = output.split("\n")
-            timestamp = time.time()
-            with open(self.stats_file, "a", newline="") as f:
-                writer = csv.writer(f)
-                for line in lines:
-                    parts = line.split("\t")
-                    if len(parts) >= 3:
-                        container = parts[0]
-                        cpu = parts[1].rstrip('%')
-                        mem_usage = parts[2]
-                        writer.writerow([timestamp, container, cpu, mem_usage])
-        except subprocess.TimeoutExpired:
-            print("Docker stats command timed out.")
-        except Exception as e:
-            print(f"Error logging stats: {e}")
\ No newline at end of file
+        self._thread = threading.Thread(target=target, daemon=True)
+        self._thread.start()
+
+    def stop(self) -> Dict:
+        self._stop.set()
+        if self._proc and self._proc.returncode is None:
+            self._proc.terminate()
+            usage = _reap(self._proc)
+            if usage is not None:
+                self.child_cpu_time = usage.ru_utime + usage.ru_stime
+        if self._thread:
+            self._thread.join()
+        self.stopped_at = time.time()
+        with self._lock:
+            self._file.flush()
+            self._file.close()
+        if self.sink:
+            self.sink.close()
+        return self.overhead()
+
+    def overhead(self) -> Dict:
+        """The collector's own cost, so it can be reported next to the experiment."""
+        duration = (self.stopped_at or time.time()) - (self.started_at or time.time())
+        if self.mode == "cgroup":
+            real_interval = duration / self.samples if self.samples else None
+        else:
+            real_interval = duration * len(self.vm_names) / self.samples if self.samples else None
+        collector_cpu = self.cpu_time + (self.child_cpu_time or 0.0)
+        return {
+            "mode": self.mode,
+            "samples": self.samples,
+            "requested_interval_s": self.interval if self.mode == "cgroup" else None,
+            "real_interval_s": real_interval,
+            "sampling_time_s": self.sample_time,
+            "collector_cpu_s": collector_cpu,
+            "thread_cpu_s": self.cpu_time,
+            "child_cpu_s": self.child_cpu_time,
+            "cpu_overhead_percent": 100.0 * collector_cpu / duration if duration > 0 else 0.0,
+        }
+
@@ -1,24 +1,44 @@
 # utils/docker_stats_plotter.py
 import os
-import pandas as pd
 import matplotlib.pyplot as plt
 
-def plot_docker_stats(exp_dir: str, algo_name: str):
+from utils.result_store import read_stats, stats_path
+
+def _load_stats(exp_dir: str, algo_name: str):
+    """
+    {container: (relative_time, cpu_percent)} from the memory-mapped columnar
+    stats when present, else from the CSV.
+    """
+    if os.path.exists(stats_path(exp_dir, algo_name)):
+        records, containers = read_stats(exp_dir, algo_name)
+        if len(records) == 0:
+            return {}
+        t0 = records["timestamp"].min()
+        series = {}
+        for code, vm in enumerate(containers):
+            mask = records["container"] == code
+            if mask.any():
+                series[vm] = (records["timestamp"][mask] - t0, records["cpu_percent"][mask])
+        return series
+
     csv_path = os.path.join(exp_dir, f"docker_stats_{algo_name}.csv")
     if not os.path.exists(csv_path):
-        print(f"[WARN] No stats file for {algo_name}")
-        return
-
-    # Load data
+        return None
+    import pandas as pd
     df = pd.read_csv(csv_path)
     df['relative_time'] = df['timestamp'] - df['timestamp'].min()
+    return {vm: (group['relative_time'], group['cpu_percent'].astype(float))
+            for vm, group in df.groupby('container')}
 
-    # Group by container
-    vm_groups = df.groupby('container')
+def plot_docker_stats(exp_dir: str, algo_name: str):
+    series = _load_stats(exp_dir, algo_name)
+    if series is None:
+        print(f"[WARN] No stats file for {algo_name}")
+        return
 
     plt.figure(figsize=(12, 6))
-    for vm, group in vm_groups:
-        plt.plot(group['relative_time'], group['cpu_percent'].astype(float), label=vm, marker='o', markersize=3)
+    for vm, (rel_time, cpu) in series.items():
+        plt.plot(rel_time, cpu, label=vm, marker='o', markersize=3)
 
     plt.title(f"CPU Usage Over Time — {algo_name.upper()}")
     plt.xlabel("Time (seconds since start)")
@@ -1,28 +1,252 @@
 # utils/gantt_plotter.py
+import json
+import os
+from typing import List, Dict
+
+import numpy as np
 import matplotlib.pyplot as plt
-from collections import defaultdict
 
-def plot_gantt(schedule_results, exp_dir, vm_names, algo_name):
-    fig, ax = plt.subplots(figsize=(12, 6))
-    vm_tasks = defaultdict(list)
+# Lanes with more bars than this are merged at pixel resolution before drawing
+MAX_BARS_PER_LANE = 2000
+# A label is drawn only if its bar is at least this fraction of the time axis
+LABEL_MIN_FRACTION = 0.02
+# ... and never more than this many labels in one chart
+MAX_LABELS = 1500
+# Horizontal resolution the merge targets (~ pixels across the time axis)
+MERGE_RESOLUTION = 2400
+
+def _lanes_from_results(schedule_results: List[Dict], vm_names: List[str]) -> Dict[str, tuple]:
+    """{vm: (starts, ends, task_ids)} NumPy arrays from result dicts."""
+    by_vm = {vm: ([], [], []) for vm in vm_names}
+    for r in schedule_results:
+        lane = by_vm.setdefault(r["vm"], ([], [], []))
+        lane[0].append(r["start"])
+        lane[1].append(r["end"])
+        lane[2].append(r["task_id"])
+    return {vm: (np.asarray(s, dtype=float), np.asarray(e, dtype=float), np.asarray(t, dtype=np.int64))
+            for vm, (s, e, t) in by_vm.items()}
+
+def _lanes_from_records(records: np.ndarray, stored_vms: List[str]) -> Dict[str, tuple]:
+    """{vm: (starts, ends, task_ids)} straight from stored result records."""
+    lanes = {}
+    for code, vm in enumerate(stored_vms):
+        mask = records["vm"] == code
+        lanes[vm] = (records["start"][mask].astype(float), records["end"][mask].astype(float),
+                     records["task_id"][mask].astype(np.int64))
+    return lanes
+
+def merge_intervals(starts: np.ndarray, ends: np.ndarray, resolution: float):
+    """
+    Merge a lane's bars that overlap or sit closer than `resolution` (seconds).
+    Returns (starts, ends, counts) of the merged blocks, counts = tasks per block.
+    """
+    if len(starts) == 0:
+        return starts, ends, np.zeros(0, dtype=np.int64)
+    order = np.argsort(starts, kind="stable")
+    s, e = starts[order], ends[order]
+    reach = np.maximum.accumulate(e)
+    new_block = np.empty(len(s), dtype=bool)
+    new_block[0] = True
+    new_block[1:] = s[1:] > reach[:-1] + resolution
+    block_starts = np.flatnonzero(new_block)
+    block_ends = np.append(block_starts[1:], len(s)) - 1
+    return s[block_starts], reach[block_ends], np.diff(np.append(block_starts, len(s)))
 
+def _render_lanes(lanes: Dict[str, tuple], exp_dir, vm_names: List[str], algo_name: str,
+                  max_bars_per_lane: int = MAX_BARS_PER_LANE, html: bool = False):
+    """Draw one batched bar collection per VM lane (plus culled labels) and save the PNG."""
+    non_empty = [lane[0] for lane in lanes.values() if len(lane[0])]
+    if not non_empty:
+        return
     # Find the earliest start time to use as reference
-    min_start = min(r["start"] for r in schedule_results)
+    min_start = min(s.min() for s in non_empty)
+    span = max(lane[1].max() for lane in lanes.values() if len(lane[1])) - min_start or 1.0
 
-    for r in schedule_results:
-        # Convert to relative time (from min_start)
-        rel_start = r["start"] - min_start
-        rel_end = r["end"] - min_start
-        vm_tasks[r["vm"]].append((rel_start, rel_end, r["task_id"]))
+    fig, ax = plt.subplots(figsize=(12, max(6, 0.5 * len(vm_names))))
+    colors = plt.cm.tab10(np.arange(len(vm_names)) % 10)
+    label_width = span * LABEL_MIN_FRACTION
+    labels_left = MAX_LABELS
+    merged_lanes = 0
 
-    colors = plt.cm.tab10(range(len(vm_names)))
     for i, vm in enumerate(vm_names):
-        for start, end, tid in vm_tasks[vm]:
-            ax.barh(vm, end - start, left=start, color=colors[i], edgecolor='black', alpha=0.7)
-            ax.text(start + (end - start)/2, i, f"T{tid}", color="white", ha="center", va="center")
+        starts, ends, task_ids = lanes.get(vm, (np.zeros(0), np.zeros(0), np.zeros(0, dtype=np.int64)))
+        if len(starts) == 0:
+            continue
+        rel_start, rel_end = starts - min_start, ends - min_start
+
+        if len(starts) > max_bars_per_lane:
+            # Too dense to see individual tasks: draw busy blocks at pixel resolution
+            rel_start, rel_end, _ = merge_intervals(rel_start, rel_end, span / MERGE_RESOLUTION)
+            task_ids = None
+            merged_lanes += 1
+
+        widths = rel_end - rel_start
+        few = len(widths) <= 200
+        ax.broken_barh(np.column_stack([rel_start, widths]), (i - 0.4, 0.8),
+                       facecolors=colors[i], edgecolors="black" if few else "none",
+                       linewidth=0.5 if few else 0, alpha=0.7)
 
+        if task_ids is not None and labels_left > 0:
+            wide = np.flatnonzero(widths >= label_width)[:labels_left]
+            labels_left -= len(wide)
+            for j in wide:
+                ax.text(rel_start[j] + widths[j] / 2, i, f"T{task_ids[j]}", color="white",
+                        ha="center", va="center", fontsize=8, clip_on=True)
+
+    ax.set_yticks(range(len(vm_names)))
+    ax.set_yticklabels(vm_names)
+    ax.set_ylim(-0.6, len(vm_names) - 0.4)
+    ax.set_xlim(0, span)
     ax.set_xlabel("Time (seconds) since first task started")
-    ax.set_title(f"Gantt Chart of Task Execution per VM for {algo_name.upper()}")
+    title = f"Gantt Chart of Task Execution per VM for {algo_name.upper()}"
+    if merged_lanes:
+        title += f"\n({merged_lanes} dense lane(s) shown as merged busy blocks; see the HTML chart for detail)"
+    ax.set_title(title)
     plt.tight_layout()
     plt.savefig(f"{exp_dir}/gantt_chart_{algo_name}.png")
-    # plt.show()
\ No newline at end of file
+    plt.close(fig)
+    # plt.show()
+
+    if html:
+        write_gantt_html(lanes, exp_dir, vm_names, algo_name)
+
+def plot_gantt(schedule_results, exp_dir, vm_names, algo_name, max_bars_per_lane: int = MAX_BARS_PER_LANE,
+               html: bool = False):
+    """
+    Gantt chart of result dicts → gantt_chart_<algo>.png
+    (and gantt_chart_<algo>.html with html=True).
+    """
+    if not schedule_results:
+        return
+    _render_lanes(_lanes_from_results(schedule_results, vm_names), exp_dir, vm_names, algo_name,
+                  max_bars_per_lane, html)
+
+def plot_gantt_from_store(exp_dir, algo_name, vm_names=None, max_bars_per_lane: int = MAX_BARS_PER_LANE,
+                          html: bool = False):
+    """Gantt chart straight from the memory-mapped <algo>_results.bin (no CSV parse, no dicts)."""
+    from utils.result_store import read_results
+    records, stored_vms = read_results(exp_dir, algo_name)
+    if len(records) == 0:
+        return
+    _render_lanes(_lanes_from_records(records, stored_vms), exp_dir, vm_names or stored_vms, algo_name,
+                  max_bars_per_lane, html)
+
+def write_gantt_html(lanes: Dict[str, tuple], exp_dir, vm_names: List[str], algo_name: str) -> str:
+    """
+    Self-contained zoomable Gantt chart (canvas + inline data, no external
+    scripts): wheel to zoom, drag to pan, hover for task details.
+    Returns the HTML path.
+    """
+    non_empty = [lane[0] for lane in lanes.values() if len(lane[0])]
+    min_start = min(s.min() for s in non_empty) if non_empty else 0.0
+    data = {"title": f"Gantt Chart of Task Execution per VM for {algo_name.upper()}", "lanes": []}
+    for vm in vm_names:
+        starts, ends, task_ids = lanes.get(vm, (np.zeros(0), np.zeros(0), np.zeros(0, dtype=np.int64)))
+        order = np.argsort(starts, kind="stable")
+        data["lanes"].append({
+            "vm": vm,
+            "start": np.round(starts[order] - min_start, 6).tolist(),
+            "end": np.round(ends[order] - min_start, 6).tolist(),
+            "task": task_ids[order].tolist(),
+        })
+
+    path = os.path.join(exp_dir, f"gantt_chart_{algo_name}.html")
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(_HTML_TEMPLATE.replace("__DATA__", json.dumps(data, separators=(",", ":"))))
+    return path
+
+_HTML_TEMPLATE = """<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>Gantt chart</title>
+<style>
+body { font-family: sans-serif; margin: 10px; }
+canvas { border: 1px solid #ccc; cursor: grab; }
+#tip { position: absolute; background: #222; color: #fff; padding: 3px 6px; font-size: 12px;
+       border-radius: 3px; pointer-events: none; display: none; }
+</style></head>
+<body>
+<h3 id="title"></h3>
+<div>Wheel: zoom &middot; drag: pan &middot; double-click: reset</div>
+<canvas id="chart"></canvas><div id="tip"></div>
+<script>
+const DATA = __DATA__;
+const COLORS = ["#1f77b4","#ff7f0e","#2ca02c","#d62728","#9467bd","#8c564b","#e377c2","#7f7f7f","#bcbd22","#17becf"];
+const canvas = document.getElementById("chart"), ctx = canvas.getContext("2d"), tip = document.getElementById("tip");
+document.getElementById("title").textContent = DATA.title;
+const LEFT = 70, LANE_H = 28, TOP = 10, BOTTOM = 30;
+let maxT = 0;
+for (const l of DATA.lanes) for (const e of l.end) if (e > maxT) maxT = e;
+maxT = maxT || 1;
+// Running max of the end times (lanes are sorted by start): the first index whose
+// maxEnd reaches t is the first bar that can still overlap t, however long the bars
+for (const l of DATA.lanes) { let m = -Infinity; l.maxEnd = l.end.map(e => (m = Math.max(m, e))); }
+let t0 = 0, t1 = maxT;
+
+function resize() {
+  canvas.width = window.innerWidth - 30;
+  canvas.height = TOP + BOTTOM + LANE_H * DATA.lanes.length;
+  draw();
+}
+function x(t) { return LEFT + (t - t0) / (t1 - t0) * (canvas.width - LEFT); }
+function lowerBound(a, v) { let lo = 0, hi = a.length; while (lo < hi) { const m = (lo + hi) >> 1; if (a[m] < v) lo = m + 1; else hi = m; } return lo; }
+
+function draw() {
+  ctx.clearRect(0, 0, canvas.width, canvas.height);
+  const perPx = (t1 - t0) / (canvas.width - LEFT);
+  DATA.lanes.forEach((lane, i) => {
+    const y = TOP + i * LANE_H;
+    ctx.fillStyle = "#000"; ctx.font = "12px sans-serif"; ctx.textBaseline = "middle";
+    ctx.fillText(lane.vm, 5, y + LANE_H / 2);
+    ctx.fillStyle = COLORS[i % COLORS.length];
+    // Only bars that can be visible; sub-pixel neighbours are merged into one rect
+    let j = lowerBound(lane.maxEnd, t0);
+    let runS = null, runE = null;
+    for (; j < lane.start.length && lane.start[j] <= t1; j++) {
+      const s = lane.start[j], e = lane.end[j];
+      if (e < t0) continue;
+      if (runS !== null && s <= runE + perPx) { if (e > runE) runE = e; continue; }
+      if (runS !== null) ctx.fillRect(x(runS), y + 3, Math.max(1, x(runE) - x(runS)), LANE_H - 6);
+      runS = s; runE = e;
+    }
+    if (runS !== null) ctx.fillRect(x(runS), y + 3, Math.max(1, x(runE) - x(runS)), LANE_H - 6);
+  });
+  ctx.fillStyle = "#000"; ctx.textBaseline = "top";
+  for (let k = 0; k <= 10; k++) {
+    const t = t0 + (t1 - t0) * k / 10;
+    ctx.fillText(t.toFixed(3) + "s", x(t) - (k === 10 ? 50 : 0), canvas.height - BOTTOM + 8);
+  }
+}
+
+function taskAt(px, py) {
+  const i = Math.floor((py - TOP) / LANE_H), lane = DATA.lanes[i];
+  if (!lane || px < LEFT) return null;
+  const t = t0 + (px - LEFT) / (canvas.width - LEFT) * (t1 - t0), slack = (t1 - t0) / canvas.width * 2;
+  const last = lowerBound(lane.start, t + slack) - 1, first = lowerBound(lane.maxEnd, t - slack);
+  for (let j = last; j >= first; j--) {
+    if (lane.start[j] - slack <= t && t <= lane.end[j] + slack) return {vm: lane.vm, task: lane.task[j], s: lane.start[j], e: lane.end[j]};
+  }
+  return null;
+}
+
+let drag = null;
+canvas.addEventListener("wheel", ev => {
+  ev.preventDefault();
+  const t = t0 + (ev.offsetX - LEFT) / (canvas.width - LEFT) * (t1 - t0), f = ev.deltaY > 0 ? 1.25 : 0.8;
+  t0 = t - (t - t0) * f; t1 = t + (t1 - t) * f; draw();
+});
+canvas.addEventListener("mousedown", ev => { drag = {x: ev.offsetX, t0, t1}; canvas.style.cursor = "grabbing"; });
+window.addEventListener("mouseup", () => { drag = null; canvas.style.cursor = "grab"; });
+canvas.addEventListener("mousemove", ev => {
+  if (drag) {
+    const dt = (ev.offsetX - drag.x) / (canvas.width - LEFT) * (drag.t1 - drag.t0);
+    t0 = drag.t0 - dt; t1 = drag.t1 - dt; draw(); tip.style.display = "none"; return;
+  }
+  const hit = taskAt(ev.offsetX, ev.offsetY);
+  if (!hit) { tip.style.display = "none"; return; }
+  tip.textContent = `${hit.vm} · T${hit.task} · ${hit.s.toFixed(3)}s → ${hit.e.toFixed(3)}s (${(hit.e - hit.s).toFixed(3)}s)`;
+  tip.style.left = (ev.pageX + 12) + "px"; tip.style.top = (ev.pageY + 12) + "px"; tip.style.display = "block";
+});
+canvas.addEventListener("dblclick", () => { t0 = 0; t1 = maxT; draw(); });
+window.addEventListener("resize", resize);
+resize();
+</script></body></html>
+"""
@@ -1,14 +1,154 @@
 # utils/logger.py
+import atexit
+import itertools
+import json
 import os
+import queue
+import sys
+import threading
+import time
 from datetime import datetime
 
+# Log levels (same numbers as the stdlib logging module).
+# Per-task lines (one per assignment / completion) are logged at DEBUG.
+DEBUG = 10
+INFO = 20
+WARNING = 30
+ERROR = 40
+LEVELS = {"DEBUG": DEBUG, "INFO": INFO, "WARNING": WARNING, "ERROR": ERROR}
+LEVEL_NAMES = {v: k for k, v in LEVELS.items()}
+
+_STOP = object()
+
 class ExperimentLogger:
-    def __init__(self, exp_dir):
-        self.log_file = os.path.join(exp_dir, "schedule_log.txt")
-        with open(self.log_file, "w", encoding="utf-8") as f:
-            pass  
-
-    def log(self, message):
-        print(message)
-        with open(self.log_file, "a", encoding="utf-8") as f:
-            f.write(f"[{datetime.now().strftime('%H:%M:%S')}] {message}\n")
\ No newline at end of file
+    """
+    Queue-backed experiment logger.
+
+    log() only formats the line and puts it on a queue; a background thread
+    writes batches to schedule_log.txt (or schedule_log.jsonl in JSON Lines
+    mode) and the console, so schedulers and worker threads never block on
+    file I/O and their lines never interleave.
+
+    - level: messages below it are dropped
+    - debug_every: keep only every N-th DEBUG (per-task) line; 0 drops them all
+
+    If the writer thread dies (disk full, ...), flush() and close() raise its
+    exception instead of waiting forever.
+    """
+
+    def __init__(self, exp_dir, level: int = DEBUG, debug_every: int = 1, json_lines: bool = False,
+                 console: bool = True, flush_interval: float = 0.2, batch_size: int = 1000):
+        self.json_lines = json_lines
+        self.log_file = os.path.join(exp_dir, "schedule_log.jsonl" if json_lines else "schedule_log.txt")
+        self.level = level
+        self.debug_every = debug_every
+        self.console = console
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self.dropped = 0
+
+        self._debug_counter = itertools.count()
+        self._queue = queue.SimpleQueue()
+        self._file = open(self.log_file, "w", encoding="utf-8")
+        self._closed = False
+        self._error = None
+        self._writer = threading.Thread(target=self._write_loop, name="experiment-logger", daemon=True)
+        self._writer.start()
+        atexit.register(self.close)
+
+    def log(self, message, level: int = INFO, **fields):
+        """Queue one message; extra keyword fields are kept in JSON Lines mode."""
+        if level < self.level:
+            return
+        if level == DEBUG:
+            if self.debug_every <= 0 or next(self._debug_counter) % self.debug_every:
+                self.dropped += 1
+                return
+        self._queue.put((datetime.now(), level, message, fields))
+
+    def debug(self, message, **fields):
+        self.log(message, DEBUG, **fields)
+
+    def warning(self, message, **fields):
+        self.log(message, WARNING, **fields)
+
+    def error(self, message, **fields):
+        self.log(message, ERROR, **fields)
+
+    def _format(self, record):
+        ts, level, message, fields = record
+        if self.json_lines:
+            return json.dumps({"ts": ts.isoformat(), "level": LEVEL_NAMES.get(level, level),
+                               "msg": message, **fields}, ensure_ascii=False)
+        return f"[{ts.strftime('%H:%M:%S')}] {message}"
+
+    def _write_loop(self):
+        try:
+            self._write_batches()
+        except BaseException as e:
+            self._error = e
+            print(f"❌ Logger writer stopped: {e!r}", file=sys.stderr)
+
+    def _write_batches(self):
+        stopping = False
+        while not stopping:
+            try:
+                batch = [self._queue.get(timeout=self.flush_interval)]
+            except queue.Empty:
+                continue
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            lines = []
+            console_lines = []
+            markers = []
+            for record in batch:
+                if record is _STOP:
+                    stopping = True
+                elif isinstance(record, threading.Event):  # flush() marker
+                    markers.append(record)
+                else:
+                    lines.append(self._format(record))
+                    console_lines.append(str(record[2]))
+            if lines:
+                self._file.write("\n".join(lines) + "\n")
+                self._file.flush()
+                if self.console:
+                    sys.stdout.write("\n".join(console_lines) + "\n")
+                    sys.stdout.flush()
+            for marker in markers:
+                marker.set()
+
+    def _check_writer(self):
+        if self._error is not None:
+            raise RuntimeError(f"Log writer for {self.log_file} failed") from self._error
+        if not self._writer.is_alive():
+            raise RuntimeError(f"Log writer for {self.log_file} is not running")
+
+    def flush(self, timeout: float = 30.0):
+        """Block until everything logged so far has been written (TimeoutError after `timeout` s)."""
+        if self._closed:
+            return
+        self._check_writer()
+        marker = threading.Event()
+        self._queue.put(marker)
+        deadline = time.monotonic() + timeout
+        while not marker.wait(min(0.1, max(0.0, deadline - time.monotonic()))):
+            self._check_writer()
+            if time.monotonic() >= deadline:
+                raise TimeoutError(f"Log writer did not flush within {timeout}s")
+
+    def close(self, timeout: float = 30.0):
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(_STOP)
+        self._writer.join(timeout)
+        if self._writer.is_alive():
+            raise TimeoutError(f"Log writer did not finish within {timeout}s")
+        self._file.close()
+        if self._error is not None:
+            raise RuntimeError(f"Log writer for {self.log_file} failed") from self._error
@@ -0,0 +1,281 @@
+# utils/makespan_bounds.py
+import time
+from typing import List, Dict
+
+import numpy as np
+
+from algorithms.vm_selector import EarliestFinishSelector
+
+# ----------------------------
+# How far is a schedule from optimal? Our problem is Q||Cmax: independent
+# tasks (MI) on uniform machines (VMs with different MIPS), minimise makespan.
+#
+# - lower_bounds(): fluid (LP relaxation) bound, the optimal preemptive
+#   makespan (k largest tasks on the k fastest VMs) and a pigeonhole bound;
+#   one sort, so cheap for millions of tasks
+# - reference_solution(): LPT, then MULTIFIT, then branch-and-bound seeded
+#   with the best of the two, all within one time budget; proves optimality
+#   on small instances and otherwise gives a strong reference makespan
+#
+# Gaps compare each algorithm's *planned* makespan (sum of MI / MIPS per VM)
+# with these, so they measure the scheduling decision, not Docker noise.
+# ----------------------------
+
+DEADLINE_CHECK_EVERY = 4096  # tasks between clock reads in the per-task loops
+
+def lower_bounds(tasks_mi, vm_mips) -> Dict[str, float]:
+    """
+    {"fluid", "preemptive", "pigeonhole", "best"} lower bounds on the
+    optimal makespan, in seconds.
+    """
+    p = np.sort(np.asarray(tasks_mi, dtype=np.float64))[::-1]
+    s = np.sort(np.asarray(vm_mips, dtype=np.float64))[::-1]
+    if len(p) == 0 or len(s) == 0:
+        return {"fluid": 0.0, "preemptive": 0.0, "pigeonhole": 0.0, "best": 0.0}
+
+    fluid = float(p.sum() / s.sum())
+    # Preemptive optimum (Horvath et al. 1977): the k largest tasks need at
+    # least the k fastest VMs' combined time, for every k < VMs
+    k = min(len(p), len(s) - 1)
+    preemptive = fluid
+    if k > 0:
+        preemptive = max(fluid, float((np.cumsum(p[:k]) / np.cumsum(s[:k])).max()))
+    # Pigeonhole: of the VMs+1 largest tasks, two share a VM, at best the fastest
+    pigeonhole = float((p[len(s) - 1] + p[len(s)]) / s[0]) if len(p) > len(s) else 0.0
+    return {"fluid": fluid, "preemptive": preemptive, "pigeonhole": pigeonhole,
+            "best": max(fluid, preemptive, pigeonhole)}
+
+def planned_makespan(assignment: List[int], tasks_mi, vm_mips) -> float:
+    """Makespan of a task → VM index assignment (sum of MI / MIPS per VM)."""
+    loads = np.bincount(np.asarray(assignment, dtype=np.int64), weights=np.asarray(tasks_mi, dtype=np.float64),
+                        minlength=len(vm_mips))
+    return float((loads / np.asarray(vm_mips, dtype=np.float64)).max()) if len(loads) else 0.0
+
+def lpt_schedule(tasks_mi, vm_mips, deadline: float = None):
+    """
+    Longest processing time first onto the earliest-finishing VM. Returns
+    (assignment, makespan), or (None, inf) if time.time() passes `deadline` first.
+    """
+    tasks_mi = np.asarray(tasks_mi, dtype=np.float64)
+    selector = EarliestFinishSelector(list(range(len(vm_mips))), dict(enumerate(vm_mips)))
+    assignment = np.zeros(len(tasks_mi), dtype=np.int64)
+    makespan = 0.0
+    order = np.argsort(-tasks_mi, kind="stable")
+    for i, (task, mi) in enumerate(zip(order.tolist(), tasks_mi[order].tolist())):
+        if deadline is not None and i % DEADLINE_CHECK_EVERY == 0 and time.time() > deadline:
+            return None, float("inf")
+        assignment[task], load = selector.assign(mi)
+        makespan = max(makespan, load)
+    return assignment, makespan
+
+def _first_fit(order: List[int], sizes: List[float], vm_order: List[int], vm_mips, capacity: float,
+               deadline: float = None):
+    """
+    First-fit-decreasing of tasks into VMs with `capacity` seconds each; None if
+    something doesn't fit. Raises TimeoutError once time.time() passes `deadline`.
+    """
+    loads = [0.0] * len(vm_mips)
+    assignment = [0] * len(sizes)
+    for i, task in enumerate(order):
+        if deadline is not None and i % DEADLINE_CHECK_EVERY == 0 and time.time() > deadline:
+            raise TimeoutError
+        mi = sizes[task]
+        for vm in vm_order:
+            finish = loads[vm] + mi / vm_mips[vm]
+            if finish <= capacity:
+                loads[vm] = finish
+                assignment[task] = vm
+                break
+        else:
+            return None
+    return assignment, max(loads)
+
+def multifit_schedule(tasks_mi, vm_mips, lower: float = None, upper: float = None, iterations: int = 20,
+                      deadline: float = None):
+    """
+    MULTIFIT for uniform machines: bisect on the VM capacity, packing tasks
+    largest first with first fit, trying VMs slowest-first and fastest-first.
+    Stops at `deadline` (time.time()), also inside a packing pass.
+    Returns (assignment, makespan), or (None, inf) if no packing fit.
+    """
+    sizes = [float(mi) for mi in tasks_mi]
+    mips = [float(m) for m in vm_mips]
+    order = sorted(range(len(sizes)), key=lambda t: -sizes[t])
+    vm_orders = [sorted(range(len(mips)), key=lambda v: mips[v]), sorted(range(len(mips)), key=lambda v: -mips[v])]
+    lower = lower if lower is not None else lower_bounds(sizes, mips)["best"]
+    upper = upper if upper is not None else lpt_schedule(sizes, mips, deadline)[1]
+    if upper == float("inf"):
+        return None, float("inf")
+
+    best, best_makespan = None, float("inf")
+    lo, hi = lower, upper
+    for _ in range(iterations):
+        if deadline is not None and time.time() > deadline:
+            break
+        capacity = (lo + hi) / 2
+        packed = None
+        try:
+            for vm_order in vm_orders:
+                result = _first_fit(order, sizes, vm_order, mips, capacity, deadline)
+                if result and (packed is None or result[1] < packed[1]):
+                    packed = result
+        except TimeoutError:
+            break
+        if packed:
+            hi = capacity
+            if packed[1] < best_makespan:
+                best, best_makespan = packed
+        else:
+            lo = capacity
+        if hi - lo <= 1e-9 * max(hi, 1e-12):
+            break
+    return best, best_makespan
+
+def branch_and_bound(tasks_mi, vm_mips, incumbent: List[int] = None, incumbent_makespan: float = float("inf"),
+                     lower: float = 0.0, time_limit: float = 1.0):
+    """
+    Depth-first branch-and-bound over tasks in decreasing size. A node is cut
+    when its makespan so far or its fluid bound (assigned work + remaining MI
+    spread over all MIPS) can't beat the incumbent; VMs with the same speed
+    and load are tried once. Stops at `time_limit` seconds.
+    Returns (assignment, makespan, proved_optimal).
+    """
+    sizes = [float(mi) for mi in tasks_mi]
+    mips = [float(m) for m in vm_mips]
+    n, m = len(sizes), len(mips)
+    order = sorted(range(n), key=lambda t: -sizes[t])
+    total_speed = sum(mips)
+    remaining = [0.0] * (n + 1)  # MI still unassigned before depth d
+    for d in range(n - 1, -1, -1):
+        remaining[d] = remaining[d + 1] + sizes[order[d]]
+
+    best = list(incumbent) if incumbent is not None else None
+    best_makespan = incumbent_makespan
+    if n == 0 or best_makespan <= lower * (1 + 1e-9):
+        return best, best_makespan, n == 0 or best is not None
+
+    deadline = time.time() + time_limit
+    loads = [0.0] * m
+    work = [0.0] * m  # MI assigned per VM (for the fluid bound)
+    choice = [0] * n
+    stack = []  # per depth: candidate VMs still to try
+    depth = 0
+    nodes = 0
+    timed_out = False
+
+    def candidates(d):
+        mi = sizes[order[d]]
+        seen = set()
+        options = []
+        for vm in range(m):
+            key = (mips[vm], loads[vm])
+            if key in seen:
+                continue  # symmetric to a VM already tried
+            seen.add(key)
+            finish = loads[vm] + mi / mips[vm]
+            if finish < best_makespan - 1e-12:
+                options.append((finish, vm))
+        options.sort(reverse=True)  # popped from the end: earliest finish first
+        return [vm for _, vm in options]
+
+    stack.append(candidates(0))
+    while stack:
+        nodes += 1
+        if nodes % 4096 == 0 and time.time() > deadline:
+            timed_out = True
+            break
+        options = stack[-1]
+        if not options:
+            # Backtrack: undo the task placed at the previous depth
+            stack.pop()
+            depth -= 1
+            if depth < 0:
+                break
+            vm = choice[depth]
+            mi = sizes[order[depth]]
+            loads[vm] -= mi / mips[vm]
+            work[vm] -= mi
+            continue
+
+        vm = options.pop()
+        mi = sizes[order[depth]]
+        loads[vm] += mi / mips[vm]
+        work[vm] += mi
+        choice[depth] = vm
+        current = max(loads)
+        bound = max(current, (sum(work) + remaining[depth + 1]) / total_speed)
+        if bound >= best_makespan - 1e-12:
+            loads[vm] -= mi / mips[vm]
+            work[vm] -= mi
+            continue
+        if depth + 1 == n:
+            best_makespan = current
+            best = [0] * n
+            for d in range(n):
+                best[order[d]] = choice[d]
+            loads[vm] -= mi / mips[vm]
+            work[vm] -= mi
+            if best_makespan <= lower * (1 + 1e-9):
+                break  # matches the lower bound: optimal
+            continue
+        depth += 1
+        stack.append(candidates(depth))
+
+    optimal = not timed_out
+    return best, best_makespan, optimal
+
+def reference_solution(tasks_mi, vm_mips, time_limit: float = 2.0) -> Dict:
+    """
+    Lower bounds plus the best schedule LPT / MULTIFIT / branch-and-bound
+    find within `time_limit` seconds. "optimal" is True when the reference
+    is proven optimal (search finished, or it meets the lower bound).
+    time_limit <= 0 computes the bounds only (reference_makespan is NaN), and
+    so does a workload too big for LPT to finish in time ("timed_out").
+    """
+    t0 = time.time()
+    deadline = t0 + time_limit
+    bounds = lower_bounds(tasks_mi, vm_mips)
+    assignment, makespan = lpt_schedule(tasks_mi, vm_mips, deadline) if time_limit > 0 else (None, float("inf"))
+    if assignment is None:
+        return {"bounds": bounds, "lower_bound": bounds["best"], "reference_makespan": float("nan"),
+                "method": "none", "optimal": False, "timed_out": time_limit > 0, "elapsed_s": time.time() - t0,
+                "assignment": []}
+    method = "lpt"
+
+    if makespan > bounds["best"] * (1 + 1e-9) and time.time() < deadline:
+        packed, packed_makespan = multifit_schedule(tasks_mi, vm_mips, bounds["best"], makespan, deadline=deadline)
+        if packed is not None and packed_makespan < makespan - 1e-12:
+            assignment, makespan, method = packed, packed_makespan, "multifit"
+
+    optimal = makespan <= bounds["best"] * (1 + 1e-9)
+    if not optimal and time.time() < deadline:
+        found, found_makespan, optimal = branch_and_bound(tasks_mi, vm_mips, list(assignment), makespan,
+                                                          bounds["best"], deadline - time.time())
+        if found_makespan < makespan - 1e-12:
+            assignment, makespan, method = found, found_makespan, "branch_and_bound"
+
+    lower = makespan if optimal else bounds["best"]
+    return {
+        "bounds": bounds,
+        "lower_bound": lower,
+        "reference_makespan": makespan,
+        "method": method,
+        "optimal": bool(optimal),
+        "timed_out": time.time() > deadline,
+        "elapsed_s": time.time() - t0,
+        "assignment": [int(vm) for vm in assignment],
+    }
+
+def optimality_gap(makespan: float, reference: float) -> float:
+    """Percent by which `makespan` exceeds `reference` (0 = matches it)."""
+    if not reference > 0:
+        return float("nan")
+    return 100.0 * (makespan / reference - 1.0)
+
+def records_planned_makespan(records: np.ndarray, vm_names: List[str], vm_mips: Dict[str, float]) -> float:
+    """Planned makespan of stored result records (result_store): MI run on each VM / its MIPS."""
+    if len(records) == 0:
+        return 0.0
+    loads = np.bincount(records["vm"], weights=records["duration"], minlength=len(vm_names))
+    speeds = np.array([vm_mips.get(vm, np.nan) for vm in vm_names], dtype=np.float64)
+    return float(np.nanmax(np.where(loads > 0, loads / speeds, 0.0)))
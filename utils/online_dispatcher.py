@@ -0,0 +1,259 @@
+# utils/online_dispatcher.py
+import contextvars
+import heapq
+import queue
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict
+
+import numpy as np
+
+from utils.docker_executor import (VMWorkerDaemon, execution_setting, run_single_task_in_daemon,
+                                   run_single_task_in_vm)
+from utils.logger import DEBUG
+from utils.task_source import iter_task_tuples
+
+# ----------------------------
+# Online scheduling: tasks arrive over time and every placement decision is
+# made when a task arrives or a VM slot frees up, from the live queue state.
+#
+# - pull policies (fcfs, sjf, priority): arrivals wait in one central queue
+#   ordered by the policy; whenever a slot is free the head of the queue starts
+#   on the fastest free VM
+# - push policies (greedy): each arrival is placed immediately on the VM with
+#   the earliest estimated finish given that VM's current backlog, and waits
+#   in that VM's FIFO queue
+# ----------------------------
+
+PULL_POLICY_KEYS = {
+    "fcfs": lambda task: task["arrival"],
+    "sjf": lambda task: task["mi"],
+    "priority": lambda task: task["mi"] / task["sla"] if task.get("sla") else float("inf"),
+}
+PUSH_POLICIES = ("greedy",)
+ONLINE_POLICIES = tuple(PULL_POLICY_KEYS) + PUSH_POLICIES
+
+def arrival_times(tasks: List[Dict], rate: float = None, seed: int = None) -> np.ndarray:
+    """
+    Arrival time (seconds from the start) of every task:
+    - rate given: Poisson process with `rate` tasks/s (exponential gaps, seeded)
+    - else each task's "arrival" field
+    - else everything arrives at 0 (a batch; also plain MI lists)
+    """
+    if rate:
+        gaps = np.random.default_rng(seed).exponential(1.0 / rate, size=len(tasks))
+        return np.cumsum(gaps) - gaps[0]
+    return np.array([float(task.get("arrival", 0.0)) if isinstance(task, dict) else 0.0 for task in tasks])
+
+class OnlineDispatcher:
+    """
+    Placement decisions for one online run. Drivers feed it events and start
+    whatever (task, vm) pairs it returns:
+        arrive(task)          → pairs to start now
+        complete(task, vm)    → pairs to start now
+    Tasks are dicts with task_id, mi, arrival (and sla for priority).
+    With an `estimator` (utils.capacity_estimator), decisions use the speeds
+    learned from completions so far instead of the configured MIPS.
+    """
+
+    def __init__(self, policy: str, vm_mips: Dict[str, float], slots_per_vm: int = 1, logger=None,
+                 estimator=None):
+        if policy not in ONLINE_POLICIES:
+            raise ValueError(f"Unknown online policy '{policy}' (expected one of {ONLINE_POLICIES})")
+        self.policy = policy
+        self.push = policy in PUSH_POLICIES
+        self.key = PULL_POLICY_KEYS.get(policy)
+        self.slots = slots_per_vm
+        self.slot_speed = {vm: mips / slots_per_vm for vm, mips in vm_mips.items()}
+        # Fastest VMs first, so an idle fast VM is preferred over an idle slow one
+        self.vm_order = sorted(vm_mips, key=lambda vm: -vm_mips[vm])
+        self.free = {vm: slots_per_vm for vm in vm_mips}
+        self.waiting = []                             # pull: heap of (key, seq, task)
+        self.vm_queues = {vm: deque() for vm in vm_mips}  # push: per-VM FIFO
+        self.backlog_mi = {vm: 0.0 for vm in vm_mips}    # push: queued + running MI per VM
+        self._seq = 0
+        self.logger = logger
+        self.estimator = estimator
+
+    def speed(self, vm: str) -> float:
+        """Per-slot speed used for decisions: learned if available, else configured."""
+        if self.estimator is None:
+            return self.slot_speed[vm]
+        return self.estimator.speed(vm, self.slot_speed[vm] * self.slots) / self.slots
+
+    def _log(self, task: Dict, vm: str, detail: str):
+        msg = f"[ONLINE-{self.policy.upper()}] Task {task['task_id']} ({task['mi']} MI) → {vm} | {detail}"
+        if self.logger:
+            self.logger.log(msg, level=DEBUG)
+        else:
+            print(msg)
+
+    def arrive(self, task: Dict) -> List[tuple]:
+        if self.push:
+            vm = min(self.vm_order, key=lambda v: (self.backlog_mi[v] / self.slots + task["mi"]) / self.speed(v))
+            self.backlog_mi[vm] += task["mi"]
+            self.vm_queues[vm].append(task)
+            self._log(task, vm, f"backlog: {self.backlog_mi[vm]:.1f} MI")
+            return self._start_push(vm)
+        heapq.heappush(self.waiting, (self.key(task), self._seq, task))
+        self._seq += 1
+        return self._start_pull()
+
+    def complete(self, task: Dict, vm: str) -> List[tuple]:
+        self.free[vm] += 1
+        if self.push:
+            self.backlog_mi[vm] -= task["mi"]
+            return self._start_push(vm)
+        return self._start_pull()
+
+    def _start_push(self, vm: str) -> List[tuple]:
+        started = []
+        queue_ = self.vm_queues[vm]
+        while queue_ and self.free[vm] > 0:
+            self.free[vm] -= 1
+            started.append((queue_.popleft(), vm))
+        return started
+
+    def _start_pull(self) -> List[tuple]:
+        started = []
+        while self.waiting:
+            free = [v for v in self.vm_order if self.free[v] > 0]
+            if not free:
+                break
+            vm = free[0] if self.estimator is None else max(free, key=self.speed)
+            task = heapq.heappop(self.waiting)[2]
+            self.free[vm] -= 1
+            self._log(task, vm, f"queued: {len(self.waiting)}")
+            started.append((task, vm))
+        return started
+
+def _online_tasks(tasks: List[Dict], arrivals: np.ndarray) -> List[Dict]:
+    """Task dicts for the dispatcher (task dicts or plain MI values in), in arrival order."""
+    items = [{"task_id": i, "mi": mi, "sla": sla, "arrival": float(arrivals[i])}
+             for i, mi, sla in iter_task_tuples(tasks)]
+    items.sort(key=lambda t: t["arrival"])
+    return items
+
+def simulate_online(tasks: List[Dict], arrivals: np.ndarray, policy: str, vm_mips: Dict[str, float],
+                    slots_per_vm: int = 1, dispatch_overhead: float = 0.0, logger=None) -> List[Dict]:
+    """
+    Discrete-event online run (no Docker): same slot model as utils.simulator,
+    times in simulated seconds from 0. Result dicts carry an extra "arrival".
+    """
+    dispatcher = OnlineDispatcher(policy, vm_mips, slots_per_vm, logger)
+    events = []  # (time, kind, seq, task, vm): completions (kind 0) before arrivals (kind 1)
+    for seq, task in enumerate(_online_tasks(tasks, arrivals)):
+        events.append((task["arrival"], 1, seq, task, None))
+    heapq.heapify(events)
+    seq = len(events)
+    results = []
+
+    while events:
+        now, kind, _, task, vm = heapq.heappop(events)
+        if kind == 0:
+            started = dispatcher.complete(task, vm)
+        else:
+            started = dispatcher.arrive(task)
+        for task, vm in started:
+            end = now + dispatch_overhead + task["mi"] / dispatcher.slot_speed[vm]
+            results.append({"task_id": task["task_id"], "vm": vm, "duration": task["mi"], "start": now,
+                            "end": end, "arrival": task["arrival"], "stdout": "", "stderr": ""})
+            heapq.heappush(events, (end, 0, seq, task, vm))
+            seq += 1
+
+    sink = execution_setting("result_sink")
+    if sink is not None:
+        sink.extend_events(results)
+    return results
+
+def run_online(tasks: List[Dict], arrivals: np.ndarray, policy: str, vm_names: List[str],
+               vm_mips: Dict[str, float], slots_per_vm: int = 1, worker: str = "exec", logger=None) -> List[Dict]:
+    """
+    Online run on the containers. Arrivals are replayed in wall-clock time;
+    the calling thread is the dispatcher and each started task runs on a
+    thread of its own (always the thread backend, whatever `backend` says).
+    Result dicts carry an extra "arrival" (epoch seconds).
+    """
+    vm_mips = {vm: vm_mips[vm] for vm in vm_names}
+    dispatcher = OnlineDispatcher(policy, vm_mips, slots_per_vm, logger, execution_setting("capacity_estimator"))
+    pending = _online_tasks(tasks, arrivals)
+    completions = queue.SimpleQueue()
+    idle_daemons = {vm: [] for vm in vm_names}
+    all_daemons = []
+    results = []
+
+    def execute(task: Dict, vm: str) -> Dict:
+        if worker == "daemon":
+            daemon = idle_daemons[vm].pop() if idle_daemons[vm] else None
+            if daemon is None:
+                daemon = VMWorkerDaemon(vm)
+                all_daemons.append(daemon)
+            try:
+                return run_single_task_in_daemon(daemon, task["mi"], task["task_id"], logger)
+            finally:
+                idle_daemons[vm].append(daemon)
+        return run_single_task_in_vm(vm, task["mi"], task["task_id"], logger)
+
+    executor = ThreadPoolExecutor(max_workers=len(vm_names) * slots_per_vm)
+
+    def launch(started: List[tuple]):
+        for task, vm in started:
+            # Copy the caller's context so execution_overrides (sink, pool aliases) apply
+            future = executor.submit(contextvars.copy_context().run, execute, task, vm)
+            future.add_done_callback(lambda f, task=task, vm=vm: completions.put((task, vm, f)))
+
+    t0 = time.time()
+    next_arrival = 0
+    try:
+        while len(results) < len(pending):
+            now = time.time() - t0
+            while next_arrival < len(pending) and pending[next_arrival]["arrival"] <= now:
+                launch(dispatcher.arrive(pending[next_arrival]))
+                next_arrival += 1
+            timeout = pending[next_arrival]["arrival"] - now if next_arrival < len(pending) else None
+            try:
+                task, vm, future = completions.get(timeout=timeout)
+            except queue.Empty:
+                continue
+            event = future.result()
+            event["arrival"] = t0 + task["arrival"]
+            results.append(event)
+            launch(dispatcher.complete(task, vm))
+    finally:
+        executor.shutdown(wait=True)
+        for daemon in all_daemons:
+            daemon.close()
+    return results
+
+def run_online_policy(policy: str, tasks: List[Dict], vm_names: List[str], vm_mips: Dict[str, float],
+                      logger=None, arrival_rate: float = None, seed: int = None) -> List[Dict]:
+    """Online run with the current execution settings (sim backend → simulate_online)."""
+    arrivals = arrival_times(tasks, arrival_rate, seed)
+    slots = execution_setting("slots_per_vm")
+    source = f"Poisson {arrival_rate:g} tasks/s" if arrival_rate else "task file"
+    msg = f"[ONLINE-{policy.upper()}] {len(tasks)} arrivals over {arrivals.max() if len(arrivals) else 0:.2f}s ({source})"
+    (logger.log(msg) if logger else print(msg))
+    if execution_setting("backend") == "sim":
+        return simulate_online(tasks, arrivals, policy, {vm: vm_mips[vm] for vm in vm_names}, slots,
+                               execution_setting("sim_overhead"), logger)
+    return run_online(tasks, arrivals, policy, vm_names, vm_mips, slots, execution_setting("worker"), logger)
+
+def response_metrics(results: List[Dict]) -> Dict:
+    """Response/waiting time percentiles and throughput of an online run."""
+    if not results:
+        return {}
+    arrival = np.array([r["arrival"] for r in results])
+    start = np.array([r["start"] for r in results])
+    end = np.array([r["end"] for r in results])
+    response = end - arrival
+    span = end.max() - arrival.min()
+    return {
+        "tasks": len(results),
+        "mean_response_s": float(response.mean()),
+        "p50_response_s": float(np.percentile(response, 50)),
+        "p95_response_s": float(np.percentile(response, 95)),
+        "max_response_s": float(response.max()),
+        "mean_wait_s": float((start - arrival).mean()),
+        "throughput_tps": len(results) / span if span > 0 else float("inf"),
+    }
@@ -0,0 +1,202 @@
+# utils/report_builder.py
+"""
+Chart rendering as its own stage, off the experiment's critical path.
+
+Charts are rendered in a process pool from the stored results only
+(<algo>_results.bin / .csv, docker_stats_<algo>.bin / .csv), so the next
+algorithm can start while the previous one's PNGs are drawn, and a finished
+(or crashed) experiment can be re-rendered later:
+
+    python -m utils.report_builder results/experiment_2025-12-14_17-16-09[100 task]
+
+report_manifest.json records a hash of each chart's inputs; charts whose
+inputs haven't changed are skipped.
+"""
+import argparse
+import csv
+import glob
+import hashlib
+import json
+import multiprocessing as mp
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Dict
+
+from utils.result_store import results_path, stats_path
+
+REPORT_MANIFEST = "report_manifest.json"
+
+# Bump when a plotter changes so existing charts are re-rendered
+RENDER_VERSION = 2
+
+def _existing(paths: List[str]) -> List[str]:
+    return [p for p in paths if os.path.exists(p)]
+
+def report_jobs(exp_dir: str, algo_name: str) -> List[Dict]:
+    """The charts one algorithm needs, with the stored files each is drawn from."""
+    jobs = []
+    results_bin = results_path(exp_dir, algo_name)
+    if os.path.exists(results_bin):
+        gantt_inputs = [results_bin, results_bin + ".json"]
+    else:
+        gantt_inputs = _existing([os.path.join(exp_dir, f"{algo_name}_results.csv")])
+    if gantt_inputs:
+        jobs.append({"kind": "gantt", "algo": algo_name, "inputs": gantt_inputs,
+                     "output": os.path.join(exp_dir, f"gantt_chart_{algo_name}.png"),
+                     "extra_outputs": [os.path.join(exp_dir, f"gantt_chart_{algo_name}.html")]})
+
+    stats_bin = stats_path(exp_dir, algo_name)
+    if os.path.exists(stats_bin):
+        stats_inputs = [stats_bin, stats_bin + ".json"]
+    else:
+        stats_inputs = _existing([os.path.join(exp_dir, f"docker_stats_{algo_name}.csv")])
+    if stats_inputs:
+        jobs.append({"kind": "docker_stats", "algo": algo_name, "inputs": stats_inputs,
+                     "output": os.path.join(exp_dir, f"docker_cpu_{algo_name}.png")})
+    return jobs
+
+def input_hash(job: Dict) -> str:
+    digest = hashlib.sha256(f"{job['kind']}:{RENDER_VERSION}".encode())
+    for path in job["inputs"]:
+        digest.update(os.path.basename(path).encode())
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                digest.update(chunk)
+    return digest.hexdigest()
+
+def _load_csv_results(path: str) -> List[Dict]:
+    with open(path, newline="") as f:
+        return [{"task_id": int(row["task_id"]), "vm": row["vm"], "duration": float(row["duration"]),
+                 "start": float(row["start"]), "end": float(row["end"])}
+                for row in csv.DictReader(f)]
+
+def _config_vm_names(exp_dir: str):
+    config_path = os.path.join(exp_dir, "config.json")
+    if not os.path.exists(config_path):
+        return None
+    with open(config_path) as f:
+        return list(json.load(f).get("vm_config", {})) or None
+
+def _render(exp_dir: str, job: Dict) -> str:
+    """Runs in a worker process: draw one chart from stored files."""
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    try:
+        if job["kind"] == "gantt":
+            from utils.gantt_plotter import plot_gantt, plot_gantt_from_store
+            vm_names = _config_vm_names(exp_dir)
+            if job["inputs"][0].endswith(".bin"):
+                plot_gantt_from_store(exp_dir, job["algo"], vm_names, html=True)
+            else:
+                results = _load_csv_results(job["inputs"][0])
+                if results:
+                    plot_gantt(results, exp_dir, vm_names or sorted({r["vm"] for r in results}), job["algo"],
+                               html=True)
+        else:
+            from utils.docker_stats_plotter import plot_docker_stats
+            plot_docker_stats(exp_dir, job["algo"])
+    finally:
+        plt.close("all")
+    return job["output"]
+
+class ReportBuilder:
+    """
+    Process pool rendering an experiment's charts.
+    submit() queues one algorithm's charts as soon as its results are stored;
+    wait() blocks until everything submitted is drawn and updates the manifest.
+    """
+
+    def __init__(self, exp_dir: str, max_workers: int = None, force: bool = False, logger=None):
+        self.exp_dir = exp_dir
+        self.force = force
+        self.logger = logger
+        self.manifest_path = os.path.join(exp_dir, REPORT_MANIFEST)
+        self.manifest = {}
+        if os.path.exists(self.manifest_path):
+            with open(self.manifest_path) as f:
+                self.manifest = json.load(f)
+        # spawn: the experiment process has logger/executor threads that fork would copy mid-state
+        self._executor = ProcessPoolExecutor(max_workers=max_workers or min(4, os.cpu_count() or 1),
+                                             mp_context=mp.get_context("spawn"))
+        self._pending = []
+        self.rendered = []
+        self.skipped = []
+        self.failed = []
+
+    def _log(self, message):
+        if self.logger:
+            self.logger.log(message)
+        else:
+            print(message)
+
+    def submit(self, algo_name: str):
+        for job in report_jobs(self.exp_dir, algo_name):
+            name = os.path.basename(job["output"])
+            digest = input_hash(job)
+            outputs = [job["output"], *job.get("extra_outputs", [])]
+            if not self.force and all(map(os.path.exists, outputs)) and self.manifest.get(name) == digest:
+                self.skipped.append(name)
+                continue
+            self._pending.append((name, digest, self._executor.submit(_render, self.exp_dir, job)))
+
+    def wait(self) -> Dict:
+        """Finish every submitted chart; returns {"rendered", "skipped", "failed"} file names."""
+        for name, digest, future in self._pending:
+            try:
+                future.result()
+            except Exception as e:
+                self.failed.append(name)
+                self._log(f"❌ Report {name} failed: {e}")
+                continue
+            self.manifest[name] = digest
+            self.rendered.append(name)
+        self._pending = []
+
+        tmp_path = self.manifest_path + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(self.manifest, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.manifest_path)
+        return {"rendered": self.rendered, "skipped": self.skipped, "failed": self.failed}
+
+    def close(self):
+        self._executor.shutdown(wait=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+def stored_algorithms(exp_dir: str) -> List[str]:
+    """Algorithms with stored results in an experiment directory."""
+    names = set()
+    for path in glob.glob(os.path.join(glob.escape(exp_dir), "*_results.*")):
+        base = os.path.basename(path)
+        if base.endswith((".bin", ".csv")):
+            names.add(base.rsplit("_results.", 1)[0])
+    return sorted(names)
+
+def build_reports(exp_dir: str, algorithms: List[str] = None, force: bool = False,
+                  max_workers: int = None, logger=None) -> Dict:
+    """(Re)render every chart of an experiment from its stored results."""
+    with ReportBuilder(exp_dir, max_workers=max_workers, force=force, logger=logger) as builder:
+        for algo_name in algorithms or stored_algorithms(exp_dir):
+            builder.submit(algo_name)
+        return builder.wait()
+
+def main():
+    parser = argparse.ArgumentParser(description="Render an experiment's charts from its stored results.")
+    parser.add_argument("exp_dir", help="results/experiment_... directory")
+    parser.add_argument("--algorithms", nargs="+", help="Only these algorithms (default: all with stored results)")
+    parser.add_argument("--force", action="store_true", help="Re-render charts even if their inputs are unchanged")
+    parser.add_argument("--workers", type=int, default=None, help="Rendering processes")
+    args = parser.parse_args()
+
+    report = build_reports(args.exp_dir, args.algorithms, args.force, args.workers)
+    print(f"🖼️  Charts: {len(report['rendered'])} rendered, {len(report['skipped'])} unchanged, "
+          f"{len(report['failed'])} failed")
+
+if __name__ == "__main__":
+    main()
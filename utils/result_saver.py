@@ -2,8 +2,34 @@
 import os
 import json
 import csv
+import math
 from datetime import datetime
 
+from utils.result_store import TIMING_FIELDS
+
+# Optional makespan_summary.csv columns, by metric key (optimality gaps from
+# utils/makespan_bounds.py, overheads from result_store.overhead_summary())
+SUMMARY_COLUMNS = {
+    "planned_makespan": "Planned makespan (s)",
+    "gap_percent": "Gap vs lower bound (%)",
+    "reference_gap_percent": "Gap vs reference (%)",
+    "mean_spawn_s": "Mean spawn (s)",
+    "mean_startup_s": "Mean startup (s)",
+    "mean_compute_s": "Mean compute (s)",
+    "mean_return_s": "Mean return (s)",
+    "mean_cpu_s": "Mean CPU (s)",
+    "overhead_percent": "Overhead (%)",
+}
+
+def _cell(value):
+    """Blank for NaN (phase not measured)."""
+    if isinstance(value, float):
+        if math.isnan(value):
+            return ""
+        if value == 0.0:
+            return 0.0  # rounding a tiny negative gap gives -0.0; write it as 0
+    return value
+
 def create_experiment_dir():
     timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
     exp_dir = f"results/experiment_{timestamp}"
@@ -20,19 +46,42 @@ def save_config(exp_dir, vm_config, task_params):
 
 def save_results_csv(exp_dir, schedule_results, algo_name):
     filepath = f"{exp_dir}/{algo_name}_results.csv"
-    fieldnames = ["task_id", "duration", "vm", "start", "end"]
+    fieldnames = ["task_id", "duration", "vm", "start", "end", *TIMING_FIELDS]
     
     with open(filepath, "w", newline="", encoding="utf-8") as f:
         writer = csv.DictWriter(f, fieldnames=fieldnames)
         writer.writeheader()
         for row in schedule_results:
             # Keep only the needed keys
-            filtered_row = {k: row[k] for k in fieldnames if k in row}
+            filtered_row = {k: _cell(row[k]) for k in fieldnames if k in row}
             writer.writerow(filtered_row)
 
-def save_summary_csv(exp_dir, summary):
+def save_summary_csv(exp_dir, summary, metrics=None):
+    """
+    makespan_summary.csv; `metrics` ({algo: {SUMMARY_COLUMNS key: value}})
+    adds optimality gaps and the mean per-task phase times.
+    """
+    metrics = metrics or {}
+    columns = [key for key in SUMMARY_COLUMNS if any(key in m for m in metrics.values())]
     with open(f"{exp_dir}/makespan_summary.csv", "w") as f:
         writer = csv.writer(f)
-        writer.writerow(["Algorithm", "Makespan (s)"])
+        writer.writerow(["Algorithm", "Makespan (s)"] + [SUMMARY_COLUMNS[key] for key in columns])
         for algo, ms in summary.items():
-            writer.writerow([algo, f"{ms:.2f}"])
\ No newline at end of file
+            extra = [metrics.get(algo, {}).get(key, float("nan")) for key in columns]
+            writer.writerow([algo, f"{ms:.2f}"] + [_cell(round(v, 4)) for v in extra])
+
+def save_records_csv(exp_dir, records, vm_names, algo_name, chunk_size=100_000):
+    """Same CSV as save_results_csv, written chunk by chunk from stored result records."""
+    filepath = f"{exp_dir}/{algo_name}_results.csv"
+
+    with open(filepath, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        phases = [field for field in TIMING_FIELDS if field in (records.dtype.names or ())]
+        writer.writerow(["task_id", "duration", "vm", "start", "end", *phases])
+        for offset in range(0, len(records), chunk_size):
+            part = records[offset:offset + chunk_size]
+            durations = [int(v) if v.is_integer() else v for v in part["duration"].tolist()]
+            writer.writerows(zip(part["task_id"].tolist(), durations,
+                                 [vm_names[code] for code in part["vm"].tolist()],
+                                 part["start"].tolist(), part["end"].tolist(),
+                                 *([_cell(v) for v in part[field].tolist()] for field in phases)))
@@ -0,0 +1,212 @@
+# utils/result_store.py
+import json
+import os
+import re
+import threading
+from typing import List, Dict
+
+import numpy as np
+
+# ----------------------------
+# Append-only columnar storage (NumPy structured records).
+# <name>.bin holds raw fixed-size records, <name>.bin.json the dtype and
+# category tables (e.g. VM names). Records are appended as they arrive, so a
+# crash loses at most the unflushed buffer, and readers memory-map the file
+# instead of parsing CSV.
+# ----------------------------
+
+RESULT_DTYPE = np.dtype([
+    ("task_id", "<i8"),
+    ("vm", "<i4"),          # index into meta["categories"]["vm"]
+    ("duration", "<f8"),    # task size (MI)
+    ("start", "<f8"),       # dispatched by the executor
+    ("end", "<f8"),         # result back in the executor
+    # Overhead breakdown (see utils/docker_executor.py); NaN when not measured (e.g. sim)
+    ("spawn_s", "<f8"),
+    ("startup_s", "<f8"),
+    ("compute_s", "<f8"),
+    ("return_s", "<f8"),
+    ("cpu_s", "<f8"),
+])
+TIMING_FIELDS = ("spawn_s", "startup_s", "compute_s", "return_s", "cpu_s")
+
+STATS_DTYPE = np.dtype([
+    ("timestamp", "<f8"),
+    ("container", "<i4"),   # index into meta["categories"]["container"]
+    ("cpu_percent", "<f4"),
+    ("mem_bytes", "<f8"),
+])
+
+_NAN = float("nan")
+
+_MEM_UNITS = {"B": 1, "KIB": 2**10, "MIB": 2**20, "GIB": 2**30, "KB": 1e3, "MB": 1e6, "GB": 1e9}
+
+def parse_mem_usage(mem_usage: str) -> float:
+    """Bytes used from a docker-stats style '4.117MiB / 512MiB' string (NaN if unparsable)."""
+    match = re.match(r"\s*([\d.]+)\s*([A-Za-z]+)", mem_usage)
+    if not match or match.group(2).upper() not in _MEM_UNITS:
+        return float("nan")
+    return float(match.group(1)) * _MEM_UNITS[match.group(2).upper()]
+
+class ColumnarWriter:
+    """
+    Buffered, thread-safe appender of `dtype` records to `path`.
+    Categorical string fields (listed in `categories`) are stored as int32
+    codes; their tables live in the JSON sidecar.
+    """
+
+    def __init__(self, path: str, dtype: np.dtype, categories: Dict[str, List[str]] = None,
+                 flush_every: int = 1024):
+        self.path = path
+        self.dtype = dtype
+        self.flush_every = flush_every
+        self.categories = {name: list(values) for name, values in (categories or {}).items()}
+        self._codes = {name: {v: i for i, v in enumerate(values)} for name, values in self.categories.items()}
+        self._buffer = []
+        self._lock = threading.Lock()
+        self._meta_dirty = True
+        self.count = 0
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._file = open(path, "wb")
+        self._write_meta()
+
+    def code(self, field: str, value: str) -> int:
+        codes = self._codes[field]
+        if value not in codes:
+            codes[value] = len(self.categories[field])
+            self.categories[field].append(value)
+            self._meta_dirty = True
+        return codes[value]
+
+    def append(self, row: tuple):
+        with self._lock:
+            self._buffer.append(row)
+            if len(self._buffer) >= self.flush_every:
+                self._flush_locked()
+
+    def extend(self, rows: List[tuple]):
+        with self._lock:
+            self._buffer.extend(rows)
+            self._flush_locked()
+
+    def _write_meta(self):
+        meta = {"dtype": self.dtype.descr, "categories": self.categories}
+        tmp_path = self.path + ".json.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(meta, f)
+        os.replace(tmp_path, self.path + ".json")
+        self._meta_dirty = False
+
+    def _flush_locked(self):
+        if self._buffer:
+            np.array(self._buffer, dtype=self.dtype).tofile(self._file)
+            self.count += len(self._buffer)
+            self._buffer = []
+            self._file.flush()
+        if self._meta_dirty:
+            self._write_meta()
+
+    def flush(self):
+        with self._lock:
+            self._flush_locked()
+
+    def close(self):
+        with self._lock:
+            self._flush_locked()
+            self._file.close()
+
+def open_columnar(path: str):
+    """
+    Memory-map a columnar file written by ColumnarWriter.
+    Returns (records, meta); a torn record at the end (crash mid-write) is ignored.
+    """
+    with open(path + ".json", "r") as f:
+        meta = json.load(f)
+    dtype = np.dtype([tuple(field) for field in meta["dtype"]])
+    count = os.path.getsize(path) // dtype.itemsize
+    if count == 0:
+        return np.zeros(0, dtype=dtype), meta
+    return np.memmap(path, dtype=dtype, mode="r", shape=(count,)), meta
+
+class ResultSink(ColumnarWriter):
+    """Streams task completion records into <exp_dir>/<algo>_results.bin as they finish."""
+
+    def __init__(self, exp_dir: str, algo_name: str, vm_names: List[str] = None, flush_every: int = 256):
+        super().__init__(results_path(exp_dir, algo_name), RESULT_DTYPE,
+                         categories={"vm": vm_names or []}, flush_every=flush_every)
+
+    def _row(self, event: Dict) -> tuple:
+        return (event["task_id"], self.code("vm", event["vm"]), event["duration"], event["start"], event["end"],
+                *(event.get(field, _NAN) for field in TIMING_FIELDS))
+
+    def append_event(self, event: Dict):
+        with self._lock:
+            self._buffer.append(self._row(event))
+            if len(self._buffer) >= self.flush_every:
+                self._flush_locked()
+
+    def extend_events(self, events: List[Dict]):
+        with self._lock:
+            self._buffer.extend(self._row(event) for event in events)
+            self._flush_locked()
+
+class StatsSink(ColumnarWriter):
+    """Columnar twin of docker_stats_<algo>.csv."""
+
+    def __init__(self, exp_dir: str, algo_name: str, vm_names: List[str] = None):
+        super().__init__(stats_path(exp_dir, algo_name), STATS_DTYPE,
+                         categories={"container": vm_names or []}, flush_every=4096)
+
+    def append_sample(self, timestamp: float, container: str, cpu_percent: float, mem_usage: str):
+        with self._lock:
+            self._buffer.append((timestamp, self.code("container", container),
+                                 cpu_percent, parse_mem_usage(mem_usage)))
+            if len(self._buffer) >= self.flush_every:
+                self._flush_locked()
+
+def results_path(exp_dir: str, algo_name: str) -> str:
+    return os.path.join(exp_dir, f"{algo_name}_results.bin")
+
+def stats_path(exp_dir: str, algo_name: str) -> str:
+    return os.path.join(exp_dir, f"docker_stats_{algo_name}.bin")
+
+def read_results(exp_dir: str, algo_name: str):
+    """(records, vm_names) for an algorithm's stored results, memory-mapped."""
+    records, meta = open_columnar(results_path(exp_dir, algo_name))
+    return records, meta["categories"]["vm"]
+
+def read_stats(exp_dir: str, algo_name: str):
+    """(records, container_names) for an algorithm's stored container stats, memory-mapped."""
+    records, meta = open_columnar(stats_path(exp_dir, algo_name))
+    return records, meta["categories"]["container"]
+
+def records_to_results(records: np.ndarray, vm_names: List[str]) -> List[Dict]:
+    """Stored records back to the result dicts the plotters and savers take."""
+    phases = [field for field in TIMING_FIELDS if field in (records.dtype.names or ())]
+    return [
+        {"task_id": int(r["task_id"]), "vm": vm_names[r["vm"]], "duration": float(r["duration"]),
+         "start": float(r["start"]), "end": float(r["end"]), **{field: float(r[field]) for field in phases}}
+        for r in records
+    ]
+
+def makespan(records: np.ndarray) -> float:
+    if len(records) == 0:
+        return 0.0
+    return float(records["end"].max() - records["start"].min())
+
+def overhead_summary(records: np.ndarray) -> Dict[str, float]:
+    """
+    Mean of every measured phase plus overhead_percent (share of task wall
+    time not spent computing); {} when no phase was measured.
+    """
+    names = records.dtype.names or ()
+    if len(records) == 0 or "compute_s" not in names:
+        return {}
+    measured = records[~np.isnan(records["compute_s"])]
+    if len(measured) == 0:
+        return {}
+    summary = {f"mean_{field}": float(np.nanmean(measured[field])) if not np.isnan(measured[field]).all()
+               else _NAN for field in TIMING_FIELDS}
+    wall = float((measured["end"] - measured["start"]).sum())
+    summary["overhead_percent"] = 100.0 * (1 - float(measured["compute_s"].sum()) / wall) if wall > 0 else _NAN
+    return summary
@@ -0,0 +1,218 @@
+# utils/task_source.py
+import heapq
+import json
+import os
+import tempfile
+from abc import ABC, abstractmethod
+from typing import Iterator, List, Dict
+
+import numpy as np
+
+# ----------------------------
+# Task sources: the same tasks from a JSON list, an NDJSON stream or a
+# memory-mapped .npy record array, without loading big files into memory.
+# Schedulers iterate them as (task_id, mi, sla) tuples (iter_task_tuples) or
+# as NumPy chunks (iter_task_chunks); task_id is the position in the file.
+# ----------------------------
+
+TASK_TYPES = ("low", "medium", "high")
+# Record layout of .npy task files written by generate_task.py (type indexes TASK_TYPES)
+TASK_DTYPE = np.dtype([
+    ("mi", "<f8"),
+    ("type", "u1"),
+    ("sla", "<f8"),
+    ("priority", "u1"),
+    ("arrival", "<f8"),
+])
+
+# What schedulers need from a task, in chunks
+CHUNK_DTYPE = np.dtype([("task_id", "<i8"), ("mi", "<f8"), ("sla", "<f8")])
+
+DEFAULT_CHUNK = 100_000
+
+class TaskSource(ABC):
+    """
+    Re-iterable task file. Iterating yields task dicts ({"mi", "sla", ...}),
+    so a TaskSource can be passed wherever a list of tasks was accepted.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._len = None
+
+    @abstractmethod
+    def __iter__(self) -> Iterator[Dict]:
+        """Yield the file's tasks in order."""
+
+    def __len__(self) -> int:
+        if self._len is None:
+            self._len = sum(1 for _ in self)
+        return self._len
+
+    def iter_chunks(self, chunk_size: int = DEFAULT_CHUNK) -> Iterator[np.ndarray]:
+        """CHUNK_DTYPE arrays of up to chunk_size tasks."""
+        return _chunks_from_dicts(iter(self), chunk_size)
+
+class JsonTaskSource(TaskSource):
+    """Classic tasks.json: one JSON list, loaded once (small files only)."""
+
+    def __init__(self, path: str):
+        super().__init__(path)
+        with open(path, "r") as f:
+            self.tasks = json.load(f)
+        self._len = len(self.tasks)
+
+    def __iter__(self):
+        return iter(self.tasks)
+
+class NdjsonTaskSource(TaskSource):
+    """One JSON task per line, parsed lazily on every pass."""
+
+    def __iter__(self):
+        with open(self.path, "r", buffering=1 << 20) as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+
+    def __len__(self) -> int:
+        # Same lines as __iter__ (blank ones skipped, last one with or without a newline),
+        # without parsing the JSON
+        if self._len is None:
+            with open(self.path, "rb", buffering=1 << 20) as f:
+                self._len = sum(1 for line in f if line.strip())
+        return self._len
+
+class NpyTaskSource(TaskSource):
+    """Memory-mapped TASK_DTYPE records (or a plain 1-D array of MI values)."""
+
+    def __init__(self, path: str):
+        super().__init__(path)
+        self.records = np.load(path, mmap_mode="r")
+        self._len = len(self.records)
+
+    def __iter__(self):
+        names = self.records.dtype.names or ()
+        for offset in range(0, len(self.records), DEFAULT_CHUNK):
+            part = self.records[offset:offset + DEFAULT_CHUNK]
+            if not names:
+                yield from ({"mi": _number(mi)} for mi in part.tolist())
+                continue
+            columns = [(name, [_number(v) for v in part[name].tolist()] if name in ("mi", "sla") else part[name].tolist())
+                       for name in ("mi", "sla", "priority", "arrival") if name in names]
+            for values in zip(*(col for _, col in columns)):
+                yield dict(zip((name for name, _ in columns), values))
+
+    def iter_chunks(self, chunk_size: int = DEFAULT_CHUNK):
+        names = self.records.dtype.names
+        for offset in range(0, len(self.records), chunk_size):
+            part = self.records[offset:offset + chunk_size]
+            chunk = np.empty(len(part), dtype=CHUNK_DTYPE)
+            chunk["task_id"] = np.arange(offset, offset + len(part))
+            chunk["mi"] = part["mi"] if names else part
+            chunk["sla"] = part["sla"] if names and "sla" in names else np.nan
+            yield chunk
+
+def _number(value: float):
+    """Float from a NumPy chunk back to the int it was in the task file, if integral (like chunk_to_dicts)."""
+    return int(value) if value.is_integer() else value
+
+def _task_tuple(task_id: int, mi: float, sla: float) -> tuple:
+    return task_id, _number(mi), None if sla != sla else _number(sla)
+
+def open_task_source(path: str) -> TaskSource:
+    """TaskSource for a .json list, .ndjson/.jsonl stream or .npy array (by extension)."""
+    ext = os.path.splitext(path)[1].lower()
+    if ext == ".npy":
+        return NpyTaskSource(path)
+    if ext in (".ndjson", ".jsonl"):
+        return NdjsonTaskSource(path)
+    return JsonTaskSource(path)
+
+def _chunks_from_dicts(tasks, chunk_size: int) -> Iterator[np.ndarray]:
+    buffer = []
+    for i, task in enumerate(tasks):
+        if isinstance(task, dict):
+            buffer.append((i, task["mi"], task.get("sla", np.nan)))
+        else:
+            buffer.append((i, task, np.nan))  # plain MI numbers
+        if len(buffer) >= chunk_size:
+            yield np.array(buffer, dtype=CHUNK_DTYPE)
+            buffer = []
+    if buffer:
+        yield np.array(buffer, dtype=CHUNK_DTYPE)
+
+def iter_task_chunks(tasks, chunk_size: int = DEFAULT_CHUNK) -> Iterator[np.ndarray]:
+    """CHUNK_DTYPE chunks from a TaskSource, a list of task dicts or a list of MI numbers."""
+    if isinstance(tasks, TaskSource):
+        return tasks.iter_chunks(chunk_size)
+    return _chunks_from_dicts(tasks, chunk_size)
+
+def iter_task_tuples(tasks) -> Iterator[tuple]:
+    """(task_id, mi, sla) per task, in file order; sla is None when the task has none."""
+    if isinstance(tasks, NpyTaskSource):
+        for chunk in tasks.iter_chunks():
+            for task_id, mi, sla in chunk.tolist():
+                yield _task_tuple(task_id, mi, sla)
+        return
+    for i, task in enumerate(tasks):
+        if isinstance(task, dict):
+            yield i, task["mi"], task.get("sla")
+        else:
+            yield i, task, None
+
+def sorted_task_tuples(tasks, key: str = "mi", reverse: bool = False,
+                       chunk_size: int = 1_000_000, tmp_dir: str = None) -> Iterator[tuple]:
+    """
+    (task_id, mi, sla) tuples ordered by `key` ("mi" or "mi_per_sla"), stable on task_id.
+    Workloads up to chunk_size are sorted in memory; bigger ones are sorted
+    in chunk_size runs spilled to temporary .npy files and k-way merged, so
+    memory stays at about one chunk.
+    """
+    runs = []
+    tmp = None
+    try:
+        for chunk in iter_task_chunks(tasks, chunk_size):
+            if key == "mi_per_sla":
+                with np.errstate(divide="ignore", invalid="ignore"):
+                    sort_key = chunk["mi"] / chunk["sla"]
+                sort_key = np.where(np.isnan(sort_key), np.inf, sort_key)
+            else:
+                sort_key = chunk["mi"]
+            order = np.lexsort((chunk["task_id"], -sort_key if reverse else sort_key))
+            run = chunk[order]
+            if not runs and len(chunk) < chunk_size:
+                runs.append(run)  # everything fit in one chunk: no spilling
+                break
+            if tmp is None:
+                tmp = tempfile.mkdtemp(prefix="task_sort_", dir=tmp_dir)
+            path = os.path.join(tmp, f"run_{len(runs)}.npy")
+            np.save(path, run)
+            runs.append(path)
+
+        if len(runs) == 1 and not isinstance(runs[0], str):
+            for task_id, mi, sla in runs[0].tolist():
+                yield _task_tuple(task_id, mi, sla)
+            return
+
+        def run_iter(path):
+            records = np.load(path, mmap_mode="r")
+            for offset in range(0, len(records), 65536):
+                for task_id, mi, sla in records[offset:offset + 65536].tolist():
+                    if key == "mi_per_sla":
+                        k = mi / sla if sla == sla and sla else float("inf")
+                    else:
+                        k = mi
+                    yield (-k if reverse else k), task_id, mi, sla
+
+        for _, task_id, mi, sla in heapq.merge(*(run_iter(p) for p in runs)):
+            yield _task_tuple(task_id, mi, sla)
+    finally:
+        if tmp is not None:
+            for name in os.listdir(tmp):
+                os.remove(os.path.join(tmp, name))
+            os.rmdir(tmp)
+
+def task_mi_array(tasks) -> np.ndarray:
+    """MI of every task, in file order, as one float64 array."""
+    chunks = [chunk["mi"] for chunk in iter_task_chunks(tasks)]
+    return np.concatenate(chunks) if chunks else np.zeros(0)
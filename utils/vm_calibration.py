@@ -0,0 +1,104 @@
+# utils/vm_calibration.py
+import json
+import os
+import socket
+import statistics
+import subprocess
+import time
+from typing import List, Dict
+
+CALIBRATION_CACHE = "./storage/vms/calibration_cache.json"
+DEFAULT_PROBE_MI = 2000     # ~2M loop iterations: long enough to dwarf timer noise
+DEFAULT_RUNS = 5
+DEFAULT_MAX_AGE = 7 * 24 * 3600  # seconds before a cached measurement is considered stale
+
+def _timed_exec(vm: str, task_mi: float) -> float:
+    start = time.perf_counter()
+    subprocess.run(["docker", "exec", vm, "python3", "/task_runner.py", str(task_mi)],
+                   capture_output=True, text=True, check=True)
+    return time.perf_counter() - start
+
+def container_key(vm: str) -> str:
+    """Cache key for a container: host, image and CPU quota."""
+    from utils.vm_capacity import docker_vm_cpus
+    image = subprocess.run(["docker", "inspect", "--format", "{{.Config.Image}}", vm],
+                           capture_output=True, text=True, check=True).stdout.strip()
+    cpus = docker_vm_cpus([vm])[vm]
+    return f"{socket.gethostname()}|{image}|{cpus:g}"
+
+def measure_vm(vm: str, probe_mi: float = DEFAULT_PROBE_MI, runs: int = DEFAULT_RUNS) -> Dict:
+    """
+    Effective MI/s of one container.
+    Empty (0 MI) runs measure the docker exec + interpreter overhead, which is
+    subtracted from each probe run before converting it to MI/s.
+    """
+    overhead = statistics.mean(_timed_exec(vm, 0) for _ in range(runs))
+    rates = []
+    for _ in range(runs):
+        compute = max(_timed_exec(vm, probe_mi) - overhead, 1e-6)
+        rates.append(probe_mi / compute)
+    return {
+        "mips": statistics.mean(rates),
+        "mips_stdev": statistics.stdev(rates) if len(rates) > 1 else 0.0,
+        "overhead_s": overhead,
+        "probe_mi": probe_mi,
+        "runs": runs,
+        "timestamp": time.time(),
+    }
+
+def load_cache(path: str = CALIBRATION_CACHE) -> Dict:
+    if not os.path.exists(path):
+        return {}
+    with open(path, "r") as f:
+        return json.load(f)
+
+def save_cache(cache: Dict, path: str = CALIBRATION_CACHE):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(cache, f, indent=2)
+    os.replace(tmp_path, path)
+
+def calibrate(vm_names: List[str], probe_mi: float = DEFAULT_PROBE_MI, runs: int = DEFAULT_RUNS,
+              max_age: float = DEFAULT_MAX_AGE, force: bool = False,
+              cache_path: str = CALIBRATION_CACHE, logger=None) -> Dict[str, Dict]:
+    """
+    Calibration entry per VM, re-measuring only containers whose cache entry
+    (same host, image and CPU quota) is missing, older than `max_age` or `force`d.
+    """
+    cache = load_cache(cache_path)
+    results = {}
+    for vm in vm_names:
+        key = container_key(vm)
+        entry = cache.get(key)
+        if force or entry is None or time.time() - entry["timestamp"] > max_age:
+            subprocess.run(["docker", "cp", "task_runner.py", f"{vm}:/task_runner.py"], check=True)
+            entry = measure_vm(vm, probe_mi, runs)
+            cache[key] = entry
+            save_cache(cache, cache_path)
+            msg = f"[CALIBRATION] {vm} ({key}): {entry['mips']:.1f} ± {entry['mips_stdev']:.1f} MI/s, overhead {entry['overhead_s']:.3f}s"
+        else:
+            msg = f"[CALIBRATION] {vm} ({key}): cached {entry['mips']:.1f} ± {entry['mips_stdev']:.1f} MI/s"
+        if logger:
+            logger.log(msg)
+        else:
+            print(msg)
+        results[vm] = dict(entry, key=key)
+    return results
+
+def calibrated_vm_mips(vm_names: List[str], max_age: float = DEFAULT_MAX_AGE, logger=None) -> Dict[str, float]:
+    """Measured MIPS per VM, recalibrating stale or missing cache entries first."""
+    return {vm: entry["mips"] for vm, entry in calibrate(vm_names, max_age=max_age, logger=logger).items()}
+
+def calibrated_overheads(vm_names: List[str], cache_path: str = CALIBRATION_CACHE) -> Dict[str, float]:
+    """Cached 0-MI docker exec overhead per VM (VMs never calibrated, or not inspectable, are left out)."""
+    cache = load_cache(cache_path)
+    overheads = {}
+    for vm in (vm_names if cache else []):
+        try:
+            entry = cache.get(container_key(vm))
+        except (OSError, subprocess.CalledProcessError, KeyError):
+            continue
+        if entry is not None:
+            overheads[vm] = entry["overhead_s"]
+    return overheads
@@ -0,0 +1,126 @@
+# utils/vm_capacity.py
+import json
+import os
+import subprocess
+from typing import List, Dict
+
+# Linear map used since the first experiments: 0.5 CPU → 500 MIPS, 1.0 CPU → 1000 MIPS
+MIPS_PER_CPU = 1000
+
+CAPACITY_SOURCES = ("env", "docker", "calibration", "learned")
+
+_CACHE = {}
+
+class VMCapacity:
+    """
+    Resolved VM capacity for one experiment: VM names, CPU limits and MIPS.
+    Every scheduler receives `vm_mips` from here instead of keeping its own table.
+    """
+
+    def __init__(self, vm_cpus: Dict[str, float], vm_mips: Dict[str, float], source: str):
+        self.vm_names = list(vm_mips.keys())
+        self.vm_cpus = vm_cpus
+        self.vm_mips = vm_mips
+        self.source = source
+
+    def to_dict(self) -> Dict:
+        return {"source": self.source, "vm_cpus": self.vm_cpus, "vm_mips": self.vm_mips}
+
+def cpus_to_mips(cpus: float) -> float:
+    return cpus * MIPS_PER_CPU
+
+def env_vm_cpus() -> Dict[str, float]:
+    """CPU limits from VM1_CPUS, VM2_CPUS, ... (stops at the first missing index)."""
+    from dotenv import load_dotenv
+    load_dotenv()
+    vm_cpus = {}
+    i = 1
+    while os.getenv(f"VM{i}_CPUS") is not None:
+        vm_cpus[f"vm{i}"] = float(os.getenv(f"VM{i}_CPUS"))
+        i += 1
+    if not vm_cpus:
+        raise ValueError("No VM{i}_CPUS entries found in the environment/.env")
+    return vm_cpus
+
+def docker_vm_cpus(vm_names: List[str]) -> Dict[str, float]:
+    """CPU limits read back from the running containers (NanoCpus, else CpuQuota/CpuPeriod)."""
+    result = subprocess.run(
+        ["docker", "inspect", "--format",
+         "{{.Name}} {{.HostConfig.NanoCpus}} {{.HostConfig.CpuQuota}} {{.HostConfig.CpuPeriod}}", *vm_names],
+        capture_output=True, text=True, check=True
+    )
+    vm_cpus = {}
+    for line in result.stdout.strip().splitlines():
+        name, nano, quota, period = line.split()
+        name = name.lstrip("/")
+        if int(nano) > 0:
+            vm_cpus[name] = int(nano) / 1e9
+        elif int(quota) > 0:
+            vm_cpus[name] = int(quota) / (int(period) or 100000)
+        else:
+            vm_cpus[name] = float(os.cpu_count() or 1)  # no limit → whole host
+    return {vm: vm_cpus[vm] for vm in vm_names}
+
+def load_calibration_file(path: str) -> Dict[str, float]:
+    """MIPS per VM from a calibration JSON ({"vm_mips": {...}} or a flat {vm: mips} map)."""
+    with open(path, "r") as f:
+        data = json.load(f)
+    vm_mips = data.get("vm_mips", data)
+    return {vm: float(mips) for vm, mips in vm_mips.items()}
+
+def resolve_vm_capacity(source: str = "env", vm_names: List[str] = None, calibration_file: str = None) -> VMCapacity:
+    """
+    Resolve VM capacity once and cache it for the rest of the process.
+    - env: VM{i}_CPUS from .env → MIPS via MIPS_PER_CPU (any number of VMs)
+    - docker: CPU limits from `docker inspect` on vm_names (default: the .env VMs)
+    - calibration: measured MIPS from `calibration_file`, or from the
+      calibration cache in storage/vms/ (recalibrating stale entries)
+    - learned: speeds learned from earlier runs' completions
+      (utils/capacity_estimator.py), .env MIPS for VMs never observed
+    """
+    if source not in CAPACITY_SOURCES:
+        raise ValueError(f"Unknown capacity source '{source}' (expected one of {CAPACITY_SOURCES})")
+    key = (source, tuple(vm_names) if vm_names else None, calibration_file)
+    if key in _CACHE:
+        return _CACHE[key]
+
+    if source == "calibration":
+        if calibration_file:
+            vm_mips = load_calibration_file(calibration_file)
+            if vm_names:
+                vm_mips = {vm: vm_mips[vm] for vm in vm_names}
+        else:
+            # Measured speeds from storage/vms/, re-measured when stale
+            from utils.vm_calibration import calibrated_vm_mips
+            vm_mips = calibrated_vm_mips(vm_names or list(env_vm_cpus().keys()))
+        vm_cpus = {vm: mips / MIPS_PER_CPU for vm, mips in vm_mips.items()}
+    elif source == "learned":
+        from utils.capacity_estimator import get_estimator
+        vm_cpus = env_vm_cpus()
+        if vm_names:
+            vm_cpus = {vm: vm_cpus[vm] for vm in vm_names}
+        vm_mips = get_estimator().vm_mips(list(vm_cpus), {vm: cpus_to_mips(c) for vm, c in vm_cpus.items()})
+    else:
+        if source == "docker":
+            vm_cpus = docker_vm_cpus(vm_names or list(env_vm_cpus().keys()))
+        else:
+            vm_cpus = env_vm_cpus()
+            if vm_names:
+                vm_cpus = {vm: vm_cpus[vm] for vm in vm_names}
+        vm_mips = {vm: cpus_to_mips(cpus) for vm, cpus in vm_cpus.items()}
+
+    capacity = VMCapacity(vm_cpus, vm_mips, source)
+    _CACHE[key] = capacity
+    return capacity
+
+def get_vm_mips(vm_names: List[str], vm_mips: Dict[str, float] = None) -> Dict[str, float]:
+    """
+    `vm_mips` if a scheduler was given one, else the cached .env capacity.
+    Lets schedulers be called standalone without their own MIPS tables.
+    """
+    if vm_mips is None:
+        vm_mips = resolve_vm_capacity("env").vm_mips
+    missing = [vm for vm in vm_names if vm not in vm_mips]
+    if missing:
+        raise ValueError(f"No MIPS known for VM(s): {', '.join(missing)}")
+    return vm_mips
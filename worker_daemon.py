@@ -0,0 +1,56 @@
+# worker_daemon.py
+"""
+Long-lived task worker, started once per container execution slot:
+
+    docker exec -i <vm> python3 -u /worker_daemon.py
+
+Reads one JSON request per line on stdin ({"task_id": 3, "mi": 120.5}),
+runs the task_runner.py workload in-process and writes one JSON completion
+record per line on stdout (with "received", "compute_start", "compute_end"
+and "cpu_time" timings). Exits on EOF or {"cmd": "stop"}.
+"""
+import json
+import sys
+import time
+
+from task_runner import measure_workload
+
+def handle(request: dict, received: float = None) -> dict:
+    task_id = request.get("task_id")
+    try:
+        task_mi = float(request["mi"])
+    except (KeyError, TypeError, ValueError):
+        return {"task_id": task_id, "ok": False, "stdout": "",
+                "stderr": f"Error: invalid request {request!r}"}
+
+    timings = measure_workload(task_mi)
+    elapsed = timings["compute_end"] - timings["compute_start"]
+    return {
+        "task_id": task_id,
+        "ok": True,
+        "mi": task_mi,
+        "received": received,
+        **timings,
+        "stdout": f"[Task] Completed {task_mi:.1f} MI in {elapsed:.2f} seconds.",
+        "stderr": "",
+    }
+
+def main():
+    for line in sys.stdin:
+        received = time.time()
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            request = json.loads(line)
+        except json.JSONDecodeError:
+            reply = {"task_id": None, "ok": False, "stdout": "", "stderr": f"Error: bad JSON {line!r}"}
+        else:
+            if request.get("cmd") == "stop":
+                break
+            reply = handle(request, received)
+        sys.stdout.write(json.dumps(reply) + "\n")
+        sys.stdout.flush()
+
+if __name__ == "__main__":
+    main()